@@ -0,0 +1,2 @@
+# Keeps the repository root importable for the Python tests (e.g. `tools.*`,
+# `interpreters.blender.runtime.python.*`), mirroring what run_blender.py does.
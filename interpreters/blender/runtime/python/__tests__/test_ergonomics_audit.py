@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import copy
+import json
+import os
+import random
+
+from interpreters.blender.runtime.python.ergonomics_audit import audit_inputs, load_adapter_inputs, measure_input
+from interpreters.blender.runtime.python.plan_export import realise_plan
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), *([".."] * 5)))
+
+
+def _input(archetype: str) -> dict:
+    with open(os.path.join(REPO_ROOT, f"{archetype}_input.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _scaled(values: dict, rng: random.Random) -> None:
+    for key, value in values.items():
+        if isinstance(value, dict):
+            _scaled(value, rng)
+        else:
+            values[key] = value * rng.uniform(0.5, 1.6)
+
+
+def test_closed_form_matches_the_planned_geometry() -> None:
+    rng = random.Random(7)
+    inputs = []
+    for index in range(300):
+        adapter_input = copy.deepcopy(_input(("chair", "table", "bed")[index % 3]))
+        adapter_input["assetId"] += f"_{index}"
+        _scaled(adapter_input["physical"], rng)
+        inputs.append((str(index), adapter_input))
+
+    report = audit_inputs(inputs)
+
+    assert report["summary"]["closedForm"] == 300
+    for (_, adapter_input), asset in zip(inputs, report["assets"]):
+        declared, before, after = measure_input(adapter_input)
+        assert [metric["metric"] for metric in asset["metrics"]] == list(declared)
+        for metric in asset["metrics"]:
+            assert metric["before"] == round(before[metric["metric"]], 6)
+            assert metric["after"] == round(after[metric["metric"]], 6)
+
+
+def test_chair_audit_agrees_with_the_realiser_report() -> None:
+    _, realised = realise_plan(_input("chair"))
+    report = audit_inputs([("chair", _input("chair")), ("table", _input("table"))])
+    chair, table = report["assets"]
+
+    assert chair["ok"] == realised["ok"]
+    assert chair["metrics"] == realised["metrics"]
+    # The table top sits its thickness above the declared surfaceHeight.
+    surface = next(metric for metric in table["metrics"] if metric["metric"] == "surfaceHeight")
+    assert not surface["ok"] and abs(surface["delta"] - 0.03904) < 1e-9
+    # clearanceHeight is a minimum knee clearance; the free height above it passes.
+    clearance = next(metric for metric in table["metrics"] if metric["metric"] == "clearanceHeight")
+    assert clearance["ok"] and clearance["delta"] > 0.02
+
+
+def test_directories_and_jsonl_are_loaded_and_odd_entries_reported(tmp_path) -> None:
+    extra_part = _input("chair")
+    extra_part["parts"]["arm"] = {"kind": "arm"}
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "bed.json").write_text(json.dumps(_input("bed")))
+    (tmp_path / "scene.json").write_text(json.dumps({"sceneId": "hall", "placements": []}))
+    (tmp_path / "catalogue.jsonl").write_text(
+        "\n".join(json.dumps(item) for item in (_input("table"), extra_part, {**_input("bed"), "archetype": "sofa"}))
+    )
+
+    report = audit_inputs(load_adapter_inputs([str(tmp_path)]))
+
+    assert [asset["assetId"] for asset in report["assets"]] == [
+        "assets.furniture.table_simple",
+        "assets.furniture.chair_simple",
+        "assets.furniture.bed_simple",
+    ]
+    assert report["summary"]["closedForm"] == 2 and report["summary"]["planned"] == 1
+    assert sorted(item["reason"] for item in report["skipped"]) == [
+        "not an adapter input",
+        "unsupported archetype: sofa",
+    ]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+
+import numpy as np
+import pytest
+
+from interpreters.blender.runtime.python.lod_chain import LodLevel, build_lod_chain, build_lod_gltf
+from interpreters.blender.runtime.python.plan_export import export_realisation, realise_plan
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), *([".."] * 5)))
+
+
+def _input(archetype: str) -> dict:
+    with open(os.path.join(REPO_ROOT, f"{archetype}_input.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _volume(positions: np.ndarray, triangles: np.ndarray) -> float:
+    a, b, c = (positions[triangles[:, corner]] for corner in range(3))
+    return float(np.einsum("ij,ij->i", a, np.cross(b, c)).sum() / 6)
+
+
+@pytest.mark.parametrize("archetype", ["chair", "table", "bed"])
+def test_tiers_step_down_to_the_bounds_and_keep_the_asset_extent(archetype: str) -> None:
+    plan, _ = realise_plan(_input(archetype))
+    boxes = build_lod_chain(plan, "basic")
+    low, high = boxes[0].positions.min(axis=0), boxes[0].positions.max(axis=0)
+
+    for tier, forms in (
+        ("carved", ["carved", "profiled", "boxes", "parts", "bounds"]),
+        ("profiled", ["profiled", "boxes", "parts", "bounds"]),
+        ("basic", ["boxes", "parts", "bounds"]),
+    ):
+        levels = build_lod_chain(plan, tier)
+        assert [level.form for level in levels] == forms
+        vertices = [len(level.positions) for level in levels]
+        assert vertices == sorted(vertices, reverse=True) and vertices[-1] == 8
+        assert all(len(level.positions) <= level.vertex_budget for level in levels)
+        distances = [level.switch_distance for level in levels]
+        assert distances[0] == 0.0 and distances == sorted(set(distances))
+        for level in levels:
+            assert np.allclose(level.positions.min(axis=0), low) and np.allclose(level.positions.max(axis=0), high)
+        # Closed, outward-wound surfaces: shaped parts lose volume, merged boxes gain it.
+        volumes = {level.form: _volume(level.positions, level.triangles) for level in levels}
+        assert all(0 < volumes[form] < volumes["boxes"] for form in ("carved", "profiled") if form in volumes)
+        assert volumes["boxes"] < volumes["parts"] <= volumes["bounds"]
+
+
+def test_forms_over_budget_give_way_and_unknown_tiers_fail() -> None:
+    plan, _ = realise_plan(_input("chair"))
+    levels = build_lod_chain(plan, "carved", budgets={"carved": 100})
+    assert [(level.form, level.vertex_budget) for level in levels][:2] == [("profiled", 100), ("boxes", 1024)]
+    with pytest.raises(ValueError):
+        build_lod_chain(plan, "ornate")
+
+
+def test_export_writes_the_chain_as_msft_lod(tmp_path) -> None:
+    adapter_input = {**_input("table"), "detailTier": "profiled"}
+    result = export_realisation(adapter_input, str(tmp_path / "table.glb"), lods=True)
+
+    lods = result["lods"]
+    assert lods["output"] == str(tmp_path / "table.glb.lod.glb") and lods["detailTier"] == "profiled"
+    with open(lods["output"], "rb") as handle:
+        handle.read(12)
+        length, _ = struct.unpack("<II", handle.read(8))
+        document = json.loads(handle.read(length))
+    root = document["nodes"][0]
+    assert document["scenes"][0]["nodes"] == [0] and root["extensions"]["MSFT_lod"]["ids"] == [1, 2, 3]
+    assert root["extras"]["MSFT_screencoverage"] == [level["screenSize"] for level in lods["levels"]]
+    assert [node["name"] for node in document["nodes"]] == [f"assets.furniture.table_simple::lod{index}" for index in range(4)]
+
+
+def test_levels_over_uint16_vertices_get_uint32_indices() -> None:
+    vertices = 0x10000 + 2
+    triangles = np.array([[0, 1, vertices - 1]], dtype=np.int64)
+    levels = [
+        LodLevel(0, "carved", vertices, 0.5, 1.0, np.zeros((vertices, 3)), triangles),
+        LodLevel(1, "bounds", 8, 0.0, 2.0, np.zeros((3, 3)), np.array([[0, 1, 2]], dtype=np.int64)),
+    ]
+
+    document, buffer = build_lod_gltf("asset", levels)
+
+    wide, narrow = document["accessors"][1], document["accessors"][3]
+    assert (wide["componentType"], narrow["componentType"]) == (5125, 5123)
+    view = document["bufferViews"][wide["bufferView"]]
+    data = buffer[view["byteOffset"] : view["byteOffset"] + view["byteLength"]]
+    assert np.frombuffer(data, dtype="<u4").tolist() == [0, 1, vertices - 1]
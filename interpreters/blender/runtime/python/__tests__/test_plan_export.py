@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+
+from interpreters.blender.runtime.python.plan_export import export_realisation, realise_plan
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), *([".."] * 5)))
+
+
+def _input(archetype: str) -> dict:
+    with open(os.path.join(REPO_ROOT, f"{archetype}_input.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def test_chair_export_applies_the_ergonomic_corrections() -> None:
+    plan, report = realise_plan(_input("chair"))
+    world = dict(zip(plan.names, plan.world_transforms()))
+    seat_location, seat_scale = world["assets.furniture.chair_simple::seat::0"]
+
+    assert report is not None
+    assert abs(seat_location[2] + seat_scale[2] / 2 - 0.437) < 1e-9
+    ok = {metric["metric"]: metric["ok"] for metric in report["metrics"]}
+    # The legs splay only as far as the seat edge, short of the declared footprint.
+    assert ok == {"seatHeight": True, "totalHeight": True, "footprint.width": False, "footprint.depth": False}
+
+
+def test_table_and_bed_exports_report_their_measurements() -> None:
+    for archetype in ("table", "bed"):
+        plan, report = realise_plan(_input(archetype))
+
+        assert report is not None
+        assert report["archetype"] == archetype
+        assert report["assetId"] == plan.assetId
+        assert report["metrics"]
+        assert "applied" not in report
+
+
+def test_glb_holds_one_node_per_object_and_a_shared_cube(tmp_path) -> None:
+    output = str(tmp_path / "table.glb")
+    result = export_realisation(_input("table"), output)
+
+    with open(output, "rb") as handle:
+        data = handle.read()
+    magic, version, length = struct.unpack("<III", data[:12])
+    json_length, _ = struct.unpack("<II", data[12:20])
+    document = json.loads(data[20 : 20 + json_length])
+
+    assert (magic, version, length) == (0x46546C67, 2, len(data))
+    assert len(document["nodes"]) == result["objectCount"] == 7
+    assert [mesh["name"] for mesh in document["meshes"]] == ["__unit_cube__"]
+    assert document["scenes"][0]["name"] == "assets.furniture.table_simple"
+
+
+def test_obj_writes_world_space_cubes_for_part_objects(tmp_path) -> None:
+    output = str(tmp_path / "bed.obj")
+    export_realisation(_input("bed"), output)
+
+    with open(output, "r", encoding="utf-8") as handle:
+        lines = handle.read().splitlines()
+    objects = [line[2:] for line in lines if line.startswith("o ")]
+    assert objects and all("::ANCHOR" not in name for name in objects)
+    assert sum(line.startswith("v ") for line in lines) == 8 * len(objects)
+    assert sum(line.startswith("f ") for line in lines) == 6 * len(objects)
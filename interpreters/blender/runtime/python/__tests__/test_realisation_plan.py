@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+import os
+
+from interpreters.blender.runtime.python.realisation_plan import (
+    KIND_CUBE,
+    KIND_EMPTY,
+    RealisationPlan,
+    plan_realisation,
+)
+from tools.plan_realisation import diff_plans
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), *([".."] * 5)))
+
+
+def _input(archetype: str) -> dict:
+    with open(os.path.join(REPO_ROOT, f"{archetype}_input.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def test_chair_plan_places_parts_under_anchors() -> None:
+    plan = plan_realisation(_input("chair"))
+    index = {name: position for position, name in enumerate(plan.names)}
+    seat = index["assets.furniture.chair_simple::seat::0"]
+    leg = index["assets.furniture.chair_simple::supports::0"]
+
+    assert len(plan) == 9
+    assert plan.kinds[index["assets.furniture.chair_simple::seat::ANCHOR"]] == KIND_EMPTY
+    assert plan.kinds[seat] == KIND_CUBE
+    assert plan.names[plan.parents[seat]] == "assets.furniture.chair_simple::seat::ANCHOR"
+    assert plan.scale(seat) == (0.55, 0.45, 0.55 * 0.08)
+    assert plan.location(seat)[2] == 0.437 + (0.55 * 0.08) / 2
+    assert plan.location(leg)[:2] == (-0.275 + 0.02 + 0.55 * 0.015, -0.225 + 0.02 + 0.55 * 0.015)
+
+
+def test_bed_plan_adds_unparented_headboard_above_sleeping_height() -> None:
+    bed = _input("bed")
+    assert "::HEADBOARD" not in "".join(plan_realisation(bed).names)
+
+    bed["physical"]["totalHeight"] = 1.0
+    plan = plan_realisation(bed)
+    headboard = plan.names.index("assets.furniture.bed_simple::frame::HEADBOARD")
+    assert plan.parents[headboard] == -1
+    assert plan.kinds[headboard] == KIND_CUBE
+
+
+def test_plans_round_trip_and_diff() -> None:
+    table = _input("table")
+    plan = plan_realisation(table)
+    restored = RealisationPlan.from_dict(json.loads(plan.to_json()))
+    assert restored.to_json() == plan.to_json()
+    assert restored.fingerprint() == plan.fingerprint()
+    assert diff_plans(plan, restored) == []
+
+    table["physical"]["surfaceHeight"] += 0.05
+    changed = diff_plans(plan, plan_realisation(table))
+    assert changed and all(line.startswith("~ ") for line in changed)
+
+
+def test_part_ranges_group_consecutive_part_objects() -> None:
+    plan = plan_realisation(_input("chair"))
+    ranges = plan.part_ranges()
+
+    assert [part_id for part_id, _, _ in ranges] == ["back", "seat", "supports"]
+    assert ranges[-1][2] == len(plan)
+    assert all(previous[2] == current[1] for previous, current in zip(ranges, ranges[1:]))
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from interpreters.blender.runtime.python.scene_plan import plan_scene
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), *([".."] * 5)))
+
+
+def test_distinct_inputs_sharing_an_asset_id_get_suffixed(tmp_path) -> None:
+    with open(os.path.join(REPO_ROOT, "chair_input.json"), "r", encoding="utf-8") as handle:
+        chair = json.load(handle)
+    taller = {**chair, "physical": {**chair.get("physical", {}), "seatHeight": 0.5}}
+    scene = plan_scene(
+        {
+            "sceneId": "cafe",
+            "placements": [
+                {"id": "a", "adapterInput": chair},
+                {"id": "b", "adapterInput": dict(chair)},
+                {"id": "c", "adapterInput": taller},
+            ],
+        }
+    )
+
+    assert list(scene.instance_counts().values()) == [2, 1]
+    assert list(scene.source_asset_ids().values()) == [chair["assetId"], f"{chair['assetId']}~2"]
+
+
+def test_placements_need_an_asset_reference() -> None:
+    with pytest.raises(ValueError, match="needs a 'source'"):
+        plan_scene({"sceneId": "cafe", "placements": [{"id": "a", "location": [0, 0, 0]}]})
+
+
+def test_grid_chunks_split_placements_by_cell() -> None:
+    from interpreters.blender.runtime.python.scene_plan import split_chunks
+
+    with open(os.path.join(REPO_ROOT, "chair_input.json"), "r", encoding="utf-8") as handle:
+        chair = json.load(handle)
+    scene = plan_scene(
+        {
+            "sceneId": "map",
+            "placements": [
+                {"id": "a", "adapterInput": chair, "location": [1, 1, 0]},
+                {"id": "b", "adapterInput": chair, "location": [-1, 25, 0]},
+                {"id": "c", "adapterInput": chair, "location": [19, 19, 0]},
+            ],
+        }
+    )
+
+    chunks = split_chunks(scene, "grid", 20.0)
+
+    assert {identifier: [p.id for p in chunk.placements] for identifier, chunk in chunks.items()} == {
+        "grid_0_0": ["a", "c"],
+        "grid_-1_1": ["b"],
+    }
+    assert chunks["grid_-1_1"].sceneId == "map::grid_-1_1"
+    assert chunks["grid_0_0"].fingerprint() != chunks["grid_-1_1"].fingerprint()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+
+import numpy as np
+import pytest
+
+from interpreters.blender.runtime.python.plan_export import realise_plan
+from interpreters.blender.runtime.python.scene_plan import plan_scene
+from interpreters.blender.runtime.python.static_batching import (
+    DEFAULT_MATERIAL,
+    batch_scene,
+    write_batched_scene,
+)
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), *([".."] * 5)))
+
+
+def _input(archetype: str) -> dict:
+    with open(os.path.join(REPO_ROOT, f"{archetype}_input.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _scene(placements: list) -> dict:
+    table = _input("table")
+    table["parts"]["surface"]["material"] = "oak"
+    return {"sceneId": "hall", "sources": {"chair": _input("chair"), "table": table}, "placements": placements}
+
+
+def test_batches_split_by_material_cell_and_vertex_limit() -> None:
+    placements = [{"id": f"c{index}", "source": "chair", "location": [index * 3.0, 0, 0]} for index in range(12)]
+    placements.append({"id": "t0", "source": "table", "location": [1.0, 1.0, 0]})
+    batches = batch_scene(plan_scene(_scene(placements)), vertex_limit=24 * 20, cell_size=20.0)
+
+    chair_objects = 12 * sum(1 for name in realise_plan(_input("chair"))[0].names if "ANCHOR" not in name)
+    assert sum(len(batch.objects) for batch in batches) == chair_objects + 5
+    assert all(len(batch.positions) <= 24 * 20 for batch in batches)
+    assert all(int(batch.triangles.max()) < len(batch.positions) for batch in batches)
+    assert {(batch.material, batch.cell) for batch in batches} == {
+        (DEFAULT_MATERIAL, (0, 0)),
+        (DEFAULT_MATERIAL, (1, 0)),
+        ("oak", (0, 0)),
+    }
+    oak = next(batch for batch in batches if batch.material == "oak")
+    assert oak.objects == ["assets.furniture.table_simple::surface::0"] and oak.placements == ["t0"]
+    with pytest.raises(ValueError):
+        batch_scene(plan_scene(_scene(placements)), vertex_limit=10)
+
+
+def test_lookup_ranges_hold_each_object_in_world_space(tmp_path) -> None:
+    placement = {"id": "turned", "source": "chair", "location": [5.0, -2.0, 0.5], "rotation": 90, "scale": 2.0}
+    scene = plan_scene(_scene([placement]))
+    (batch,) = batch_scene(scene)
+
+    plan, _ = realise_plan(_input("chair"))
+    world = dict(zip(plan.names, plan.world_transforms()))
+    for index, name in enumerate(batch.objects):
+        vertices = batch.positions[batch.first_vertex[index] : batch.first_vertex[index + 1]]
+        (x, y, z), scale = world[name]
+        # 90 degrees about Z maps (x, y) to (-y, x); uniform scale 2 doubles everything.
+        centre = np.array([5.0 - 2 * y, -2.0 + 2 * x, 0.5 + 2 * z])
+        half = np.abs(np.array([scale[1], scale[0], scale[2]]))
+        assert np.allclose(vertices.min(axis=0), centre - half) and np.allclose(vertices.max(axis=0), centre + half)
+
+    result = write_batched_scene(scene, str(tmp_path / "hall.glb"))
+    with open(result["output"], "rb") as handle:
+        magic, version, total = struct.unpack("<III", handle.read(12))
+        length, _ = struct.unpack("<II", handle.read(8))
+        document = json.loads(handle.read(length))
+    assert (magic, version, total) == (0x46546C67, 2, os.path.getsize(result["output"]))
+    assert [mesh["name"] for mesh in document["meshes"]] == [batch.name]
+    with open(result["lookup"], "r", encoding="utf-8") as handle:
+        lookup = json.load(handle)
+    assert lookup["batches"][0]["objects"] == batch.objects
+    assert lookup["batches"][0]["firstVertex"][-1] == result["vertices"] == len(batch.positions)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import json
+
+from interpreters.blender.runtime.python import tracing
+
+
+def test_spans_are_free_and_unrecorded_while_disabled(tmp_path) -> None:
+    tracing.disable()
+    with tracing.span("realise"):
+        pass
+    assert tracing.span("save") is tracing.span("load_input")
+    assert tracing.write_trace(str(tmp_path / "out.trace.json")) is None
+
+
+def test_enabled_spans_write_chrome_trace_events(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv(tracing.LAUNCHED_AT_ENV, "1000.0")
+    tracing.enable()
+    try:
+        tracing.record_launch()
+        with tracing.span("realise", assetId="chair"):
+            with tracing.span("part", part="seat"):
+                pass
+        path = tracing.write_trace(tracing.trace_path_for(str(tmp_path / "chair.blend")))
+    finally:
+        tracing.disable()
+
+    with open(path, "r", encoding="utf-8") as handle:
+        events = json.load(handle)["traceEvents"]
+    assert path.endswith("chair.blend.trace.json")
+    assert [event["name"] for event in events] == ["blender.startup", "part", "realise"]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[0]["ts"] == 1000.0 * 1_000_000
+    realise, part = events[2], events[1]
+    assert realise["args"] == {"assetId": "chair"}
+    assert realise["ts"] <= part["ts"] and part["ts"] + part["dur"] <= realise["ts"] + realise["dur"]
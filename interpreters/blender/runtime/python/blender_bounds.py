@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import bpy  # type: ignore
+    from mathutils import Vector  # type: ignore
+except Exception as exc:  # pragma: no cover - only valid inside Blender
+    bpy = None  # type: ignore
+    Vector = None  # type: ignore
+    _BLENDER_IMPORT_ERROR = exc
+else:
+    _BLENDER_IMPORT_ERROR = None
+
+Bounds = Tuple[float, float, float, float, float, float]
+
+UNIT_CUBE_NAME = "__unit_cube__"
+# Merged-geometry meshes (blender_merged_mesh) keep per-vertex object identity
+# in this attribute, indexing the JSON list of names in this mesh property.
+OBJECT_ATTRIBUTE = "object_index"
+OBJECT_NAMES_PROP = "object_names"
+# Cached part-shape meshes (blender_mesh_cache) carry their cache key here;
+# like `__unit_cube__`, they exactly fill the cube from -0.5 to 0.5.
+SHAPE_KEY_PROP = "shape_key"
+EULER_ROTATION_MODES = {"XYZ", "XZY", "YXZ", "YZX", "ZXY", "ZYX"}
+
+
+@dataclass(frozen=True)
+class BoundsIndex:
+    """World-space bounds of a set of objects: overall, per part id and per object name."""
+
+    bounds: Optional[Bounds]
+    parts: Mapping[str, Bounds]
+    objects: Mapping[str, Bounds]
+    analytic_count: int
+    evaluated_count: int
+
+    def part(self, part_id: str) -> Optional[Bounds]:
+        return self.parts.get(part_id)
+
+
+def object_world_bounds(
+    obj: "bpy.types.Object",
+    depsgraph: Optional["bpy.types.Depsgraph"] = None,
+) -> Optional[Bounds]:
+    """Bounds from the evaluated object; works for any mesh but needs the depsgraph."""
+    if obj.type != "MESH":
+        return None
+    if Vector is None:
+        return None
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    if not eval_obj:
+        return None
+    if not eval_obj.bound_box:
+        return None
+    world_corners = [eval_obj.matrix_world @ Vector(corner) for corner in eval_obj.bound_box]
+    xs = [corner.x for corner in world_corners]
+    ys = [corner.y for corner in world_corners]
+    zs = [corner.z for corner in world_corners]
+    return (min(xs), max(xs), min(ys), max(ys), min(zs), max(zs))
+
+
+def part_id_from_name(name: str) -> Optional[str]:
+    # Realised objects are named `assetId::part::index` (or `::ANCHOR` / `::HEADBOARD`).
+    pieces = name.split("::")
+    if len(pieces) < 3:
+        return None
+    return pieces[-2]
+
+
+def _is_unrotated(obj: "bpy.types.Object") -> bool:
+    return obj.rotation_mode in EULER_ROTATION_MODES and not any(obj.rotation_euler)
+
+
+def _analytic_transform(
+    obj: "bpy.types.Object",
+) -> Optional[Tuple[Tuple[float, float, float], Tuple[float, float, float]]]:
+    """
+    Return (location, scale) in world space for a plain `__unit_cube__` (or a
+    cached part shape, which fills the same cube) whose parent chain only
+    translates and scales, or None if the depsgraph is needed.
+    """
+    if obj.data is None or len(obj.modifiers):
+        return None
+    if obj.data.name != UNIT_CUBE_NAME and obj.data.get(SHAPE_KEY_PROP) is None:
+        return None
+    if not _is_unrotated(obj):
+        return None
+    lx, ly, lz = obj.location
+    sx, sy, sz = obj.scale
+    current = obj
+    while current.parent is not None:
+        if not current.matrix_parent_inverse.is_identity:
+            return None
+        parent = current.parent
+        if not _is_unrotated(parent):
+            return None
+        px, py, pz = parent.scale
+        ox, oy, oz = parent.location
+        lx, ly, lz = ox + px * lx, oy + py * ly, oz + pz * lz
+        sx, sy, sz = px * sx, py * sy, pz * sz
+        current = parent
+    return (lx, ly, lz), (sx, sy, sz)
+
+
+def is_merged_mesh(obj: "bpy.types.Object") -> bool:
+    return obj.type == "MESH" and obj.data is not None and obj.data.get(OBJECT_NAMES_PROP) is not None
+
+
+def merged_object_names(obj: "bpy.types.Object") -> List[str]:
+    return [str(name) for name in json.loads(str(obj.data[OBJECT_NAMES_PROP]))]
+
+
+def merged_object_rows(obj: "bpy.types.Object") -> Optional[Tuple[List[str], "np.ndarray"]]:
+    """
+    Per-source-object bounds rows of a merged mesh, read with bulk `foreach_get`
+    and reduced with NumPy. None when the object is transformed in a way the
+    rows cannot follow (rotation or parenting).
+    """
+    if obj.parent is not None or not _is_unrotated(obj):
+        return None
+    mesh = obj.data
+    names = merged_object_names(obj)
+    vertex_count = len(mesh.vertices)
+    if not names or not vertex_count:
+        return names, np.empty((0, 6), dtype=np.float64)
+    co = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    owners = np.empty(vertex_count, dtype=np.int32)
+    mesh.attributes[OBJECT_ATTRIBUTE].data.foreach_get("value", owners)
+
+    points = co.reshape(-1, 3).astype(np.float64) * np.asarray(obj.scale, dtype=np.float64)
+    points += np.asarray(obj.location, dtype=np.float64)
+    order = np.argsort(owners, kind="stable")
+    owners = owners[order]
+    points = points[order]
+    starts = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+    mins = np.minimum.reduceat(points, starts)
+    maxs = np.maximum.reduceat(points, starts)
+    rows = np.empty((len(starts), 6), dtype=np.float64)
+    rows[:, 0::2] = np.minimum(mins, maxs)
+    rows[:, 1::2] = np.maximum(mins, maxs)
+    return [names[owner] for owner in owners[starts].tolist()], rows
+
+
+def merge_bounds(bounds: Optional[Bounds], other: Bounds) -> Bounds:
+    if bounds is None:
+        return other
+    return (
+        min(bounds[0], other[0]),
+        max(bounds[1], other[1]),
+        min(bounds[2], other[2]),
+        max(bounds[3], other[3]),
+        min(bounds[4], other[4]),
+        max(bounds[5], other[5]),
+    )
+
+
+def build_bounds_index(objects: Iterable["bpy.types.Object"]) -> BoundsIndex:
+    """
+    Compute overall and per-part bounds in a single pass over `objects`.
+
+    Every realised part is a scaled `__unit_cube__` under an `ANCHOR` empty, so
+    its bounds follow from the transforms alone: centre = world location and
+    half extents = |world scale| / 2. Those are gathered into arrays and reduced
+    with NumPy. Merged meshes contribute one row per source object, read from
+    their vertices. Anything else (other meshes, rotations, modifiers) falls
+    back to the depsgraph, which is then evaluated once for the whole call.
+    """
+    names: List[str] = []
+    locations: List[Tuple[float, float, float]] = []
+    scales: List[Tuple[float, float, float]] = []
+    merged_names: List[str] = []
+    merged_rows: List["np.ndarray"] = []
+    fallback: List["bpy.types.Object"] = []
+
+    for obj in objects:
+        if obj.type != "MESH":
+            continue
+        if is_merged_mesh(obj):
+            merged = merged_object_rows(obj)
+            if merged is None:
+                fallback.append(obj)
+            else:
+                merged_names.extend(merged[0])
+                merged_rows.append(merged[1])
+            continue
+        transform = _analytic_transform(obj)
+        if transform is None:
+            fallback.append(obj)
+            continue
+        names.append(obj.name)
+        locations.append(transform[0])
+        scales.append(transform[1])
+
+    index = bounds_index_from_rows(
+        names + merged_names,
+        np.concatenate([_transform_rows(locations, scales), *merged_rows]),
+    )
+    overall = index.bounds
+    parts = dict(index.parts)
+    per_object = dict(index.objects)
+
+    if fallback:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        for obj in fallback:
+            obj_bounds = object_world_bounds(obj, depsgraph)
+            if obj_bounds is None:
+                continue
+            overall = merge_bounds(overall, obj_bounds)
+            per_object[obj.name] = obj_bounds
+            part_id = part_id_from_name(obj.name)
+            if part_id is not None:
+                parts[part_id] = merge_bounds(parts.get(part_id), obj_bounds)
+
+    return BoundsIndex(
+        bounds=overall,
+        parts=parts,
+        objects=per_object,
+        analytic_count=len(names) + len(merged_names),
+        evaluated_count=len(fallback),
+    )
+
+
+def _transform_rows(
+    locations: Sequence[Tuple[float, float, float]],
+    scales: Sequence[Tuple[float, float, float]],
+) -> "np.ndarray":
+    # Interleave to (min_x, max_x, min_y, max_y, min_z, max_z) per row.
+    rows = np.empty((len(locations), 6), dtype=np.float64)
+    if locations:
+        centres = np.asarray(locations, dtype=np.float64)
+        half_extents = np.abs(np.asarray(scales, dtype=np.float64)) * 0.5
+        rows[:, 0::2] = centres - half_extents
+        rows[:, 1::2] = centres + half_extents
+    return rows
+
+
+def bounds_index_from_rows(names: Sequence[str], rows: "np.ndarray") -> BoundsIndex:
+    """Group bounds rows (one per named object) into overall, per-part and per-object bounds."""
+    overall: Optional[Bounds] = None
+    parts: Dict[str, Bounds] = {}
+    per_object: Dict[str, Bounds] = {}
+
+    if len(names):
+        groups: Dict[str, List[int]] = {}
+        for row_index, name in enumerate(names):
+            part_id = part_id_from_name(name)
+            if part_id is not None:
+                groups.setdefault(part_id, []).append(row_index)
+        for part_id, row_indices in groups.items():
+            parts[part_id] = _reduce_rows(rows[row_indices])
+        overall = _reduce_rows(rows)
+        for name, row in zip(names, rows.tolist()):
+            per_object[name] = tuple(row)  # type: ignore[assignment]
+
+    return BoundsIndex(
+        bounds=overall,
+        parts=parts,
+        objects=per_object,
+        analytic_count=len(names),
+        evaluated_count=0,
+    )
+
+
+def bounds_index_from_transforms(
+    names: Sequence[str],
+    locations: Sequence[Tuple[float, float, float]],
+    scales: Sequence[Tuple[float, float, float]],
+) -> BoundsIndex:
+    """Bounds of unit cubes given their world locations and scales, grouped like `build_bounds_index`."""
+    return bounds_index_from_rows(names, _transform_rows(locations, scales))
+
+
+def translate_bounds(bounds: Bounds, offset: Tuple[float, float, float]) -> Bounds:
+    dx, dy, dz = offset
+    return (
+        bounds[0] + dx,
+        bounds[1] + dx,
+        bounds[2] + dy,
+        bounds[3] + dy,
+        bounds[4] + dz,
+        bounds[5] + dz,
+    )
+
+
+def _reduce_rows(rows: "np.ndarray") -> Bounds:
+    mins = rows.min(axis=0)
+    maxs = rows.max(axis=0)
+    return (
+        float(mins[0]),
+        float(maxs[1]),
+        float(mins[2]),
+        float(maxs[3]),
+        float(mins[4]),
+        float(maxs[5]),
+    )
+
+
+def collection_bounds(collection: "bpy.types.Collection") -> Optional[Bounds]:
+    return build_bounds_index(collection.objects).bounds
+
+
+def part_bounds(collection: "bpy.types.Collection", part_id: str) -> Optional[Bounds]:
+    return build_bounds_index(collection.objects).part(part_id)
@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .blender_bounds import Bounds, BoundsIndex, merge_bounds, part_id_from_name, translate_bounds
+from .blender_object_registry import ANCHOR_SUFFIX
+
+Offset = Tuple[float, float, float]
+
+REPORT_PRECISION = 6
+APPLY_ERGONOMICS = True  # chairs: move parts to match the declared values
+TOLERANCE = 0.02
+SIDECAR_SUFFIX = ".ergonomics.json"
+
+# Declared `physical` heights each archetype is measured against (footprint is always included).
+HEIGHT_METRICS: Dict[str, Tuple[str, ...]] = {
+    "chair": ("seatHeight", "totalHeight"),
+    "table": ("surfaceHeight", "clearanceHeight"),
+    "bed": ("sleepingHeight", "clearanceUnder", "totalHeight"),
+}
+# Declared minimums rather than targets: the resolver sets a table's
+# clearanceHeight to the knee clearance it needs, so any free height at or
+# above it is fine.
+MINIMUM_METRICS = frozenset({"clearanceHeight"})
+
+
+@dataclass(frozen=True)
+class ErgonomicCorrection:
+    """
+    Offsets that bring a realised asset in line with its declared `physical`
+    values. `part_offsets` move a whole part (its ANCHOR); `object_offsets`
+    move individual objects by name.
+    """
+
+    part_offsets: Mapping[str, Offset]
+    object_offsets: Mapping[str, Offset]
+    before: Mapping[str, float]
+    after: Mapping[str, float]
+
+
+def _get_number(value: object) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+def declared_metrics(physical: Mapping[str, object], height_keys: Tuple[str, ...]) -> Dict[str, float]:
+    """Flatten the numeric `physical` values we measure into `metric -> value`."""
+    declared: Dict[str, float] = {}
+    for key in height_keys:
+        value = _get_number(physical.get(key))
+        if value is not None:
+            declared[key] = value
+    footprint = physical.get("footprint")
+    if isinstance(footprint, Mapping):
+        for axis in ("width", "depth"):
+            value = _get_number(footprint.get(axis))
+            if value is not None:
+                declared[f"footprint.{axis}"] = value
+    return declared
+
+
+def measure_chair(bounds: Optional[Bounds], parts: Mapping[str, Bounds]) -> Optional[Dict[str, float]]:
+    seat_bounds = parts.get("seat")
+    if bounds is None or seat_bounds is None:
+        return None
+    min_x, max_x, min_y, max_y, min_z, max_z = bounds
+    # Seat height is measured as the top of the seat surface relative to floor (min Z).
+    return {
+        "seatHeight": seat_bounds[5] - min_z,
+        "totalHeight": max_z - min_z,
+        "footprint.width": max_x - min_x,
+        "footprint.depth": max_y - min_y,
+    }
+
+
+def _footprint(bounds: Bounds) -> Dict[str, float]:
+    return {"footprint.width": bounds[1] - bounds[0], "footprint.depth": bounds[3] - bounds[2]}
+
+
+def measure_table(bounds: Optional[Bounds], parts: Mapping[str, Bounds]) -> Optional[Dict[str, float]]:
+    surface_bounds = parts.get("surface")
+    if bounds is None or surface_bounds is None:
+        return None
+    min_z = bounds[4]
+    # Clearance is the free height under the surface, i.e. its underside.
+    return {
+        "surfaceHeight": surface_bounds[5] - min_z,
+        "clearanceHeight": surface_bounds[4] - min_z,
+        **_footprint(bounds),
+    }
+
+
+def measure_bed(bounds: Optional[Bounds], parts: Mapping[str, Bounds]) -> Optional[Dict[str, float]]:
+    surface_bounds = parts.get("sleepSurface")
+    if bounds is None or surface_bounds is None:
+        return None
+    min_z = bounds[4]
+    # totalHeight includes the HEADBOARD, which belongs to the frame part.
+    return {
+        "sleepingHeight": surface_bounds[5] - min_z,
+        "clearanceUnder": surface_bounds[4] - min_z,
+        "totalHeight": bounds[5] - min_z,
+        **_footprint(bounds),
+    }
+
+
+MEASURES = {
+    "chair": measure_chair,
+    "table": measure_table,
+    "bed": measure_bed,
+}
+
+
+def solve_chair_corrections(
+    physical: Mapping[str, object],
+    index: BoundsIndex,
+) -> Optional[ErgonomicCorrection]:
+    """
+    Compute every chair correction from one measurement.
+
+    All parts are rigid boxes, so moving a part translates its bounds exactly
+    and the corrected measurement follows without measuring again:
+
+    - seatHeight: lift the seat so its top sits `seatHeight` above the floor.
+    - totalHeight: lift the back so its top sits `totalHeight` above the floor.
+    - footprint.width/depth: splay the supports symmetrically about their
+      centre until their outer faces span the declared footprint, but never
+      past the point where a leg's centre leaves the seat; a footprint the
+      legs cannot reach while carrying the seat is reported, not forced.
+    """
+    before = measure_chair(index.bounds, index.parts)
+    if before is None or index.bounds is None:
+        return None
+    declared = declared_metrics(physical, ("seatHeight", "totalHeight"))
+    floor_z = index.bounds[4]
+
+    part_offsets: Dict[str, Offset] = {}
+    seat_bounds = index.parts["seat"]
+    if "seatHeight" in declared:
+        part_offsets["seat"] = (0.0, 0.0, floor_z + declared["seatHeight"] - seat_bounds[5])
+    back_bounds = index.parts.get("back")
+    if "totalHeight" in declared and back_bounds is not None:
+        part_offsets["back"] = (0.0, 0.0, floor_z + declared["totalHeight"] - back_bounds[5])
+
+    object_offsets: Dict[str, Offset] = {}
+    support_bounds = index.parts.get("supports")
+    if support_bounds is not None:
+        legs = {
+            name: obj_bounds
+            for name, obj_bounds in index.objects.items()
+            if part_id_from_name(name) == "supports"
+        }
+        centre_x = (support_bounds[0] + support_bounds[1]) / 2
+        centre_y = (support_bounds[2] + support_bounds[3]) / 2
+        shift_x = 0.0
+        shift_y = 0.0
+        if "footprint.width" in declared:
+            shift_x = (declared["footprint.width"] - (support_bounds[1] - support_bounds[0])) / 2
+            shift_x = min(shift_x, _splay_limit(legs.values(), seat_bounds, 0))
+        if "footprint.depth" in declared:
+            shift_y = (declared["footprint.depth"] - (support_bounds[3] - support_bounds[2])) / 2
+            shift_y = min(shift_y, _splay_limit(legs.values(), seat_bounds, 1))
+        if shift_x or shift_y:
+            for name, obj_bounds in sorted(legs.items()):
+                obj_centre_x = (obj_bounds[0] + obj_bounds[1]) / 2
+                obj_centre_y = (obj_bounds[2] + obj_bounds[3]) / 2
+                object_offsets[name] = (
+                    _signed(shift_x, obj_centre_x - centre_x),
+                    _signed(shift_y, obj_centre_y - centre_y),
+                    0.0,
+                )
+
+    after_bounds: Optional[Bounds] = None
+    after_parts: Dict[str, Bounds] = {}
+    for name, obj_bounds in index.objects.items():
+        part_id = part_id_from_name(name)
+        offset = object_offsets.get(name) or part_offsets.get(part_id or "") or (0.0, 0.0, 0.0)
+        moved = translate_bounds(obj_bounds, offset)
+        after_bounds = merge_bounds(after_bounds, moved)
+        if part_id is not None:
+            after_parts[part_id] = merge_bounds(after_parts.get(part_id), moved)
+    after = measure_chair(after_bounds, after_parts) or before
+
+    return ErgonomicCorrection(
+        part_offsets=part_offsets,
+        object_offsets=object_offsets,
+        before=before,
+        after=after,
+    )
+
+
+def correction_moves(
+    asset_id: object,
+    parts: Mapping[Optional[str], Iterable[str]],
+    correction: ErgonomicCorrection,
+) -> Dict[str, Offset]:
+    """
+    Summed offset per object name. A part offset moves the part's ANCHOR, or
+    every object of the part when it has none; object offsets add on top.
+    `parts` maps part id -> object names of the asset.
+    """
+    moves: Dict[str, List[float]] = {}
+
+    def _add(name: str, offset: Offset) -> None:
+        move = moves.setdefault(name, [0.0, 0.0, 0.0])
+        for axis in range(3):
+            move[axis] += offset[axis]
+
+    known = {name for names in parts.values() for name in names}
+    for part_id, offset in correction.part_offsets.items():
+        anchor = f"{asset_id}::{part_id}::{ANCHOR_SUFFIX}"
+        for name in [anchor] if anchor in known else parts.get(part_id, ()):
+            _add(name, offset)
+    for name, offset in correction.object_offsets.items():
+        if name in known:
+            _add(name, offset)
+    return {name: (move[0], move[1], move[2]) for name, move in moves.items()}
+
+
+def correct_chair(
+    asset_id: object,
+    physical: Mapping[str, object],
+    index: BoundsIndex,
+    parts: Mapping[Optional[str], Iterable[str]],
+    apply: Callable[[ErgonomicCorrection, Mapping[str, Offset]], None],
+) -> Optional[Dict[str, object]]:
+    """
+    Solve the chair corrections for `index`, hand them and their
+    `correction_moves` to `apply` (when APPLY_ERGONOMICS) and return the
+    report, or None when there is nothing to measure.
+    """
+    correction = solve_chair_corrections(physical, index)
+    if correction is None:
+        return None
+
+    if APPLY_ERGONOMICS:
+        apply(correction, correction_moves(asset_id, parts, correction))
+        after = correction.after
+        offsets = {**correction.part_offsets, **correction.object_offsets}
+    else:
+        after = correction.before
+        offsets = {}
+
+    report = build_report(
+        asset_id,
+        "chair",
+        declared_metrics(physical, HEIGHT_METRICS["chair"]),
+        correction.before,
+        after,
+        TOLERANCE,
+        offsets,
+    )
+    report["applied"] = APPLY_ERGONOMICS
+    return report
+
+
+def _splay_limit(legs: Iterable[Bounds], seat_bounds: Bounds, axis: int) -> float:
+    """How far the legs can splay along `axis` before a leg centre leaves the seat."""
+    centres = [(leg[axis * 2] + leg[axis * 2 + 1]) / 2 for leg in legs]
+    return min(seat_bounds[axis * 2 + 1] - max(centres), min(centres) - seat_bounds[axis * 2])
+
+
+def _signed(shift: float, direction: float) -> float:
+    if direction > 0:
+        return shift
+    if direction < 0:
+        return -shift
+    return 0.0
+
+
+def metric_ok(metric: str, delta: float, tolerance: float) -> bool:
+    if metric in MINIMUM_METRICS:
+        return delta >= -tolerance
+    return abs(delta) <= tolerance
+
+
+def build_report(
+    asset_id: object,
+    archetype: str,
+    declared: Mapping[str, float],
+    before: Mapping[str, float],
+    after: Mapping[str, float],
+    tolerance: float,
+    offsets: Optional[Mapping[str, Offset]] = None,
+) -> Dict[str, object]:
+    """Structured measured-vs-declared report, one entry per declared metric."""
+    metrics: List[Dict[str, object]] = []
+    for metric, declared_value in declared.items():
+        if metric not in after:
+            continue
+        delta = after[metric] - declared_value
+        metrics.append(
+            {
+                "metric": metric,
+                "declared": round(declared_value, REPORT_PRECISION),
+                "before": round(before[metric], REPORT_PRECISION),
+                "after": round(after[metric], REPORT_PRECISION),
+                "delta": round(delta, REPORT_PRECISION),
+                "ok": metric_ok(metric, delta, tolerance),
+            }
+        )
+    report: Dict[str, object] = {
+        "assetId": asset_id,
+        "archetype": archetype,
+        "tolerance": tolerance,
+        "ok": all(metric["ok"] for metric in metrics),
+        "metrics": metrics,
+    }
+    if offsets is not None:
+        report["offsets"] = {
+            target: [round(value, REPORT_PRECISION) for value in offset]
+            for target, offset in sorted(offsets.items())
+        }
+    return report
+
+
+def measurement_report(
+    asset_id: object,
+    archetype: str,
+    physical: Mapping[str, object],
+    index: BoundsIndex,
+    tolerance: float,
+) -> Optional[Dict[str, object]]:
+    """Report for archetypes that are measured but not corrected (before == after)."""
+    measured = MEASURES[archetype](index.bounds, index.parts)
+    if measured is None:
+        return None
+    return build_report(
+        asset_id,
+        archetype,
+        declared_metrics(physical, HEIGHT_METRICS[archetype]),
+        measured,
+        measured,
+        tolerance,
+    )
+
+
+def sidecar_path_for(output_path: str) -> str:
+    return output_path + SIDECAR_SUFFIX
+
+
+def compact_report(report: Mapping[str, object]) -> Dict[str, object]:
+    """Measured (as saved), declared and delta per metric; what QA needs without reopening the file."""
+    return {
+        "assetId": report["assetId"],
+        "archetype": report["archetype"],
+        "tolerance": report["tolerance"],
+        "ok": report["ok"],
+        "metrics": {
+            metric["metric"]: {
+                "measured": metric["after"],
+                "declared": metric["declared"],
+                "delta": metric["delta"],
+                "ok": metric["ok"],
+            }
+            for metric in report["metrics"]  # type: ignore[union-attr]
+        },
+    }
+
+
+def write_sidecar(report: Optional[Mapping[str, object]], output_path: str) -> Optional[str]:
+    """
+    Write `report` next to `output_path` and return the sidecar path. Without
+    a report, a sidecar left by an earlier run is removed so it cannot go stale.
+    """
+    path = sidecar_path_for(output_path)
+    if report is None:
+        if os.path.exists(path):
+            os.unlink(path)
+        return None
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(compact_report(report), handle, separators=(",", ":"))
+    return path
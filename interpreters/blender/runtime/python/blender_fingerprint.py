@@ -0,0 +1,128 @@
+"""
+Deterministic fingerprint of a realised collection.
+
+Two outputs hold the same realisation when their fingerprints match, so CI
+and the cache can compare runs without diffing binary `.blend` files. The
+hash covers, in name order:
+
+- the collection tree;
+- every object's name (`assetId::part::index`), type, parent, rounded
+  transforms and instanced collection;
+- each mesh's identity: its name plus a digest of its rounded vertex
+  positions and face topology.
+
+Custom properties (regeneration bookkeeping, the fingerprint itself) are
+left out, so an incremental re-run and a fresh realisation of the same input
+hash the same.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    import bpy  # type: ignore
+except Exception as exc:  # pragma: no cover - only valid inside Blender
+    bpy = None  # type: ignore
+    _BLENDER_IMPORT_ERROR = exc
+else:
+    _BLENDER_IMPORT_ERROR = None
+
+FINGERPRINT_PROP = "realisation_fingerprint"
+FINGERPRINT_PRECISION = 6
+
+
+def _rounded(values) -> List[float]:  # type: ignore[no-untyped-def]
+    # + 0.0 folds -0.0 into 0.0 so the sign of a zero never changes the hash.
+    return [round(float(value), FINGERPRINT_PRECISION) + 0.0 for value in values]
+
+
+def mesh_digest(mesh: "bpy.types.Mesh") -> str:
+    """Hash of a mesh's rounded vertex positions, loop vertex indices and face sizes."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    loops = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loops)
+    totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", totals)
+
+    digest = hashlib.sha256()
+    digest.update((np.round(co.astype(np.float64), FINGERPRINT_PRECISION) + 0.0).astype("<f8").tobytes())
+    digest.update(loops.astype("<i4").tobytes())
+    digest.update(totals.astype("<i4").tobytes())
+    return digest.hexdigest()
+
+
+def _collection_tree(collection: "bpy.types.Collection") -> List["bpy.types.Collection"]:
+    found: Dict[str, "bpy.types.Collection"] = {}
+    pending = [collection]
+    while pending:
+        current = pending.pop()
+        if current.name not in found:
+            found[current.name] = current
+            pending.extend(current.children)
+    return [found[name] for name in sorted(found)]
+
+
+def collection_rows(collection: "bpy.types.Collection") -> List[List[object]]:
+    """The canonical rows the fingerprint hashes: collections, then objects, by name."""
+    rows: List[List[object]] = []
+    for current in _collection_tree(collection):
+        rows.append(
+            [
+                "collection",
+                current.name,
+                sorted(child.name for child in current.children),
+                sorted(obj.name for obj in current.objects),
+            ]
+        )
+
+    meshes: Dict[str, str] = {}
+    for obj in sorted(set(collection.all_objects), key=lambda item: item.name):
+        mesh: Optional[List[str]] = None
+        if obj.type == "MESH" and obj.data is not None:
+            if obj.data.name not in meshes:
+                meshes[obj.data.name] = mesh_digest(obj.data)
+            mesh = [obj.data.name, meshes[obj.data.name]]
+        rows.append(
+            [
+                "object",
+                obj.name,
+                obj.type,
+                obj.parent.name if obj.parent is not None else None,
+                _rounded(obj.location),
+                obj.rotation_mode,
+                _rounded(obj.rotation_euler),
+                _rounded(obj.scale),
+                obj.instance_collection.name if obj.instance_collection is not None else None,
+                mesh,
+            ]
+        )
+    return rows
+
+
+def fingerprint_collection(collection: "bpy.types.Collection") -> str:
+    canonical = json.dumps(collection_rows(collection), separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def stamp_fingerprint(name: str) -> Optional[str]:
+    """
+    Fingerprint the collection called `name` and store the hash on it as
+    `realisation_fingerprint`, so it is saved with the output. Returns the
+    hash, or None when there is no such collection.
+    """
+    if bpy is None:
+        raise RuntimeError(
+            "Blender runtime not available; realisations can only be fingerprinted inside Blender."
+        ) from _BLENDER_IMPORT_ERROR
+    collection = bpy.data.collections.get(name)
+    if collection is None:
+        return None
+    fingerprint = fingerprint_collection(collection)
+    collection[FINGERPRINT_PROP] = fingerprint
+    return fingerprint
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import json
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import bpy  # type: ignore
+except Exception as exc:  # pragma: no cover - only valid inside Blender
+    bpy = None  # type: ignore
+    _BLENDER_IMPORT_ERROR = exc
+else:
+    _BLENDER_IMPORT_ERROR = None
+
+from .blender_bounds import (
+    OBJECT_ATTRIBUTE,
+    OBJECT_NAMES_PROP,
+    merged_object_names,
+    part_id_from_name,
+)
+from .blender_object_registry import session_registry
+from .blender_plan_applier import (
+    REGEN_INCREMENTAL,
+    REGEN_MODES,
+    REGEN_PRESERVE,
+    REGEN_REPLACE,
+    REGEN_REPORT_PROP,
+    UNIT_CUBE_FACES,
+    UNIT_CUBE_VERTICES,
+    apply_plan,
+    apply_plan_incremental,
+)
+from .blender_teardown import clear_collection, teardown
+from .realisation_plan import KIND_CUBE, RealisationPlan
+from .tracing import span
+
+GEOMETRY_OBJECTS = "objects"
+GEOMETRY_MERGED = "merged"
+GEOMETRY_MODES = (GEOMETRY_OBJECTS, GEOMETRY_MERGED)
+
+PART_ATTRIBUTE = "part_index"
+PART_IDS_PROP = "part_ids"
+
+Offset = Tuple[float, float, float]
+
+_CUBE_CORNERS = np.asarray(UNIT_CUBE_VERTICES, dtype=np.float64)
+# UNIT_CUBE_FACES with the bottom quad reversed so every face winds outwards.
+_CUBE_LOOPS = np.asarray([tuple(reversed(UNIT_CUBE_FACES[0])), *UNIT_CUBE_FACES[1:]], dtype=np.int32).ravel()
+
+
+def merged_object_name(asset_id: object) -> str:
+    return f"{asset_id}::merged"
+
+
+def merged_geometry(plan: RealisationPlan) -> Dict[str, object]:
+    """
+    Vertex, loop and identity arrays for every cube in `plan`, baked into world
+    space: 8 vertices and 6 quads per cube, computed in one NumPy broadcast.
+    """
+    world = plan.world_transforms()
+    cubes = [index for index in range(len(plan)) if plan.kinds[index] == KIND_CUBE]
+    object_names = [plan.names[index] for index in cubes]
+    part_ids: List[str] = []
+    part_of_object: List[int] = []
+    for name in object_names:
+        part_id = part_id_from_name(name) or ""
+        if part_id not in part_ids:
+            part_ids.append(part_id)
+        part_of_object.append(part_ids.index(part_id))
+
+    locations = np.asarray([world[index][0] for index in cubes], dtype=np.float64).reshape(-1, 1, 3)
+    scales = np.asarray([world[index][1] for index in cubes], dtype=np.float64).reshape(-1, 1, 3)
+    co = (locations + scales * _CUBE_CORNERS).reshape(-1, 3)
+
+    cube_count = len(cubes)
+    corner_count = len(_CUBE_CORNERS)
+    loops = (np.arange(cube_count, dtype=np.int32)[:, None] * corner_count + _CUBE_LOOPS).ravel()
+    object_index = np.repeat(np.arange(cube_count, dtype=np.int32), corner_count)
+    part_index = np.repeat(np.asarray(part_of_object, dtype=np.int32), corner_count)
+    return {
+        "co": co,
+        "loops": loops,
+        "faceSize": 4,
+        "objectIndex": object_index,
+        "partIndex": part_index,
+        "objectNames": object_names,
+        "partIds": part_ids,
+    }
+
+
+def _clear_mesh(mesh: "bpy.types.Mesh") -> None:
+    mesh.clear_geometry()
+    for attribute_name in (OBJECT_ATTRIBUTE, PART_ATTRIBUTE):
+        attribute = mesh.attributes.get(attribute_name)
+        if attribute is not None:
+            mesh.attributes.remove(attribute)
+
+
+def _fill_mesh(mesh: "bpy.types.Mesh", geometry: Mapping[str, object]) -> None:
+    co: np.ndarray = geometry["co"]  # type: ignore[assignment]
+    loops: np.ndarray = geometry["loops"]  # type: ignore[assignment]
+    face_size = int(geometry["faceSize"])  # type: ignore[arg-type]
+    face_count = len(loops) // face_size
+
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+    mesh.loops.add(len(loops))
+    mesh.loops.foreach_set("vertex_index", loops)
+    mesh.polygons.add(face_count)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, len(loops), face_size, dtype=np.int32))
+    try:
+        mesh.polygons.foreach_set("loop_total", np.full(face_count, face_size, dtype=np.int32))
+    except (AttributeError, TypeError, RuntimeError):
+        pass  # Blender 4.x derives loop_total from loop_start.
+
+    for attribute_name, key in ((OBJECT_ATTRIBUTE, "objectIndex"), (PART_ATTRIBUTE, "partIndex")):
+        attribute = mesh.attributes.new(attribute_name, "INT", "POINT")
+        attribute.data.foreach_set("value", geometry[key])
+    mesh[OBJECT_NAMES_PROP] = json.dumps(geometry["objectNames"])
+    mesh[PART_IDS_PROP] = json.dumps(geometry["partIds"])
+    mesh.update()
+
+
+def apply_plan_merged(
+    plan: RealisationPlan,
+    collection: "bpy.types.Collection",
+) -> "bpy.types.Object":
+    """
+    Realise `plan` as one mesh object named `assetId::merged`. Part identity is
+    kept per vertex (`part_index`, `object_index`) and as one vertex group per
+    part. An existing merged object keeps its mesh, refilled in place, so the
+    mesh name (and with it the fingerprint) is stable across re-runs.
+    """
+    if bpy is None:
+        raise RuntimeError(
+            "Blender runtime not available; plans can only be applied inside Blender."
+        ) from _BLENDER_IMPORT_ERROR
+
+    geometry = merged_geometry(plan)
+    name = merged_object_name(plan.assetId)
+    registry = session_registry()
+    obj = registry.get(name)
+    if obj is None:
+        mesh = bpy.data.meshes.new(name)
+        _fill_mesh(mesh, geometry)
+        obj = bpy.data.objects.new(name, mesh)
+        collection.objects.link(obj)
+        registry.add(obj)
+    else:
+        _clear_mesh(obj.data)
+        _fill_mesh(obj.data, geometry)
+        obj.vertex_groups.clear()
+
+    part_index: np.ndarray = geometry["partIndex"]  # type: ignore[assignment]
+    for position, part_id in enumerate(geometry["partIds"]):  # type: ignore[arg-type]
+        group = obj.vertex_groups.new(name=part_id)
+        group.add(np.flatnonzero(part_index == position).tolist(), 1.0, "REPLACE")
+    return obj
+
+
+def _other_geometry_objects(
+    plan: RealisationPlan,
+    collection: "bpy.types.Collection",
+    geometry: str,
+) -> List["bpy.types.Object"]:
+    merged_name = merged_object_name(plan.assetId)
+    if geometry == GEOMETRY_MERGED:
+        return [obj for obj in collection.objects if obj.name != merged_name]
+    return [obj for obj in collection.objects if obj.name == merged_name]
+
+
+def apply_plan_geometry(
+    plan: RealisationPlan,
+    collection: "bpy.types.Collection",
+    geometry: str = GEOMETRY_OBJECTS,
+    regen: str = REGEN_PRESERVE,
+    meshes: Optional[Sequence[Optional["bpy.types.Mesh"]]] = None,
+) -> Optional[Dict[str, object]]:
+    """
+    Apply `plan` in the given geometry and regeneration modes. Incremental
+    regeneration returns what it touched and also stores it, as JSON, in the
+    collection's `regen_report` property, which other modes remove; a merged
+    mesh is always rebuilt, from boxes. `meshes` gives part objects their
+    cached shapes (objects mode only).
+    Objects left in `collection` by the other geometry mode are removed first.
+    """
+    if geometry not in GEOMETRY_MODES:
+        raise ValueError(
+            f"Unsupported geometry mode: {geometry} (expected one of {', '.join(GEOMETRY_MODES)})"
+        )
+    if regen not in REGEN_MODES:
+        raise ValueError(
+            f"Unsupported regeneration mode: {regen} (expected one of {', '.join(REGEN_MODES)})"
+        )
+
+    if regen == REGEN_REPLACE:
+        with span("clear_collection", objects=len(collection.objects)):
+            clear_collection(collection)
+
+    stale = _other_geometry_objects(plan, collection, geometry)
+    if stale:
+        with span("clear_other_geometry", objects=len(stale)):
+            teardown(stale)
+
+    if geometry == GEOMETRY_MERGED or regen != REGEN_INCREMENTAL:
+        # Only incremental runs report; drop the last one so it is not mistaken for this run's.
+        if REGEN_REPORT_PROP in collection:
+            del collection[REGEN_REPORT_PROP]
+        if geometry == GEOMETRY_MERGED:
+            apply_plan_merged(plan, collection)
+        else:
+            apply_plan(plan, collection, meshes)
+        return None
+    report = apply_plan_incremental(plan, collection, meshes)
+    collection[REGEN_REPORT_PROP] = json.dumps(report)
+    return report
+
+
+def translate_merged(
+    obj: "bpy.types.Object",
+    part_offsets: Mapping[str, Offset],
+    object_offsets: Mapping[str, Offset],
+) -> None:
+    """Move source objects inside a merged mesh: part offset plus any object offset, one bulk write."""
+    names = merged_object_names(obj)
+    per_object = np.zeros((len(names), 3), dtype=np.float64)
+    for position, name in enumerate(names):
+        part_offset: Optional[Offset] = part_offsets.get(part_id_from_name(name) or "")
+        if part_offset is not None:
+            per_object[position] += part_offset
+        if name in object_offsets:
+            per_object[position] += object_offsets[name]
+    if not per_object.any():
+        return
+
+    mesh = obj.data
+    vertex_count = len(mesh.vertices)
+    co = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    owners = np.empty(vertex_count, dtype=np.int32)
+    mesh.attributes[OBJECT_ATTRIBUTE].data.foreach_get("value", owners)
+    scale = np.asarray(obj.scale, dtype=np.float64)
+    moved = co.reshape(-1, 3) + (per_object[owners] / scale).astype(np.float32)
+    mesh.vertices.foreach_set("co", moved.ravel())
+    mesh.update()
+
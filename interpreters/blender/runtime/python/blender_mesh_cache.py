@@ -0,0 +1,165 @@
+"""
+Session cache of part-shape meshes, keyed by part kind and quantised size.
+
+With a shaped `detailTier` every part object needs its own mesh rather than
+the shared `__unit_cube__`. Objects of the same kind and size (every leg of
+every identical chair) share one mesh datablock, so memory and file size grow
+with the number of distinct shapes rather than the number of objects. Meshes
+are stored in unit space and scaled per object like `__unit_cube__`, so
+bounds, ergonomics and corrections treat them the same way.
+
+Each mesh keeps its key in the `shape_key` property. The cache is rebuilt from
+`bpy.data.meshes` on first use after a file is loaded, and after teardowns free meshes
+(`blender_teardown`), so reopened files keep sharing their meshes.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+try:
+    import bpy  # type: ignore
+except Exception as exc:  # pragma: no cover - only valid inside Blender
+    bpy = None  # type: ignore
+    _BLENDER_IMPORT_ERROR = exc
+else:
+    _BLENDER_IMPORT_ERROR = None
+
+from .blender_bounds import SHAPE_KEY_PROP, part_id_from_name
+from .part_shapes import FORM_BOXES, detail_form, unit_shape
+from .realisation_plan import KIND_CUBE, RealisationPlan
+
+SHAPE_MESH_PREFIX = "__shape__"
+SHAPE_QUANTUM = 0.0001  # metres; sizes closer than this share a mesh
+_QUANTUM_DIGITS = 4
+
+
+def quantise(dimensions: Sequence[float]) -> List[float]:
+    return [
+        round(round(abs(float(value)) / SHAPE_QUANTUM) * SHAPE_QUANTUM, _QUANTUM_DIGITS) + 0.0
+        for value in dimensions
+    ]
+
+
+def shape_key(form: str, kind: str, dimensions: Sequence[float]) -> str:
+    """`__shape__::form::kind::XxYxZ`, with the size quantised to `SHAPE_QUANTUM`."""
+    size = "x".join(f"{value:.{_QUANTUM_DIGITS}f}" for value in quantise(dimensions))
+    return f"{SHAPE_MESH_PREFIX}::{form}::{kind}::{size}"
+
+
+def _fill_shape_mesh(mesh: "bpy.types.Mesh", positions: np.ndarray, triangles: np.ndarray) -> None:
+    mesh.vertices.add(len(positions))
+    mesh.vertices.foreach_set("co", positions.astype(np.float32).ravel())
+    mesh.loops.add(triangles.size)
+    mesh.loops.foreach_set("vertex_index", triangles.astype(np.int32).ravel())
+    mesh.polygons.add(len(triangles))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, triangles.size, 3, dtype=np.int32))
+    try:
+        mesh.polygons.foreach_set("loop_total", np.full(len(triangles), 3, dtype=np.int32))
+    except (AttributeError, TypeError, RuntimeError):
+        pass  # Blender 4.x derives loop_total from loop_start.
+    mesh.update()
+
+
+def _alive(mesh: "bpy.types.Mesh", key: str) -> bool:
+    # Meshes removed behind the cache's back raise ReferenceError in Blender.
+    try:
+        return mesh.get(SHAPE_KEY_PROP) == key
+    except ReferenceError:
+        return False
+
+
+class MeshCache:
+    def __init__(self, meshes: Iterable["bpy.types.Mesh"] = ()) -> None:
+        self._by_key: Dict[str, "bpy.types.Mesh"] = {}
+        self.created = 0
+        for mesh in meshes:
+            key = mesh.get(SHAPE_KEY_PROP)
+            if isinstance(key, str):
+                self._by_key.setdefault(key, mesh)
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None  # type: ignore[arg-type]
+
+    def get(self, key: str) -> Optional["bpy.types.Mesh"]:
+        mesh = self._by_key.get(key)
+        if mesh is not None and not _alive(mesh, key):
+            del self._by_key[key]
+            return None
+        return mesh
+
+    def mesh(self, form: str, kind: str, dimensions: Sequence[float]) -> "bpy.types.Mesh":
+        """The shared mesh for a part object of `kind` and `dimensions`, built on first request."""
+        key = shape_key(form, kind, dimensions)
+        mesh = self.get(key)
+        if mesh is None:
+            mesh = bpy.data.meshes.new(key)
+            _fill_shape_mesh(mesh, *unit_shape(form, quantise(dimensions)))
+            mesh[SHAPE_KEY_PROP] = key
+            self._by_key[key] = mesh
+            self.created += 1
+        return mesh
+
+
+_SESSION: Optional[MeshCache] = None
+
+
+def invalidate_session_mesh_cache(*_: object) -> None:
+    global _SESSION
+    _SESSION = None
+
+
+def _install_load_handler() -> None:
+    app = getattr(bpy, "app", None)
+    if app is None:
+        return
+    handler = invalidate_session_mesh_cache
+    persistent = getattr(app.handlers, "persistent", None)
+    if persistent is not None:
+        handler = persistent(handler)
+    if handler not in app.handlers.load_post:
+        app.handlers.load_post.append(handler)
+
+
+def session_mesh_cache() -> MeshCache:
+    """The mesh cache for the current Blender session, built from `bpy.data.meshes` on first use."""
+    global _SESSION
+    if bpy is None:
+        raise RuntimeError(
+            "Blender runtime not available; meshes can only be cached inside Blender."
+        ) from _BLENDER_IMPORT_ERROR
+    if _SESSION is None:
+        _install_load_handler()
+        _SESSION = MeshCache(bpy.data.meshes)
+    return _SESSION
+
+
+def part_meshes(
+    plan: RealisationPlan,
+    input_dict: Mapping[str, object],
+) -> Optional[List[Optional["bpy.types.Mesh"]]]:
+    """
+    Per plan row, the cached shape mesh of each part object for the input's
+    `detailTier` (None for anchors). None for `basic`, which keeps `__unit_cube__`.
+    """
+    form = detail_form(input_dict.get("detailTier"))  # type: ignore[arg-type]
+    if form == FORM_BOXES:
+        return None
+    parts = input_dict.get("parts")
+    cache = session_mesh_cache()
+    world = plan.world_transforms()
+    meshes: List[Optional["bpy.types.Mesh"]] = []
+    for index, name in enumerate(plan.names):
+        if plan.kinds[index] != KIND_CUBE:
+            meshes.append(None)
+            continue
+        part_id = part_id_from_name(name) or ""
+        part = parts.get(part_id) if isinstance(parts, Mapping) else None
+        kind = part.get("kind") if isinstance(part, Mapping) else None
+        meshes.append(cache.mesh(form, str(kind or part_id), world[index][1]))
+    return meshes
@@ -0,0 +1,150 @@
+"""
+Name index of realised objects: assetId -> part -> objects, plus name -> object.
+
+`bpy.data.objects.get(name)` and name-substring scans grow with every asset in
+the session. The session registry is built from `bpy.data.objects` once, on
+first use after a file is loaded, and kept current by the code that creates
+and removes objects (`apply_plan*`, `teardown`), so lookups stay constant-time
+however many assets are loaded. Loading a file (including the runner's scene
+reset) drops it through a `load_post` handler.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import bpy  # type: ignore
+except Exception as exc:  # pragma: no cover - only valid inside Blender
+    bpy = None  # type: ignore
+    _BLENDER_IMPORT_ERROR = exc
+else:
+    _BLENDER_IMPORT_ERROR = None
+
+ANCHOR_SUFFIX = "ANCHOR"
+
+
+def split_object_name(name: str) -> Tuple[Optional[str], Optional[str]]:
+    """(assetId, part id) of `assetId::part::index` names; a bare `assetId::x` has no part."""
+    pieces = name.split("::")
+    if len(pieces) >= 3:
+        return "::".join(pieces[:-2]), pieces[-2]
+    if len(pieces) == 2:
+        return pieces[0], None
+    return None, None
+
+
+def _alive(obj: "bpy.types.Object", name: str) -> bool:
+    # Objects removed behind the registry's back raise ReferenceError in Blender.
+    try:
+        return obj.name == name
+    except ReferenceError:
+        return False
+
+
+class ObjectRegistry:
+    def __init__(self, objects: Iterable["bpy.types.Object"] = ()) -> None:
+        self._by_name: Dict[str, "bpy.types.Object"] = {}
+        self._assets: Dict[str, Dict[Optional[str], Dict[str, "bpy.types.Object"]]] = {}
+        for obj in objects:
+            self.add(obj)
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def __contains__(self, name: object) -> bool:
+        return self.get(name) is not None  # type: ignore[arg-type]
+
+    def add(self, obj: "bpy.types.Object") -> None:
+        name = obj.name
+        self._by_name[name] = obj
+        asset_id, part_id = split_object_name(name)
+        if asset_id is not None:
+            self._assets.setdefault(asset_id, {}).setdefault(part_id, {})[name] = obj
+
+    def discard(self, name: str) -> None:
+        if self._by_name.pop(name, None) is None:
+            return
+        asset_id, part_id = split_object_name(name)
+        parts = self._assets.get(asset_id) if asset_id is not None else None
+        if parts is None:
+            return
+        members = parts.get(part_id)
+        if members is not None:
+            members.pop(name, None)
+            if not members:
+                del parts[part_id]
+        if not parts:
+            del self._assets[asset_id]  # type: ignore[arg-type]
+
+    def discard_ids(self, ids: Iterable["bpy.types.ID"]) -> None:
+        """Forget any of `ids` that are registered objects; call before removing them."""
+        for item in ids:
+            name = item.name
+            if self._by_name.get(name) is item:
+                self.discard(name)
+
+    def get(self, name: str) -> Optional["bpy.types.Object"]:
+        obj = self._by_name.get(name)
+        if obj is not None and not _alive(obj, name):
+            self.discard(name)
+            return None
+        return obj
+
+    def asset_parts(self, asset_id: str) -> Dict[Optional[str], Dict[str, "bpy.types.Object"]]:
+        """Part id -> {name: object} for one asset (a copy; objects without a part under None)."""
+        return {part_id: dict(members) for part_id, members in self._assets.get(asset_id, {}).items()}
+
+    def asset_objects(self, asset_id: str) -> List["bpy.types.Object"]:
+        return [
+            obj
+            for members in self._assets.get(asset_id, {}).values()
+            for name, obj in list(members.items())
+            if self.get(name) is not None
+        ]
+
+    def part_objects(self, asset_id: str, part_id: str) -> List["bpy.types.Object"]:
+        members = self._assets.get(asset_id, {}).get(part_id, {})
+        return [obj for name, obj in list(members.items()) if self.get(name) is not None]
+
+    def anchor(self, asset_id: str, part_id: str) -> Optional["bpy.types.Object"]:
+        return self.get(f"{asset_id}::{part_id}::{ANCHOR_SUFFIX}")
+
+
+_SESSION: Optional[ObjectRegistry] = None
+
+
+def invalidate_session_registry(*_: object) -> None:
+    global _SESSION
+    _SESSION = None
+
+
+def _install_load_handler() -> None:
+    app = getattr(bpy, "app", None)
+    if app is None:
+        return
+    handler = invalidate_session_registry
+    persistent = getattr(app.handlers, "persistent", None)
+    if persistent is not None:
+        handler = persistent(handler)
+    if handler not in app.handlers.load_post:
+        app.handlers.load_post.append(handler)
+
+
+def forget_ids(ids: Iterable["bpy.types.ID"]) -> None:
+    """Drop `ids` from the session registry, if one is built; call before removing them."""
+    if _SESSION is not None:
+        _SESSION.discard_ids(ids)
+
+
+def session_registry() -> ObjectRegistry:
+    """The registry for the current Blender session, built from `bpy.data.objects` on first use."""
+    global _SESSION
+    if bpy is None:
+        raise RuntimeError(
+            "Blender runtime not available; objects can only be indexed inside Blender."
+        ) from _BLENDER_IMPORT_ERROR
+    if _SESSION is None:
+        _install_load_handler()
+        _SESSION = ObjectRegistry(bpy.data.objects)
+    return _SESSION
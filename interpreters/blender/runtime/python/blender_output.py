@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Set
+
+try:
+    import bpy  # type: ignore
+except Exception as exc:  # pragma: no cover - only valid inside Blender
+    bpy = None  # type: ignore
+    _BLENDER_IMPORT_ERROR = exc
+else:
+    _BLENDER_IMPORT_ERROR = None
+
+OUTPUT_MAINFILE = "mainfile"
+OUTPUT_LIBRARY = "library"
+OUTPUT_MODES = (OUTPUT_MAINFILE, OUTPUT_LIBRARY)
+
+
+def asset_datablocks(collection: "bpy.types.Collection") -> Set["bpy.types.ID"]:
+    """The collection, its child collections, their objects and the objects' data."""
+    datablocks: Set["bpy.types.ID"] = {collection}
+    pending = [collection]
+    while pending:
+        current = pending.pop()
+        for child in current.children:
+            if child not in datablocks:
+                datablocks.add(child)
+                pending.append(child)
+    for obj in collection.all_objects:
+        datablocks.add(obj)
+        if obj.data is not None:
+            datablocks.add(obj.data)
+    return datablocks
+
+
+def write_library(
+    collection: "bpy.types.Collection",
+    output_path: str,
+    compress: bool = False,
+) -> int:
+    """
+    Write only `collection` and what it depends on (objects, the shared
+    `__unit_cube__` mesh, ...) to `output_path`, ready to be linked or appended.
+    Everything else in the session (startup scene, camera, light, world,
+    leftovers from earlier jobs) stays out. Returns the number of datablocks.
+    """
+    datablocks = asset_datablocks(collection)
+    # fake_user keeps the collection when the library file is opened directly.
+    bpy.data.libraries.write(output_path, datablocks, fake_user=True, compress=compress)
+    return len(datablocks)
+
+
+def save_output(
+    asset_id: object,
+    output_path: str,
+    mode: str = OUTPUT_MAINFILE,
+    compress: bool = False,
+) -> None:
+    if bpy is None:
+        raise RuntimeError(
+            "Blender runtime not available; outputs can only be written inside Blender."
+        ) from _BLENDER_IMPORT_ERROR
+    if mode == OUTPUT_MAINFILE:
+        bpy.ops.wm.save_mainfile(filepath=output_path, compress=compress)
+        return
+    if mode != OUTPUT_LIBRARY:
+        raise ValueError(f"Unsupported output mode: {mode} (expected one of {', '.join(OUTPUT_MODES)})")
+    collection = bpy.data.collections.get(str(asset_id))
+    if collection is None:
+        raise RuntimeError(f"No collection named '{asset_id}' to write.")
+    write_library(collection, output_path, compress)
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import bpy  # type: ignore
+except Exception as exc:  # pragma: no cover - only valid inside Blender
+    bpy = None  # type: ignore
+    _BLENDER_IMPORT_ERROR = exc
+else:
+    _BLENDER_IMPORT_ERROR = None
+
+from .blender_bounds import UNIT_CUBE_NAME
+from .blender_object_registry import session_registry
+from .blender_teardown import teardown
+from .realisation_plan import KIND_EMPTY, RealisationPlan
+from .tracing import span
+
+# How realisers treat objects left in the session by an earlier realisation:
+# keep them as they are, delete and rebuild them all, or diff them per part.
+REGEN_PRESERVE = "preserve"
+REGEN_REPLACE = "replace"
+REGEN_INCREMENTAL = "incremental"
+REGEN_MODES = (REGEN_PRESERVE, REGEN_REPLACE, REGEN_INCREMENTAL)
+
+PART_FINGERPRINT_PROP = "part_fingerprint"
+TRANSFORM_EPSILON = 1e-6
+REGEN_REPORT_PROP = "regen_report"
+
+UNIT_CUBE_VERTICES = [
+    (-0.5, -0.5, -0.5),
+    (0.5, -0.5, -0.5),
+    (0.5, 0.5, -0.5),
+    (-0.5, 0.5, -0.5),
+    (-0.5, -0.5, 0.5),
+    (0.5, -0.5, 0.5),
+    (0.5, 0.5, 0.5),
+    (-0.5, 0.5, 0.5),
+]
+UNIT_CUBE_FACES = [
+    (0, 1, 2, 3),
+    (4, 5, 6, 7),
+    (0, 1, 5, 4),
+    (1, 2, 6, 5),
+    (2, 3, 7, 6),
+    (3, 0, 4, 7),
+]
+
+
+def ensure_unit_cube() -> "bpy.types.Mesh":
+    cube_mesh = bpy.data.meshes.get(UNIT_CUBE_NAME)
+    if cube_mesh is None:
+        cube_mesh = bpy.data.meshes.new(UNIT_CUBE_NAME)
+        cube_mesh.from_pydata(UNIT_CUBE_VERTICES, [], UNIT_CUBE_FACES)
+        cube_mesh.update()
+    return cube_mesh
+
+
+def ensure_collection(name: str) -> "bpy.types.Collection":
+    collection = bpy.data.collections.get(name)
+    if collection is None:
+        collection = bpy.data.collections.new(name)
+        bpy.context.scene.collection.children.link(collection)
+    return collection
+
+
+def _part_mesh(
+    meshes: Optional[Sequence[Optional["bpy.types.Mesh"]]],
+    index: int,
+    cube_mesh: "bpy.types.Mesh",
+) -> "bpy.types.Mesh":
+    if meshes is None:
+        return cube_mesh
+    return meshes[index] or cube_mesh
+
+
+def apply_plan(
+    plan: RealisationPlan,
+    collection: "bpy.types.Collection",
+    meshes: Optional[Sequence[Optional["bpy.types.Mesh"]]] = None,
+) -> Dict[str, "bpy.types.Object"]:
+    """
+    Create the plan's objects in `collection` and return them by name.
+
+    Each part's objects are created and linked in one pass, then every new
+    object is configured from the plan arrays in a second pass. Existing anchors are
+    moved to their planned location; existing part objects are left untouched
+    (REGEN_MODE "preserve"). Part objects get `meshes[index]` when given
+    (`blender_mesh_cache.part_meshes`), else the shared `__unit_cube__`.
+    """
+    if bpy is None:
+        raise RuntimeError(
+            "Blender runtime not available; plans can only be applied inside Blender."
+        ) from _BLENDER_IMPORT_ERROR
+
+    cube_mesh = ensure_unit_cube()
+    registry = session_registry()
+    objects: List[Optional["bpy.types.Object"]] = [None] * len(plan)
+    locations = plan.locations
+    scales = plan.scales
+    parents = plan.parents
+
+    for part_id, start, stop in plan.part_ranges():
+        with span("part", part=part_id, objects=stop - start):
+            created: List[int] = []
+            for index in range(start, stop):
+                name = plan.names[index]
+                obj = registry.get(name)
+                is_empty = plan.kinds[index] == KIND_EMPTY
+                if obj is None:
+                    mesh = None if is_empty else _part_mesh(meshes, index, cube_mesh)
+                    obj = bpy.data.objects.new(name, mesh)
+                    collection.objects.link(obj)
+                    registry.add(obj)
+                    created.append(index)
+                elif is_empty:
+                    obj.location = plan.location(index)
+                objects[index] = obj
+
+            for index in created:
+                obj = objects[index]
+                offset = index * 3
+                obj.location = locations[offset : offset + 3]
+                if plan.kinds[index] != KIND_EMPTY:
+                    obj.scale = scales[offset : offset + 3]
+                parent = parents[index]
+                if parent >= 0:
+                    obj.parent = objects[parent]
+
+    return {name: obj for name, obj in zip(plan.names, objects)}
+
+
+def _matches(current: Sequence[float], planned: Sequence[float]) -> bool:
+    # Blender stores transforms as float32; anything closer than the fingerprint's rounding is unchanged.
+    return all(abs(a - b) < TRANSFORM_EPSILON for a, b in zip(current, planned))
+
+
+def apply_plan_incremental(
+    plan: RealisationPlan,
+    collection: "bpy.types.Collection",
+    meshes: Optional[Sequence[Optional["bpy.types.Mesh"]]] = None,
+) -> Dict[str, object]:
+    """
+    Bring `collection` in line with `plan`, touching only parts whose planned
+    objects changed since the last run.
+
+    Each part's fingerprint (`RealisationPlan.part_fingerprints`) is kept as a
+    custom property on its first object, normally the anchor. A part whose
+    fingerprint and object names still match is left alone, including any
+    ergonomic offsets applied to it. With `meshes`, the part's mesh names are
+    part of its fingerprint. Changed parts get the planned transforms and meshes
+    written to their objects, with objects created or removed only where the
+    count changed; parts no longer planned are removed. Returns which parts
+    were created, updated, left unchanged or removed, with object counts.
+    """
+    if bpy is None:
+        raise RuntimeError(
+            "Blender runtime not available; plans can only be applied inside Blender."
+        ) from _BLENDER_IMPORT_ERROR
+
+    registry = session_registry()
+    existing = registry.asset_parts(plan.assetId)
+
+    report: Dict[str, object] = {
+        "created": [],
+        "updated": [],
+        "unchanged": [],
+        "removed": [],
+        "objectsCreated": 0,
+        "objectsUpdated": 0,
+        "objectsRemoved": 0,
+    }
+    cube_mesh = ensure_unit_cube()
+    fingerprints = plan.part_fingerprints()
+    if meshes is not None:
+        for part_id, indices in plan.part_indices().items():
+            part_meshes = [meshes[index] for index in indices]
+            names = "".join(m.name for m in part_meshes if m is not None)  # type: ignore[union-attr]
+            digest = hashlib.sha256((fingerprints[part_id] + names).encode("utf-8"))
+            fingerprints[part_id] = digest.hexdigest()
+    objects: Dict[int, "bpy.types.Object"] = {}
+    doomed: List["bpy.types.Object"] = []
+    released: List["bpy.types.Mesh"] = []
+
+    for part_id, indices in plan.part_indices().items():
+        current = existing.pop(part_id, {})  # type: ignore[call-overload]
+        planned = {plan.names[index] for index in indices}
+        marker = current.get(plan.names[indices[0]])
+        unchanged = marker is not None and marker.get(PART_FINGERPRINT_PROP) == fingerprints[part_id]
+        if unchanged and set(current) == planned:
+            report["unchanged"].append(part_id)  # type: ignore[union-attr]
+            continue
+
+        with span("part", part=part_id, objects=len(indices)):
+            doomed.extend(obj for name, obj in current.items() if name not in planned)
+            for index in indices:
+                name = plan.names[index]
+                is_empty = plan.kinds[index] == KIND_EMPTY
+                obj = current.get(name) or registry.get(name)
+                created = obj is None
+                changed = False
+                mesh = None if is_empty else _part_mesh(meshes, index, cube_mesh)
+                if obj is None:
+                    obj = bpy.data.objects.new(name, mesh)
+                    registry.add(obj)
+                    report["objectsCreated"] += 1  # type: ignore[operator]
+                elif mesh is not None and obj.data != mesh:
+                    if obj.data is not None:
+                        released.append(obj.data)
+                    obj.data = mesh
+                    changed = True
+                if collection not in obj.users_collection:
+                    collection.objects.link(obj)
+                location = plan.location(index)
+                if not _matches(obj.location, location):
+                    obj.location = location
+                    changed = True
+                if not is_empty and not _matches(obj.scale, plan.scale(index)):
+                    obj.scale = plan.scale(index)
+                    changed = True
+                parent = plan.parents[index]
+                if parent >= 0:
+                    parent_obj = objects.get(parent) or registry.get(plan.names[parent])
+                    if obj.parent != parent_obj:
+                        obj.parent = parent_obj
+                        changed = True
+                # Only existing objects whose transform, mesh or parent moved count as updated.
+                if changed and not created:
+                    report["objectsUpdated"] += 1  # type: ignore[operator]
+                objects[index] = obj
+            objects[indices[0]][PART_FINGERPRINT_PROP] = fingerprints[part_id]
+        report["created" if marker is None else "updated"].append(part_id)  # type: ignore[union-attr]
+
+    for part_id, leftovers in existing.items():
+        doomed.extend(leftovers.values())
+        report["removed"].append(part_id or "")  # type: ignore[union-attr]
+    # One batch for the objects this pass drops and the meshes it leaves unused.
+    if doomed or released:
+        report["objectsRemoved"] = teardown(doomed, released=released)["removed"]
+    return report
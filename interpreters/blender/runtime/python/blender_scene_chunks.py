@@ -0,0 +1,160 @@
+"""
+Chunked scene output: one library `.blend` per spatial chunk plus a small
+master file that links every chunk's collection.
+
+    out/
+      <sceneId>.blend        master; links chunks/*.blend
+      chunks/zone_hall.blend one self-contained library per chunk
+      chunks.json            chunk fingerprints and the last run's report
+
+A chunk is rewritten only when its fingerprint (its sources, placements,
+geometry mode and the caller's code `salt`) differs from `chunks.json` or
+its file is missing. The master links chunks by path and collection name, so
+it is rewritten only when chunks are added or removed; the files of removed
+chunks are deleted. Opening one chunk file loads just that district.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Callable, Dict, List, Mapping
+
+try:
+    import bpy  # type: ignore
+except Exception as exc:  # pragma: no cover - only valid inside Blender
+    bpy = None  # type: ignore
+    _BLENDER_IMPORT_ERROR = exc
+else:
+    _BLENDER_IMPORT_ERROR = None
+
+from .blender_merged_mesh import GEOMETRY_OBJECTS
+from .blender_output import OUTPUT_LIBRARY, save_output
+from .blender_plan_applier import ensure_collection
+from .blender_scene_realiser import Realiser, realise_scene
+from .scene_plan import CHUNK_ZONE, DEFAULT_CELL_SIZE, ScenePlan, split_chunks
+from .tracing import span
+
+CHUNK_DIR = "chunks"
+CHUNK_MANIFEST = "chunks.json"
+
+
+def chunk_fingerprint(chunk: ScenePlan, geometry: str, salt: str = "") -> str:
+    return hashlib.sha256(":".join((chunk.fingerprint(), geometry, salt)).encode("utf-8")).hexdigest()
+
+
+def load_chunk_manifest(output_dir: str) -> Dict[str, object]:
+    path = os.path.join(output_dir, CHUNK_MANIFEST)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def write_master(
+    scene_id: str,
+    chunks: List[Mapping[str, object]],
+    master_path: str,
+    compress: bool = False,
+) -> None:
+    """Save a file whose `scene_id` collection links each chunk's collection from its library."""
+    # Save first so the libraries below can be linked with paths relative to the master.
+    bpy.ops.wm.save_as_mainfile(filepath=master_path)
+    root = ensure_collection(scene_id)
+    for chunk in chunks:
+        library_path = os.path.join(os.path.dirname(master_path), str(chunk["path"]))
+        with bpy.data.libraries.load(library_path, link=True, relative=True) as (_, data_to):
+            data_to.collections = [chunk["collection"]]
+        for collection in data_to.collections:
+            if collection is not None:
+                root.children.link(collection)
+    bpy.ops.wm.save_mainfile(filepath=master_path, compress=compress)
+
+
+def write_chunked_scene(
+    scene: ScenePlan,
+    output_dir: str,
+    registry: Mapping[str, Realiser],
+    reset: Callable[[], None],
+    mode: str = CHUNK_ZONE,
+    cell_size: float = DEFAULT_CELL_SIZE,
+    geometry: str = GEOMETRY_OBJECTS,
+    compress: bool = False,
+    salt: str = "",
+) -> Dict[str, object]:
+    """
+    Write `scene` as chunk libraries plus a master file under `output_dir`.
+    `reset` must return the session to its startup state; it is called
+    between files. Returns the report also saved as `chunks.json`.
+    """
+    if bpy is None:
+        raise RuntimeError(
+            "Blender runtime not available; scenes can only be realised inside Blender."
+        ) from _BLENDER_IMPORT_ERROR
+
+    os.makedirs(os.path.join(output_dir, CHUNK_DIR), exist_ok=True)
+    previous = {
+        str(entry["id"]): entry
+        for entry in load_chunk_manifest(output_dir).get("chunks", [])  # type: ignore[union-attr]
+    }
+    master_path = os.path.join(output_dir, f"{scene.sceneId}.blend")
+
+    dirty = False
+    entries: List[Dict[str, object]] = []
+    for identifier, chunk in split_chunks(scene, mode, cell_size).items():
+        relative_path = f"{CHUNK_DIR}/{identifier}.blend"
+        path = os.path.join(output_dir, relative_path)
+        fingerprint = chunk_fingerprint(chunk, geometry, salt)
+        before = previous.get(identifier)
+        written = not (before and before.get("fingerprint") == fingerprint and os.path.exists(path))
+        if written:
+            if dirty:
+                reset()
+            dirty = True
+            with span("realise_chunk", chunk=identifier, placements=len(chunk.placements)):
+                realise_scene(chunk, registry, geometry)
+            with span("save", output=path, mode=OUTPUT_LIBRARY):
+                save_output(chunk.sceneId, path, OUTPUT_LIBRARY, compress)
+        entries.append(
+            {
+                "id": identifier,
+                "path": relative_path,
+                "collection": chunk.sceneId,
+                "fingerprint": fingerprint,
+                "placements": len(chunk.placements),
+                "sources": len(chunk.sources),
+                "written": written,
+            }
+        )
+
+    current = [str(entry["id"]) for entry in entries]
+    removed = sorted(set(previous) - set(current))
+    for identifier in removed:
+        stale_path = previous[identifier].get("path", f"{CHUNK_DIR}/{identifier}.blend")
+        stale = os.path.join(output_dir, str(stale_path))
+        if os.path.exists(stale):
+            os.remove(stale)
+    added = [identifier for identifier in current if identifier not in previous]
+    master_written = bool(removed or added) or not os.path.exists(master_path)
+    if master_written:
+        if dirty:
+            reset()
+        with span("save_master", output=master_path, chunks=len(entries)):
+            write_master(scene.sceneId, entries, master_path, compress)
+
+    report: Dict[str, object] = {
+        "sceneId": scene.sceneId,
+        "mode": mode,
+        "cellSize": cell_size,
+        "geometry": geometry,
+        "master": os.path.basename(master_path),
+        "masterWritten": master_written,
+        "chunks": entries,
+        "written": sum(1 for entry in entries if entry["written"]),
+        "added": added,
+        "removed": removed,
+    }
+    with open(os.path.join(output_dir, CHUNK_MANIFEST), "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    return report
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Mapping, Optional
+
+try:
+    import bpy  # type: ignore
+except Exception as exc:  # pragma: no cover - only valid inside Blender
+    bpy = None  # type: ignore
+    _BLENDER_IMPORT_ERROR = exc
+else:
+    _BLENDER_IMPORT_ERROR = None
+
+from .blender_merged_mesh import GEOMETRY_OBJECTS
+from .blender_object_registry import session_registry
+from .blender_plan_applier import ensure_collection
+from .scene_plan import Placement, ScenePlan
+from .tracing import span
+
+# realise(adapter_input, geometry=...) -> ergonomics report or None
+Realiser = Callable[..., Optional[Mapping[str, object]]]
+
+
+def sources_collection_name(scene_id: str) -> str:
+    return f"{scene_id}::sources"
+
+
+def zone_collection_name(scene_id: str, zone: str) -> str:
+    return f"{scene_id}::zone::{zone}"
+
+
+def instance_name(scene_id: str, placement_id: str) -> str:
+    return f"{scene_id}::{placement_id}"
+
+
+def _child_collection(parent: "bpy.types.Collection", name: str) -> "bpy.types.Collection":
+    collection = bpy.data.collections.get(name)
+    if collection is None:
+        collection = bpy.data.collections.new(name)
+    if collection.name not in {child.name for child in parent.children}:
+        parent.children.link(collection)
+    return collection
+
+
+def _move_under(collection: "bpy.types.Collection", parent: "bpy.types.Collection") -> None:
+    root = bpy.context.scene.collection
+    if collection.name in {child.name for child in root.children}:
+        root.children.unlink(collection)
+    if collection.name not in {child.name for child in parent.children}:
+        parent.children.link(collection)
+
+
+def _find_layer_collection(layer_collection, name: str):
+    if layer_collection.name == name:
+        return layer_collection
+    for child in layer_collection.children:
+        found = _find_layer_collection(child, name)
+        if found is not None:
+            return found
+    return None
+
+
+def _hide_sources(collection: "bpy.types.Collection") -> None:
+    # Sources stay in the file for their instances but are not drawn themselves.
+    # View-layer exclusion is lost when the collection is written as a library
+    # and linked elsewhere, so the collection's own flags hide it there; they
+    # do not affect instances of the source collections below it.
+    collection.hide_viewport = True
+    collection.hide_render = True
+    layer_collection = _find_layer_collection(bpy.context.view_layer.layer_collection, collection.name)
+    if layer_collection is not None:
+        layer_collection.exclude = True
+
+
+def _place_instance(
+    name: str,
+    placement: Placement,
+    source: "bpy.types.Collection",
+    zone: "bpy.types.Collection",
+) -> "bpy.types.Object":
+    registry = session_registry()
+    empty = registry.get(name)
+    if empty is None:
+        empty = bpy.data.objects.new(name, None)
+        zone.objects.link(empty)
+        registry.add(empty)
+    elif zone not in empty.users_collection:
+        for collection in list(empty.users_collection):
+            collection.objects.unlink(empty)
+        zone.objects.link(empty)
+    empty.instance_type = "COLLECTION"
+    empty.instance_collection = source
+    empty.location = placement.location
+    empty.rotation_euler = placement.rotation
+    empty.scale = placement.scale
+    return empty
+
+
+def realise_scene(
+    scene: ScenePlan,
+    registry: Mapping[str, Realiser],
+    geometry: str = GEOMETRY_OBJECTS,
+) -> Dict[str, object]:
+    """
+    Realise every distinct source of `scene` once into its own collection
+    (under `sceneId::sources`, hidden and excluded from the view layer), then place each
+    placement as a collection-instance empty named `sceneId::placementId` in
+    its zone collection. Returns counts and the sources' ergonomics reports.
+    """
+    if bpy is None:
+        raise RuntimeError(
+            "Blender runtime not available; scenes can only be realised inside Blender."
+        ) from _BLENDER_IMPORT_ERROR
+
+    root = ensure_collection(scene.sceneId)
+    sources_parent = _child_collection(root, sources_collection_name(scene.sceneId))
+    asset_ids = scene.source_asset_ids()
+    counts = scene.instance_counts()
+
+    source_collections: Dict[str, "bpy.types.Collection"] = {}
+    sources: List[Dict[str, object]] = []
+    for key, adapter_input in scene.sources.items():
+        archetype = adapter_input.get("archetype")
+        realiser = registry.get(archetype)  # type: ignore[arg-type]
+        if not realiser:
+            raise RuntimeError(f"Unsupported archetype: {archetype}")
+        asset_id = asset_ids[key]
+        if asset_id != adapter_input.get("assetId"):
+            adapter_input = {**adapter_input, "assetId": asset_id}
+        with span("realise_source", archetype=archetype, assetId=asset_id):
+            report = realiser(adapter_input, geometry=geometry)
+        collection = bpy.data.collections[asset_id]
+        _move_under(collection, sources_parent)
+        source_collections[key] = collection
+        sources.append(
+            {
+                "key": key,
+                "assetId": asset_id,
+                "archetype": archetype,
+                "instances": counts[key],
+                "objects": len(collection.all_objects),
+                "ergonomics": report,
+            }
+        )
+    _hide_sources(sources_parent)
+
+    zones: Dict[str, int] = {}
+    with span("place_instances", instances=len(scene.placements)):
+        for placement in scene.placements:
+            zone = _child_collection(root, zone_collection_name(scene.sceneId, placement.zone))
+            _place_instance(
+                instance_name(scene.sceneId, placement.id),
+                placement,
+                source_collections[placement.source],
+                zone,
+            )
+            zones[placement.zone] = zones.get(placement.zone, 0) + 1
+
+    return {
+        "sceneId": scene.sceneId,
+        "sourceCount": len(sources),
+        "instanceCount": len(scene.placements),
+        "sourceObjects": sum(int(source["objects"]) for source in sources),  # type: ignore[arg-type]
+        "zones": zones,
+        "sources": sources,
+    }
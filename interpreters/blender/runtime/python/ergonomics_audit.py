@@ -0,0 +1,489 @@
+"""
+Offline ergonomics audit of adapter inputs, without Blender.
+
+Every realised part is an axis-aligned box whose size and position are
+closed-form functions of `physical`, so a whole catalogue can be measured at
+once. The inputs are loaded as one float column per `physical` field, and
+each archetype's planner formulas are evaluated on those columns into an
+(assets, boxes, 6) bounds array. The chair corrections are applied to that
+array in the same way, and the `blender_ergonomics.MEASURES` functions run on
+the reduced columns. Inputs outside the closed form (missing fields or
+non-standard parts) are planned one at a time with `plan_realisation`, as
+`plan_export` does.
+
+    report = audit_inputs(load_adapter_inputs(["catalogue/", "more.jsonl"]))
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .blender_bounds import bounds_index_from_transforms
+from .blender_ergonomics import (
+    APPLY_ERGONOMICS,
+    HEIGHT_METRICS,
+    MEASURES,
+    MINIMUM_METRICS,
+    REPORT_PRECISION,
+    TOLERANCE,
+    declared_metrics,
+    solve_chair_corrections,
+)
+from .realisation_plan import (
+    BED_BACK_THICKNESS_RATIO,
+    BED_HEADBOARD_WIDTH_RATIO,
+    BED_LEG_THICKNESS_RATIO,
+    CHAIR_BACK_THICKNESS_RATIO,
+    CHAIR_BACK_WIDTH_RATIO,
+    CHAIR_SEAT_THICKNESS_RATIO,
+    CHAIR_SUPPORT_INSET_RATIO,
+    KIND_CUBE,
+    REALISER_TOLERANCE,
+    SUPPORT_INSET,
+    TABLE_LEG_THICKNESS_RATIO,
+    TABLE_SURFACE_THICKNESS_RATIO,
+    plan_realisation,
+)
+
+ADAPTER_KEYS = ("assetId", "archetype", "detailTier", "parts")
+FOOTPRINT_METRICS = ("footprint.width", "footprint.depth")
+
+# Inputs the closed form covers: exactly these part ids and every listed `physical` field.
+CLOSED_FORM: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "chair": (
+        ("back", "seat", "supports"),
+        ("seatWidth", "seatDepth", "seatHeight", "totalHeight", "footprint.width"),
+    ),
+    "table": (("supports", "surface"), ("surfaceWidth", "surfaceDepth", "surfaceHeight")),
+    "bed": (
+        ("frame", "sleepSurface"),
+        ("sleepingWidth", "sleepingLength", "sleepingHeight", "mattressThickness", "clearanceUnder"),
+    ),
+}
+
+
+def _get_number(value: object) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+def _field(physical: object, path: str) -> Optional[float]:
+    value = physical
+    for key in path.split("."):
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(key)
+    return _get_number(value)
+
+
+def audit_metrics(archetype: str) -> Tuple[str, ...]:
+    return HEIGHT_METRICS[archetype] + FOOTPRINT_METRICS
+
+
+@dataclass(frozen=True)
+class AuditColumns:
+    """One archetype's inputs as float columns (NaN where a field is missing)."""
+
+    archetype: str
+    asset_ids: List[str]
+    sources: List[str]
+    values: Mapping[str, "np.ndarray"]
+    closed_form: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.asset_ids)
+
+    def __getitem__(self, field: str) -> "np.ndarray":
+        return self.values[field]
+
+    def select(self, mask: "np.ndarray") -> "AuditColumns":
+        picked = np.flatnonzero(mask).tolist()
+        return AuditColumns(
+            archetype=self.archetype,
+            asset_ids=[self.asset_ids[row] for row in picked],
+            sources=[self.sources[row] for row in picked],
+            values={field: column[mask] for field, column in self.values.items()},
+            closed_form=self.closed_form[mask],
+        )
+
+
+def load_columns(archetype: str, entries: Sequence[Tuple[str, Mapping[str, object]]]) -> AuditColumns:
+    """Columns for every field the closed form or the report reads, over `entries` of one archetype."""
+    parts, required = CLOSED_FORM[archetype]
+    fields = list(dict.fromkeys(required + audit_metrics(archetype)))
+    physicals = [entry.get("physical") for _, entry in entries]
+    values = {
+        field: np.array([_field(physical, field) for physical in physicals], dtype=np.float64)
+        for field in fields
+    }
+    closed_form = np.array(
+        [sorted(entry["parts"]) == list(parts) for _, entry in entries],  # type: ignore[call-overload]
+        dtype=bool,
+    )
+    for field in required:
+        closed_form &= ~np.isnan(values[field])
+    return AuditColumns(
+        archetype=archetype,
+        asset_ids=[str(entry["assetId"]) for _, entry in entries],
+        sources=[source for source, _ in entries],
+        values=values,
+        closed_form=closed_form,
+    )
+
+
+def _support_columns(
+    width: "np.ndarray",
+    depth: "np.ndarray",
+    leg: "np.ndarray",
+    inset: "np.ndarray",
+) -> List[Tuple["np.ndarray", "np.ndarray"]]:
+    # Vectorised realisation_plan._support_positions.
+    half_w = width / 2
+    half_d = depth / 2
+    half_leg = leg / 2
+    near_x = -half_w + half_leg + inset
+    far_x = half_w - half_leg - inset
+    near_y = -half_d + half_leg + inset
+    far_y = half_d - half_leg - inset
+    return [(near_x, near_y), (far_x, near_y), (near_x, far_y), (far_x, far_y)]
+
+
+def _vectors(boxes: Sequence[Tuple[object, object, object]], rows: int) -> "np.ndarray":
+    # Each component is a column or a constant; the result is (rows, boxes, 3).
+    columns = [
+        np.stack([np.broadcast_to(np.asarray(value, dtype=np.float64), (rows,)) for value in box], axis=-1)
+        for box in boxes
+    ]
+    return np.stack(columns, axis=1)
+
+
+def _boxes(
+    centres: Sequence[Tuple[object, object, object]],
+    scales: Sequence[Tuple[object, object, object]],
+    rows: int,
+) -> "np.ndarray":
+    """(rows, boxes, 6) bounds of unit cubes with the given world centres and scales."""
+    centre = _vectors(centres, rows)
+    half = np.abs(_vectors(scales, rows)) / 2
+    boxes = np.empty(centre.shape[:2] + (6,), dtype=np.float64)
+    boxes[..., 0::2] = centre - half
+    boxes[..., 1::2] = centre + half
+    return boxes
+
+
+def chair_boxes(columns: AuditColumns) -> Tuple[Tuple[str, ...], "np.ndarray"]:
+    width = columns["seatWidth"]
+    depth = columns["seatDepth"]
+    seat_height = columns["seatHeight"]
+    leg = (columns["footprint.width"] - width) / 2
+    seat_thickness = width * CHAIR_SEAT_THICKNESS_RATIO
+    back_thickness = seat_thickness * CHAIR_BACK_THICKNESS_RATIO
+    back_height = columns["totalHeight"] - seat_height
+    leg_height = seat_height - REALISER_TOLERANCE
+    legs = _support_columns(width, depth, leg, width * CHAIR_SUPPORT_INSET_RATIO)
+    boxes = _boxes(
+        [
+            (0.0, 0.0, seat_height + seat_thickness / 2),
+            (0.0, depth / 2 - back_thickness / 2, back_height / 2),
+        ]
+        + [(x, y, leg_height / 2) for x, y in legs],
+        [
+            (width, depth, seat_thickness),
+            (width * CHAIR_BACK_WIDTH_RATIO, back_thickness, back_height),
+        ]
+        + [(leg, leg, leg_height)] * len(legs),
+        len(columns),
+    )
+    return ("seat", "back") + ("supports",) * len(legs), boxes
+
+
+def table_boxes(columns: AuditColumns) -> Tuple[Tuple[str, ...], "np.ndarray"]:
+    width = columns["surfaceWidth"]
+    depth = columns["surfaceDepth"]
+    height = columns["surfaceHeight"]
+    leg = width * TABLE_LEG_THICKNESS_RATIO
+    thickness = np.minimum(width, depth) * TABLE_SURFACE_THICKNESS_RATIO
+    leg_height = height - REALISER_TOLERANCE
+    legs = _support_columns(width, depth, leg, SUPPORT_INSET)
+    boxes = _boxes(
+        [(0.0, 0.0, height + thickness / 2)] + [(x, y, leg_height / 2) for x, y in legs],
+        [(width, depth, thickness)] + [(leg, leg, leg_height)] * len(legs),
+        len(columns),
+    )
+    return ("surface",) + ("supports",) * len(legs), boxes
+
+
+def bed_boxes(columns: AuditColumns) -> Tuple[Tuple[str, ...], "np.ndarray"]:
+    width = columns["sleepingWidth"]
+    length = columns["sleepingLength"]
+    mattress = columns["mattressThickness"]
+    base = columns["sleepingHeight"] - mattress
+    leg = width * BED_LEG_THICKNESS_RATIO
+    leg_height = columns["clearanceUnder"] - REALISER_TOLERANCE
+    back_thickness = mattress * BED_BACK_THICKNESS_RATIO
+    headboard_height = columns["totalHeight"] - columns["sleepingHeight"]
+    legs = _support_columns(width, length, leg, SUPPORT_INSET)
+    boxes = _boxes(
+        [(0.0, 0.0, base + mattress / 2)]
+        + [(x, y, leg_height / 2) for x, y in legs]
+        + [(0.0, length / 2 + back_thickness / 2, base + mattress + headboard_height / 2)],
+        [(width, length, mattress)]
+        + [(leg, leg, leg_height)] * len(legs)
+        + [(width * BED_HEADBOARD_WIDTH_RATIO, back_thickness, headboard_height)],
+        len(columns),
+    )
+    # The planner only adds a HEADBOARD when it has positive height.
+    boxes[~(headboard_height > 0), -1] = np.nan
+    return ("sleepSurface",) + ("frame",) * (len(legs) + 1), boxes
+
+
+BOX_BUILDERS = {
+    "chair": chair_boxes,
+    "table": table_boxes,
+    "bed": bed_boxes,
+}
+
+
+def _reduce(boxes: "np.ndarray") -> "np.ndarray":
+    """(rows, 6) overall bounds of (rows, boxes, 6); NaN boxes are absent."""
+    reduced = np.empty(boxes.shape[:1] + (6,), dtype=np.float64)
+    reduced[:, 0::2] = np.nanmin(boxes[..., 0::2], axis=1)
+    reduced[:, 1::2] = np.nanmax(boxes[..., 1::2], axis=1)
+    return reduced
+
+
+def _slots(parts: Sequence[str], part_id: str) -> List[int]:
+    return [slot for slot, slot_part in enumerate(parts) if slot_part == part_id]
+
+
+def measure_boxes(archetype: str, parts: Sequence[str], boxes: "np.ndarray") -> Dict[str, "np.ndarray"]:
+    """Run the archetype's `MEASURES` function on bounds columns (component-major, so it vectorises)."""
+    part_bounds = {part_id: _reduce(boxes[:, _slots(parts, part_id)]).T for part_id in dict.fromkeys(parts)}
+    return MEASURES[archetype](_reduce(boxes).T, part_bounds)  # type: ignore[arg-type, return-value]
+
+
+def correct_chair_boxes(columns: AuditColumns, parts: Sequence[str], boxes: "np.ndarray") -> "np.ndarray":
+    """Vectorised `solve_chair_corrections` for closed-form chairs: the boxes after the offsets."""
+    floor = _reduce(boxes)[:, 4]
+    moved = boxes.copy()
+    for part_id, metric in (("seat", "seatHeight"), ("back", "totalHeight")):
+        slots = _slots(parts, part_id)
+        lift = floor + columns[metric] - _reduce(boxes[:, slots])[:, 5]
+        moved[:, slots, 4:6] += lift[:, None, None]
+
+    slots = _slots(parts, "supports")
+    supports = _reduce(boxes[:, slots])
+    seat = _reduce(boxes[:, _slots(parts, "seat")])
+    for axis, metric in ((0, "footprint.width"), (1, "footprint.depth")):
+        low = supports[:, axis * 2]
+        high = supports[:, axis * 2 + 1]
+        leg_centres = (boxes[:, slots, axis * 2] + boxes[:, slots, axis * 2 + 1]) / 2
+        limit = np.minimum(
+            seat[:, axis * 2 + 1] - leg_centres.max(axis=1),
+            leg_centres.min(axis=1) - seat[:, axis * 2],
+        )
+        shift = np.nan_to_num(np.minimum((columns[metric] - (high - low)) / 2, limit))
+        offset = shift[:, None] * np.sign(leg_centres - ((low + high) / 2)[:, None])
+        moved[:, slots, axis * 2 : axis * 2 + 2] += offset[..., None]
+    return moved
+
+
+def _metric_matrix(metrics: Sequence[str], values: Mapping[str, "np.ndarray"], rows: int) -> "np.ndarray":
+    matrix = np.full((rows, len(metrics)), np.nan)
+    for column, metric in enumerate(metrics):
+        if metric in values:
+            matrix[:, column] = values[metric]
+    return matrix
+
+
+def audit_closed_form(columns: AuditColumns) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """(declared, before, after) matrices, one column per `audit_metrics`, for closed-form rows."""
+    archetype = columns.archetype
+    metrics = audit_metrics(archetype)
+    rows = len(columns)
+    parts, boxes = BOX_BUILDERS[archetype](columns)
+    before = _metric_matrix(metrics, measure_boxes(archetype, parts, boxes), rows)
+    after = before
+    if archetype == "chair" and APPLY_ERGONOMICS:
+        corrected = correct_chair_boxes(columns, parts, boxes)
+        after = _metric_matrix(metrics, measure_boxes(archetype, parts, corrected), rows)
+    return _metric_matrix(metrics, columns.values, rows), before, after
+
+
+def measure_input(
+    input_dict: Mapping[str, object],
+) -> Optional[Tuple[Dict[str, float], Dict[str, float], Dict[str, float]]]:
+    """(declared, before, after) for one input, from its plan; None when there is nothing to measure."""
+    archetype = str(input_dict.get("archetype"))
+    physical = input_dict.get("physical")
+    if not isinstance(physical, Mapping):
+        physical = {}
+    plan = plan_realisation(input_dict)
+    world = plan.world_transforms()
+    cubes = [index for index in range(len(plan)) if plan.kinds[index] == KIND_CUBE]
+    index = bounds_index_from_transforms(
+        [plan.names[cube] for cube in cubes],
+        [world[cube][0] for cube in cubes],
+        [world[cube][1] for cube in cubes],
+    )
+    before = MEASURES[archetype](index.bounds, index.parts)
+    if before is None:
+        return None
+    after = before
+    if archetype == "chair" and APPLY_ERGONOMICS:
+        correction = solve_chair_corrections(physical, index)
+        if correction is not None:
+            after = correction.after
+    return declared_metrics(physical, HEIGHT_METRICS[archetype]), before, after
+
+
+def _asset_reports(
+    columns: AuditColumns,
+    declared: "np.ndarray",
+    before: "np.ndarray",
+    after: "np.ndarray",
+    tolerance: float,
+) -> List[Dict[str, object]]:
+    metrics = audit_metrics(columns.archetype)
+    delta = after - declared
+    present = ~(np.isnan(declared) | np.isnan(after))
+    minimum = np.array([metric in MINIMUM_METRICS for metric in metrics])
+    ok = np.where(minimum, delta >= -tolerance, np.abs(delta) <= tolerance) | ~present
+    declared_rows = np.round(declared, REPORT_PRECISION).tolist()
+    before_rows = np.round(before, REPORT_PRECISION).tolist()
+    after_rows = np.round(after, REPORT_PRECISION).tolist()
+    delta_rows = np.round(delta, REPORT_PRECISION).tolist()
+    reports: List[Dict[str, object]] = []
+    for row, (asset_id, source) in enumerate(zip(columns.asset_ids, columns.sources)):
+        reports.append(
+            {
+                "assetId": asset_id,
+                "archetype": columns.archetype,
+                "source": source,
+                "ok": bool(ok[row].all()),
+                "metrics": [
+                    {
+                        "metric": metric,
+                        "declared": declared_rows[row][column],
+                        "before": before_rows[row][column],
+                        "after": after_rows[row][column],
+                        "delta": delta_rows[row][column],
+                        "ok": bool(ok[row, column]),
+                    }
+                    for column, metric in enumerate(metrics)
+                    if present[row, column]
+                ],
+            }
+        )
+    return reports
+
+
+def _summary(reports: Sequence[Mapping[str, object]], skipped: int, closed_form: int) -> Dict[str, object]:
+    archetypes: Dict[str, Dict[str, int]] = {}
+    metrics: Dict[str, Dict[str, object]] = {}
+    for report in reports:
+        counts = archetypes.setdefault(str(report["archetype"]), {"assets": 0, "failed": 0})
+        counts["assets"] += 1
+        counts["failed"] += 0 if report["ok"] else 1
+        for metric in report["metrics"]:  # type: ignore[union-attr]
+            totals = metrics.setdefault(metric["metric"], {"checked": 0, "failed": 0, "maxAbsDelta": 0.0})
+            totals["checked"] += 1  # type: ignore[operator]
+            totals["failed"] += 0 if metric["ok"] else 1  # type: ignore[operator]
+            delta = abs(metric["delta"])  # type: ignore[arg-type]
+            totals["maxAbsDelta"] = max(totals["maxAbsDelta"], delta)  # type: ignore[type-var]
+    return {
+        "assets": len(reports),
+        "failed": sum(1 for report in reports if not report["ok"]),
+        "skipped": skipped,
+        "closedForm": closed_form,
+        "planned": len(reports) - closed_form,
+        "archetypes": dict(sorted(archetypes.items())),
+        "metrics": dict(sorted(metrics.items())),
+    }
+
+
+def audit_inputs(
+    inputs: Iterable[Tuple[str, object]],
+    tolerance: float = TOLERANCE,
+) -> Dict[str, object]:
+    """
+    Audit `(source, adapter input)` pairs. Returns a summary, one report per
+    asset in input order (measured before and after the realiser's
+    corrections, declared and delta per metric) and the skipped entries.
+    """
+    groups: Dict[str, List[Tuple[int, str, Mapping[str, object]]]] = {}
+    skipped: List[Dict[str, object]] = []
+    for position, (source, entry) in enumerate(inputs):
+        if not isinstance(entry, Mapping) or any(key not in entry for key in ADAPTER_KEYS):
+            skipped.append({"source": source, "reason": "not an adapter input"})
+        elif entry["archetype"] not in CLOSED_FORM:
+            skipped.append({"source": source, "reason": f"unsupported archetype: {entry['archetype']}"})
+        else:
+            groups.setdefault(str(entry["archetype"]), []).append((position, source, entry))
+
+    ordered: List[Tuple[int, Dict[str, object]]] = []
+    closed_form = 0
+    for archetype, group in groups.items():
+        columns = load_columns(archetype, [(source, entry) for _, source, entry in group])
+        fast = columns.select(columns.closed_form)
+        if len(fast):
+            closed_form += len(fast)
+            positions = [group[row][0] for row in np.flatnonzero(columns.closed_form).tolist()]
+            ordered.extend(zip(positions, _asset_reports(fast, *audit_closed_form(fast), tolerance)))
+        for row in np.flatnonzero(~columns.closed_form).tolist():
+            position, source, entry = group[row]
+            try:
+                measured = measure_input(entry)
+            except Exception as exc:
+                skipped.append({"source": source, "reason": f"{type(exc).__name__}: {exc}"})
+                continue
+            declared, before, after = measured if measured is not None else ({}, {}, {})
+            single = columns.select(np.arange(len(columns)) == row)
+            metrics = audit_metrics(archetype)
+            ordered.extend(
+                (position, report)
+                for report in _asset_reports(
+                    single,
+                    _metric_matrix(metrics, declared, 1),  # type: ignore[arg-type]
+                    _metric_matrix(metrics, before, 1),  # type: ignore[arg-type]
+                    _metric_matrix(metrics, after, 1),  # type: ignore[arg-type]
+                    tolerance,
+                )
+            )
+
+    reports = [report for _, report in sorted(ordered, key=lambda item: item[0])]
+    return {
+        "tolerance": tolerance,
+        "summary": _summary(reports, len(skipped), closed_form),
+        "assets": reports,
+        "skipped": skipped,
+    }
+
+
+def _load_file(path: str) -> Iterator[Tuple[str, object]]:
+    with open(path, "r", encoding="utf-8") as handle:
+        if not path.endswith(".jsonl"):
+            yield path, json.load(handle)
+            return
+        for number, line in enumerate(handle, 1):
+            if line.strip():
+                yield f"{path}:{number}", json.loads(line)
+
+
+def load_adapter_inputs(paths: Sequence[str]) -> Iterator[Tuple[str, object]]:
+    """(source, parsed JSON) from .json files, .jsonl files (one input per line) and directories of both."""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield from _load_file(path)
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith((".json", ".jsonl")):
+                    yield from _load_file(os.path.join(root, name))
@@ -0,0 +1,211 @@
+"""
+Level-of-detail chains generated from realisation plans.
+
+An asset's `detailTier` picks the most detailed form (see `part_shapes`), and
+the chain steps down from there to a single bounding box. Every level keeps
+the asset's overall extent, so a level switch never changes the footprint or
+height. A form over its level's vertex budget gives way to the next simpler
+one. Each level also carries the screen size it is drawn down to and the
+camera distance (`FIELD_OF_VIEW`) it takes over at.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .part_shapes import (
+    DEFAULT_DETAIL_TIER,
+    FORM_BOUNDS,
+    FORM_BOXES,
+    FORM_CARVED,
+    FORM_PARTS,
+    FORM_PROFILED,
+    FORMS,
+    cube_boxes,
+    detail_forms,
+    form_geometry,
+)
+from .plan_export import (
+    GENERATOR,
+    GL_ARRAY_BUFFER,
+    GL_ELEMENT_ARRAY_BUFFER,
+    GL_FLOAT,
+    GL_UNSIGNED_INT,
+    GL_UNSIGNED_SHORT,
+    realise_plan,
+    write_glb_document,
+)
+from .realisation_plan import RealisationPlan
+
+VERTEX_BUDGETS = {FORM_CARVED: 4096, FORM_PROFILED: 1024, FORM_BOXES: 512, FORM_PARTS: 64, FORM_BOUNDS: 8}
+# Fraction of the viewport height the asset's bounding sphere covers when a
+# level hands over to the next one; `bounds` is drawn down to nothing.
+SCREEN_SIZES = {FORM_CARVED: 0.5, FORM_PROFILED: 0.25, FORM_BOXES: 0.1, FORM_PARTS: 0.04, FORM_BOUNDS: 0.0}
+FIELD_OF_VIEW = math.radians(60.0)  # vertical
+
+LOD_SUFFIX = ".lod.glb"
+LOD_EXTENSION = "MSFT_lod"
+
+
+@dataclass(frozen=True)
+class LodLevel:
+    level: int
+    form: str
+    vertex_budget: int
+    screen_size: float
+    switch_distance: float
+    positions: np.ndarray
+    triangles: np.ndarray
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "level": self.level,
+            "form": self.form,
+            "vertices": len(self.positions),
+            "triangles": len(self.triangles),
+            "vertexBudget": self.vertex_budget,
+            "screenSize": self.screen_size,
+            "switchDistance": self.switch_distance,
+        }
+
+
+def switch_distance(diameter: float, screen_size: float) -> float:
+    """Camera distance at which a sphere of `diameter` covers `screen_size` of the view height."""
+    return diameter / (2 * math.tan(FIELD_OF_VIEW / 2) * screen_size)
+
+
+def build_lod_chain(
+    plan: RealisationPlan,
+    detail_tier: Optional[str] = None,
+    budgets: Optional[Mapping[str, int]] = None,
+) -> List[LodLevel]:
+    """
+    Levels from the tier's form down to `bounds`. Each slot takes its form,
+    or the next simpler one that fits the slot's vertex budget; a form is used
+    once, so the chain can come out shorter than the tier's list.
+    """
+    budgets = {**VERTEX_BUDGETS, **(budgets or {})}
+    _, centres, half = cube_boxes(plan)
+    diameter = 0.0
+    if len(centres):
+        diameter = float(np.linalg.norm((centres + half).max(axis=0) - (centres - half).min(axis=0)))
+
+    chosen: List[Tuple[str, int, np.ndarray, np.ndarray]] = []
+    for slot in detail_forms(detail_tier):
+        budget = budgets[slot]
+        for form in FORMS[FORMS.index(slot) :]:
+            if chosen and FORMS.index(form) <= FORMS.index(chosen[-1][0]):
+                continue
+            positions, triangles = form_geometry(plan, form)
+            if len(positions) <= budget or form == FORM_BOUNDS:
+                break
+        if chosen and form == chosen[-1][0]:
+            continue
+        chosen.append((form, budget, positions, triangles))
+
+    levels: List[LodLevel] = []
+    for level, (form, budget, positions, triangles) in enumerate(chosen):
+        handover = SCREEN_SIZES[chosen[level - 1][0]] if level else 0.0
+        levels.append(
+            LodLevel(
+                level=level,
+                form=form,
+                vertex_budget=budget,
+                screen_size=SCREEN_SIZES[form],
+                switch_distance=round(switch_distance(diameter, handover), 6) if level else 0.0,
+                positions=positions,
+                triangles=triangles,
+            )
+        )
+    return levels
+
+
+def build_lod_gltf(asset_id: str, levels: Sequence[LodLevel]) -> Tuple[Dict[str, object], bytes]:
+    """
+    glTF document with one node and mesh per level. The scene holds level 0 only;
+    it lists the others under `MSFT_lod` with their `MSFT_screencoverage`, as the
+    extension expects. Meshes carry no normals, so viewers shade them flat.
+    """
+    chunks: List[bytes] = []
+    offset = 0
+    nodes: List[Dict[str, object]] = []
+    meshes: List[Dict[str, object]] = []
+    accessors: List[Dict[str, object]] = []
+    views: List[Dict[str, object]] = []
+
+    def _view(data: bytes, target: int) -> int:
+        nonlocal offset
+        views.append({"buffer": 0, "byteOffset": offset, "byteLength": len(data), "target": target})
+        chunks.append(data + b"\0" * (-len(data) % 4))
+        offset += len(chunks[-1])
+        return len(views) - 1
+
+    for level in levels:
+        # Z-up to Y-up: (x, y, z) -> (x, z, -y); + 0.0 keeps -0.0 out of the file.
+        positions = (level.positions[:, [0, 2, 1]] * (1.0, 1.0, -1.0) + 0.0).astype("<f4")
+        wide = len(positions) > 0xFFFF
+        indices = level.triangles.astype("<u4" if wide else "<u2")
+        accessors.append(
+            {
+                "bufferView": _view(positions.tobytes(), GL_ARRAY_BUFFER),
+                "componentType": GL_FLOAT,
+                "count": len(positions),
+                "type": "VEC3",
+                "min": positions.min(axis=0).tolist(),
+                "max": positions.max(axis=0).tolist(),
+            }
+        )
+        accessors.append(
+            {
+                "bufferView": _view(indices.tobytes(), GL_ELEMENT_ARRAY_BUFFER),
+                "componentType": GL_UNSIGNED_INT if wide else GL_UNSIGNED_SHORT,
+                "count": indices.size,
+                "type": "SCALAR",
+            }
+        )
+        name = f"{asset_id}::lod{level.level}"
+        primitive = {"attributes": {"POSITION": 2 * level.level}, "indices": 2 * level.level + 1}
+        meshes.append({"name": name, "primitives": [primitive]})
+        nodes.append({"name": name, "mesh": level.level, "extras": level.summary()})
+
+    nodes[0]["extensions"] = {LOD_EXTENSION: {"ids": list(range(1, len(levels)))}}
+    coverage = [level.screen_size for level in levels]
+    nodes[0]["extras"] = {**nodes[0]["extras"], "MSFT_screencoverage": coverage}  # type: ignore[dict-item]
+    buffer = b"".join(chunks)
+    document: Dict[str, object] = {
+        "asset": {"version": "2.0", "generator": GENERATOR},
+        "extensionsUsed": [LOD_EXTENSION],
+        "scene": 0,
+        "scenes": [{"name": asset_id, "nodes": [0]}],
+        "nodes": nodes,
+        "meshes": meshes,
+        "accessors": accessors,
+        "bufferViews": views,
+        "buffers": [{"byteLength": len(buffer)}],
+    }
+    return document, buffer
+
+
+def lod_path_for(output_path: str) -> str:
+    return output_path + LOD_SUFFIX
+
+
+def write_lod_chain(input_dict: Mapping[str, object], output_path: str) -> Dict[str, object]:
+    """
+    Write the LOD chain of `input_dict`'s final plan (after ergonomics) next to
+    `output_path` as `<output>.lod.glb`. Returns its path, tier and levels.
+    """
+    plan, _ = realise_plan(input_dict)
+    detail_tier = input_dict.get("detailTier")
+    levels = build_lod_chain(plan, detail_tier)  # type: ignore[arg-type]
+    path = lod_path_for(output_path)
+    write_glb_document(*build_lod_gltf(plan.assetId, levels), path)
+    return {
+        "output": path,
+        "detailTier": detail_tier or DEFAULT_DETAIL_TIER,
+        "levels": [level.summary() for level in levels],
+    }
@@ -0,0 +1,222 @@
+"""
+Part object shapes for each detail form, computed with NumPy.
+
+- `carved`: octagonal tapered legs with a collar; other parts get rounded
+  corners and quarter-round top edges;
+- `profiled`: tapered square legs; other parts get chamfered top edges;
+- `boxes`: one box per part object, as the realisers build it (`basic`);
+- `parts`: one box per part;
+- `bounds`: one box for the whole asset.
+
+Legs are part objects at least `POST_ASPECT` times taller than they are wide.
+Shaped forms keep each part object's bounding box, so a shaped object still
+measures like the box it replaces. Each shape is a loft: rings of points
+stacked along Z, closed with fan caps.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .realisation_plan import KIND_CUBE, RealisationPlan
+
+FORM_CARVED = "carved"
+FORM_PROFILED = "profiled"
+FORM_BOXES = "boxes"
+FORM_PARTS = "parts"
+FORM_BOUNDS = "bounds"
+FORMS = (FORM_CARVED, FORM_PROFILED, FORM_BOXES, FORM_PARTS, FORM_BOUNDS)
+
+DEFAULT_DETAIL_TIER = "basic"
+TIER_FORMS = {"carved": FORM_CARVED, "profiled": FORM_PROFILED, "basic": FORM_BOXES}
+
+POST_ASPECT = 2.0
+POST_TAPER = 0.7  # foot width, of the top width
+POST_COLLAR = 0.15  # of the leg height, below the top
+BEVEL_RATIO = 0.3  # of the part object's smallest dimension
+CORNER_RATIO = 0.2  # of the smaller horizontal half extent
+CORNER_SEGMENTS = 2
+BEVEL_SEGMENTS = 3
+
+# Quadrant signs of a ring, counter-clockwise seen from above.
+_QUADRANTS = np.array([(1.0, 1.0), (-1.0, 1.0), (-1.0, -1.0), (1.0, -1.0)])
+
+# half extents (N,3) -> z side (L,), taper (L,), inset (N,L), drop (N,L), corner radius (N,), corner segments
+Loft = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]
+
+
+def _ring(corner_segments: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per ring point: quadrant signs (K,2) and unit corner offsets (K,2)."""
+    if corner_segments == 0:
+        return _QUADRANTS, np.zeros_like(_QUADRANTS)
+    steps = np.arange(corner_segments + 1) / corner_segments
+    angles = ((np.arange(4)[:, None] + steps) * (math.pi / 2)).ravel()
+    signs = np.repeat(_QUADRANTS, corner_segments + 1, axis=0)
+    return signs, np.stack([np.cos(angles), np.sin(angles)], axis=1)
+
+
+def _loft_triangles(levels: int, ring: int) -> np.ndarray:
+    """Side quads between consecutive rings plus fan caps; outward counter-clockwise winding."""
+    k = np.arange(ring)
+    following = (k + 1) % ring
+    sides = []
+    for level in range(levels - 1):
+        low, high = level * ring, (level + 1) * ring
+        sides.append(np.stack([low + k, low + following, high + following], axis=1))
+        sides.append(np.stack([low + k, high + following, high + k], axis=1))
+    fan = np.arange(1, ring - 1)
+    bottom = np.stack([np.zeros_like(fan), fan + 1, fan], axis=1)
+    top = (levels - 1) * ring + np.stack([np.zeros_like(fan), fan, fan + 1], axis=1)
+    return np.concatenate(sides + [bottom, top])
+
+
+def _loft(centres: np.ndarray, half: np.ndarray, loft: Loft) -> Tuple[np.ndarray, np.ndarray]:
+    side, taper, inset, drop, corner, corner_segments = loft
+    signs, offsets = _ring(corner_segments)
+    # (N,L,1) per object and level, against (K,2) per ring point.
+    radius = np.maximum(corner[:, None] * taper - inset, 0.0)[:, :, None]
+    extent_x = (half[:, 0:1] * taper - inset)[:, :, None]
+    extent_y = (half[:, 1:2] * taper - inset)[:, :, None]
+    x = centres[:, 0, None, None] + signs[:, 0] * (extent_x - radius) + offsets[:, 0] * radius
+    y = centres[:, 1, None, None] + signs[:, 1] * (extent_y - radius) + offsets[:, 1] * radius
+    z = np.broadcast_to((centres[:, 2:3] + side * half[:, 2:3] - drop)[:, :, None], x.shape)
+    positions = np.stack([x, y, z], axis=-1).reshape(-1, 3)
+
+    per_object = len(side) * len(signs)
+    template = _loft_triangles(len(side), len(signs))
+    triangles = (np.arange(len(centres))[:, None, None] * per_object + template).reshape(-1, 3)
+    return positions, triangles
+
+
+def _box(half: np.ndarray) -> Loft:
+    count = len(half)
+    flat = np.zeros((count, 2))
+    return np.array([-1.0, 1.0]), np.ones(2), flat, flat, np.zeros(count), 0
+
+
+def _post_profiled(half: np.ndarray) -> Loft:
+    side, _, inset, drop, corner, segments = _box(half)
+    return side, np.array([POST_TAPER, 1.0]), inset, drop, corner, segments
+
+
+def _post_carved(half: np.ndarray) -> Loft:
+    count = len(half)
+    drop = np.zeros((count, 3))
+    drop[:, 1] = POST_COLLAR * 2 * half[:, 2]
+    corner = 0.3 * np.minimum(half[:, 0], half[:, 1])
+    side = np.array([-1.0, 1.0, 1.0])
+    return side, np.array([POST_TAPER, 1.0, 1.0]), np.zeros((count, 3)), drop, corner, 1
+
+
+def _bevel(half: np.ndarray) -> np.ndarray:
+    return BEVEL_RATIO * 2 * half.min(axis=1)
+
+
+def _slab_profiled(half: np.ndarray) -> Loft:
+    bevel = _bevel(half)[:, None]
+    inset = bevel * np.array([0.0, 0.0, 1.0])
+    drop = bevel * np.array([0.0, 1.0, 0.0])
+    return np.array([-1.0, 1.0, 1.0]), np.ones(3), inset, drop, np.zeros(len(half)), 0
+
+
+def _slab_carved(half: np.ndarray) -> Loft:
+    bevel = _bevel(half)
+    angles = np.arange(BEVEL_SEGMENTS + 1) / BEVEL_SEGMENTS * (math.pi / 2)
+    inset = np.concatenate([[0.0], 1.0 - np.cos(angles)]) * bevel[:, None]
+    drop = np.concatenate([[0.0], 1.0 - np.sin(angles)]) * bevel[:, None]
+    corner = np.maximum(CORNER_RATIO * np.minimum(half[:, 0], half[:, 1]), bevel)
+    side = np.concatenate([[-1.0], np.ones(BEVEL_SEGMENTS + 1)])
+    return side, np.ones(len(side)), inset, drop, corner, CORNER_SEGMENTS
+
+
+def _is_post(half: np.ndarray) -> np.ndarray:
+    return half[:, 2] >= POST_ASPECT * np.maximum(half[:, 0], half[:, 1])
+
+
+# form -> (loft for legs, loft for everything else)
+LOFTS: Dict[str, Tuple[Callable[[np.ndarray], Loft], Callable[[np.ndarray], Loft]]] = {
+    FORM_CARVED: (_post_carved, _slab_carved),
+    FORM_PROFILED: (_post_profiled, _slab_profiled),
+    FORM_BOXES: (_box, _box),
+    FORM_PARTS: (_box, _box),
+    FORM_BOUNDS: (_box, _box),
+}
+
+
+def cube_boxes(plan: RealisationPlan) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Names, centres (N,3) and half extents (N,3) of the plan's part objects, in world space."""
+    world = plan.world_transforms()
+    cubes = [index for index in range(len(plan)) if plan.kinds[index] == KIND_CUBE]
+    centres = np.array([world[index][0] for index in cubes], dtype=np.float64).reshape(-1, 3)
+    half = np.abs(np.array([world[index][1] for index in cubes], dtype=np.float64).reshape(-1, 3)) / 2
+    return [plan.names[index] for index in cubes], centres, half
+
+
+def _grouped_boxes(
+    groups: Sequence[int],
+    centres: np.ndarray,
+    half: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    codes = np.unique(np.asarray(groups), return_inverse=True)[1]
+    count = int(codes.max()) + 1
+    low = np.full((count, 3), np.inf)
+    high = np.full((count, 3), -np.inf)
+    np.minimum.at(low, codes, centres - half)
+    np.maximum.at(high, codes, centres + half)
+    return (low + high) / 2, (high - low) / 2
+
+
+def form_geometry(plan: RealisationPlan, form: str) -> Tuple[np.ndarray, np.ndarray]:
+    """World-space positions (V,3) and triangles (T,3) of `plan` in one `FORMS` form."""
+    if form not in LOFTS:
+        raise ValueError(f"Unsupported LOD form: {form} (expected one of {', '.join(FORMS)})")
+    names, centres, half = cube_boxes(plan)
+    if form == FORM_PARTS:
+        centres, half = _grouped_boxes([name.split("::")[-2] for name in names], centres, half)
+    elif form == FORM_BOUNDS:
+        centres, half = _grouped_boxes([0] * len(names), centres, half)
+
+    post_loft, slab_loft = LOFTS[form]
+    posts = _is_post(half)
+    positions: List[np.ndarray] = []
+    triangles: List[np.ndarray] = []
+    base = 0
+    for mask, loft in ((posts, post_loft), (~posts, slab_loft)):
+        if not mask.any():
+            continue
+        group_positions, group_triangles = _loft(centres[mask], half[mask], loft(half[mask]))
+        positions.append(group_positions)
+        triangles.append(group_triangles + base)
+        base += len(group_positions)
+    if not positions:
+        return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64)
+    return np.concatenate(positions), np.concatenate(triangles)
+
+
+def detail_forms(detail_tier: Optional[str]) -> Tuple[str, ...]:
+    tier = detail_tier or DEFAULT_DETAIL_TIER
+    if tier not in TIER_FORMS:
+        raise ValueError(f"Unsupported detail tier: {tier} (expected one of {', '.join(TIER_FORMS)})")
+    return FORMS[FORMS.index(TIER_FORMS[tier]) :]
+
+
+def detail_form(detail_tier: Optional[str]) -> str:
+    """The most detailed form for `detail_tier` (default `basic`)."""
+    return detail_forms(detail_tier)[0]
+
+
+def unit_shape(form: str, dimensions: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    One part object of `dimensions` in `form`, divided by its dimensions so it
+    fills the unit cube: the realisers scale it per object like `__unit_cube__`.
+    """
+    if form not in (FORM_CARVED, FORM_PROFILED, FORM_BOXES):
+        raise ValueError(f"Unsupported part shape form: {form}")
+    size = np.abs(np.asarray(dimensions, dtype=np.float64)).reshape(1, 3)
+    half = size / 2
+    loft = LOFTS[form][0 if _is_post(half)[0] else 1]
+    positions, triangles = _loft(np.zeros((1, 3)), half, loft(half))
+    return positions / np.where(size > 0, size, 1.0), triangles
@@ -0,0 +1,289 @@
+"""
+Blender-free realisation backend: writes glTF 2.0 and OBJ straight from plans.
+
+Uses the same planners as the Blender realisers (`plan_realisation`) and, for
+chairs, the same closed-form ergonomic corrections, so objects carry the same
+`assetId::part::index` names and transforms as the `.blend` output. Tables and
+beds get the same measurement report as their Blender realisers. Every part
+is the shared `__unit_cube__`; anchors become glTF nodes (OBJ has no hierarchy,
+so it gets world-space vertices for the part objects only).
+
+Coordinates are converted from Blender's Z-up to the Y-up convention glTF
+requires and Blender's own exporters use for OBJ: (x, y, z) -> (x, z, -y).
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import struct
+import sys
+from array import array
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from .blender_bounds import UNIT_CUBE_NAME, BoundsIndex, bounds_index_from_transforms
+from .blender_ergonomics import TOLERANCE, Offset, correct_chair, measurement_report
+from .blender_object_registry import split_object_name
+from .realisation_plan import KIND_CUBE, RealisationPlan, plan_realisation
+
+Vector3 = Tuple[float, float, float]
+PlanWithReport = Tuple[RealisationPlan, Optional[Dict[str, object]]]
+
+GENERATOR = "artworkflow plan_export"
+GLB_MAGIC = 0x46546C67  # "glTF"
+GLB_JSON_CHUNK = 0x4E4F534A  # "JSON"
+GLB_BIN_CHUNK = 0x004E4942  # "BIN\0"
+GL_FLOAT = 5126
+GL_UNSIGNED_SHORT = 5123
+GL_UNSIGNED_INT = 5125
+GL_ARRAY_BUFFER = 34962
+GL_ELEMENT_ARRAY_BUFFER = 34963
+OBJ_PRECISION = 6
+
+# Corner i of the unit cube sits at (+-0.5, +-0.5, +-0.5) with x, y, z taken
+# from bits 0, 1, 2 of i. Faces list corners counter-clockwise seen from outside.
+CUBE_CORNERS: List[Vector3] = [
+    (0.5 if index & 1 else -0.5, 0.5 if index & 2 else -0.5, 0.5 if index & 4 else -0.5)
+    for index in range(8)
+]
+CUBE_FACES: List[Tuple[Vector3, Tuple[int, int, int, int]]] = [
+    ((1.0, 0.0, 0.0), (1, 3, 7, 5)),
+    ((-1.0, 0.0, 0.0), (0, 4, 6, 2)),
+    ((0.0, 1.0, 0.0), (2, 6, 7, 3)),
+    ((0.0, -1.0, 0.0), (0, 1, 5, 4)),
+    ((0.0, 0.0, 1.0), (4, 5, 7, 6)),
+    ((0.0, 0.0, -1.0), (0, 2, 3, 1)),
+]
+
+
+def _y_up(vector: Vector3) -> Vector3:
+    return (vector[0], vector[2], 0.0 - vector[1])  # 0.0 - keeps -0.0 out of the files
+
+
+def _y_up_scale(scale: Vector3) -> Vector3:
+    return (scale[0], scale[2], scale[1])
+
+
+def _plan_bounds_index(plan: RealisationPlan) -> BoundsIndex:
+    world = plan.world_transforms()
+    cubes = [index for index in range(len(plan)) if plan.kinds[index] == KIND_CUBE]
+    return bounds_index_from_transforms(
+        [plan.names[cube] for cube in cubes],
+        [world[cube][0] for cube in cubes],
+        [world[cube][1] for cube in cubes],
+    )
+
+
+def _move_plan(plan: RealisationPlan, moves: Mapping[str, Offset]) -> None:
+    positions = {name: position for position, name in enumerate(plan.names)}
+    for name, move in moves.items():
+        for axis in range(3):
+            plan.locations[positions[name] * 3 + axis] += move[axis]
+
+
+def _plan_chair_with_ergonomics(input_dict: Mapping[str, object]) -> PlanWithReport:
+    plan = plan_realisation(input_dict)
+    physical = input_dict.get("physical")
+    if not isinstance(physical, Mapping):
+        return plan, None
+    parts: Dict[Optional[str], List[str]] = {}
+    for name in plan.names:
+        parts.setdefault(split_object_name(name)[1], []).append(name)
+    report = correct_chair(
+        input_dict.get("assetId"),
+        physical,
+        _plan_bounds_index(plan),
+        parts,
+        lambda _, moves: _move_plan(plan, moves),
+    )
+    return plan, report
+
+
+def _plan_with_measurement(input_dict: Mapping[str, object]) -> PlanWithReport:
+    # Tables and beds are measured, not corrected, as in their Blender realisers.
+    plan = plan_realisation(input_dict)
+    physical = input_dict.get("physical")
+    if not isinstance(physical, Mapping):
+        return plan, None
+    index = _plan_bounds_index(plan)
+    return plan, measurement_report(input_dict.get("assetId"), plan.archetype, physical, index, TOLERANCE)
+
+
+EXPORT_REGISTRY: Dict[str, Callable[[Mapping[str, object]], PlanWithReport]] = {
+    "chair": _plan_chair_with_ergonomics,
+    "table": _plan_with_measurement,
+    "bed": _plan_with_measurement,
+}
+
+
+def realise_plan(input_dict: Mapping[str, object]) -> PlanWithReport:
+    """Final plan for an adapter input (after ergonomics) and its ergonomics report."""
+    archetype = input_dict.get("archetype")
+    realiser = EXPORT_REGISTRY.get(archetype)  # type: ignore[arg-type]
+    if not realiser:
+        raise RuntimeError(f"Unsupported archetype: {archetype}")
+    return realiser(input_dict)
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _cube_buffer() -> Tuple[bytes, int, int]:
+    """Positions, normals, then uint16 indices for a flat-shaded cube (24 vertices)."""
+    positions = array("f")
+    normals = array("f")
+    indices = array("H")
+    for normal, corners in CUBE_FACES:
+        base = len(positions) // 3
+        for corner in corners:
+            positions.extend(_y_up(CUBE_CORNERS[corner]))
+            normals.extend(_y_up(normal))
+        indices.extend((base, base + 1, base + 2, base, base + 2, base + 3))
+    data = _little_endian(positions) + _little_endian(normals) + _little_endian(indices)
+    return data, len(positions) // 3, len(indices)
+
+
+def build_gltf(plan: RealisationPlan) -> Tuple[Dict[str, object], bytes]:
+    """glTF JSON document and its single binary buffer for `plan`."""
+    data, vertex_count, index_count = _cube_buffer()
+    vector_bytes = vertex_count * 3 * 4
+    buffer = data + b"\0" * (-len(data) % 4)
+
+    nodes: List[Dict[str, object]] = []
+    roots: List[int] = []
+    for index, name in enumerate(plan.names):
+        node: Dict[str, object] = {"name": name, "translation": list(_y_up(plan.location(index)))}
+        if plan.kinds[index] == KIND_CUBE:
+            node["scale"] = list(_y_up_scale(plan.scale(index)))
+            node["mesh"] = 0
+        nodes.append(node)
+        parent = plan.parents[index]
+        if parent >= 0:
+            nodes[parent].setdefault("children", []).append(index)  # type: ignore[union-attr]
+        else:
+            roots.append(index)
+
+    document: Dict[str, object] = {
+        "asset": {"version": "2.0", "generator": GENERATOR},
+        "scene": 0,
+        "scenes": [{"name": plan.assetId, "nodes": roots, "extras": {"archetype": plan.archetype}}],
+        "nodes": nodes,
+        "meshes": [
+            {
+                "name": UNIT_CUBE_NAME,
+                "primitives": [{"attributes": {"POSITION": 0, "NORMAL": 1}, "indices": 2}],
+            }
+        ],
+        "accessors": [
+            {
+                "bufferView": 0,
+                "componentType": GL_FLOAT,
+                "count": vertex_count,
+                "type": "VEC3",
+                "min": [-0.5, -0.5, -0.5],
+                "max": [0.5, 0.5, 0.5],
+            },
+            {
+                "bufferView": 0,
+                "byteOffset": vector_bytes,
+                "componentType": GL_FLOAT,
+                "count": vertex_count,
+                "type": "VEC3",
+            },
+            {"bufferView": 1, "componentType": GL_UNSIGNED_SHORT, "count": index_count, "type": "SCALAR"},
+        ],
+        "bufferViews": [
+            {"buffer": 0, "byteOffset": 0, "byteLength": vector_bytes * 2, "target": GL_ARRAY_BUFFER},
+            {
+                "buffer": 0,
+                "byteOffset": vector_bytes * 2,
+                "byteLength": index_count * 2,
+                "target": GL_ELEMENT_ARRAY_BUFFER,
+            },
+        ],
+        "buffers": [{"byteLength": len(buffer)}],
+    }
+    return document, buffer
+
+
+def write_glb_document(document: Mapping[str, object], buffer: bytes, output_path: str) -> None:
+    """Write a glTF document and its 4-byte aligned binary buffer as one `.glb`."""
+    json_chunk = json.dumps(document, separators=(",", ":")).encode("utf-8")
+    json_chunk += b" " * (-len(json_chunk) % 4)
+    total = 12 + 8 + len(json_chunk) + 8 + len(buffer)
+    with open(output_path, "wb") as handle:
+        handle.write(struct.pack("<III", GLB_MAGIC, 2, total))
+        handle.write(struct.pack("<II", len(json_chunk), GLB_JSON_CHUNK))
+        handle.write(json_chunk)
+        handle.write(struct.pack("<II", len(buffer), GLB_BIN_CHUNK))
+        handle.write(buffer)
+
+
+def write_glb(plan: RealisationPlan, output_path: str) -> None:
+    write_glb_document(*build_gltf(plan), output_path)
+
+
+def write_gltf(plan: RealisationPlan, output_path: str) -> None:
+    document, buffer = build_gltf(plan)
+    encoded = base64.b64encode(buffer).decode("ascii")
+    uri = f"data:application/octet-stream;base64,{encoded}"
+    document["buffers"] = [{"byteLength": len(buffer), "uri": uri}]
+    with open(output_path, "w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=2)
+
+
+def write_obj(plan: RealisationPlan, output_path: str) -> None:
+    lines = [f"# {GENERATOR}", f"# {plan.assetId} ({plan.archetype})"]
+    lines.extend("vn {:g} {:g} {:g}".format(*_y_up(normal)) for normal, _ in CUBE_FACES)
+    vertex_base = 0
+    for index, (location, scale) in enumerate(plan.world_transforms()):
+        if plan.kinds[index] != KIND_CUBE:
+            continue
+        lines.append(f"o {plan.names[index]}")
+        for corner in CUBE_CORNERS:
+            world = tuple(location[axis] + scale[axis] * corner[axis] for axis in range(3))
+            coordinates = _y_up(world)  # type: ignore[arg-type]
+            lines.append("v " + " ".join(f"{value:.{OBJ_PRECISION}f}" for value in coordinates))
+        for normal_index, (_, corners) in enumerate(CUBE_FACES, start=1):
+            face = (f"{vertex_base + corner + 1}//{normal_index}" for corner in corners)
+            lines.append("f " + " ".join(face))
+        vertex_base += len(CUBE_CORNERS)
+    with open(output_path, "w", encoding="utf-8") as handle:
+        handle.write("\n".join(lines) + "\n")
+
+
+WRITERS: Dict[str, Callable[[RealisationPlan, str], None]] = {
+    ".glb": write_glb,
+    ".gltf": write_gltf,
+    ".obj": write_obj,
+}
+
+
+def export_realisation(
+    input_dict: Mapping[str, object],
+    output_path: str,
+    lods: bool = False,
+) -> Dict[str, object]:
+    """
+    Realise `input_dict` into `output_path`; the extension picks the format.
+    With `lods`, the LOD chain is written alongside (`lod_chain.write_lod_chain`).
+    Returns the output path, object count, ergonomics report and LOD summary.
+    """
+    extension = os.path.splitext(output_path)[1].lower()
+    writer = WRITERS.get(extension)
+    if writer is None:
+        expected = ", ".join(WRITERS)
+        raise ValueError(f"Unsupported export format '{extension}' (expected one of {expected})")
+    plan, report = realise_plan(input_dict)
+    writer(plan, output_path)
+    result: Dict[str, object] = {"output": output_path, "objectCount": len(plan), "ergonomics": report}
+    if lods:
+        from .lod_chain import write_lod_chain
+
+        result["lods"] = write_lod_chain(input_dict, output_path)
+    return result
@@ -0,0 +1,544 @@
+"""
+Pure-Python planning stage for the Blender realisers.
+
+A plan is every object a realiser will create, in creation order, as parallel
+arrays: names, parent indices, kinds (anchor empty or unit cube), locations and
+scales. Planning needs neither Blender nor NumPy, so layouts can be computed,
+serialised and diffed anywhere; `blender_plan_applier.apply_plan` turns a plan
+into `bpy` objects.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .blender_debug_adapter import debug_adapter_summary
+
+KIND_EMPTY = 0
+KIND_CUBE = 1
+
+REALISER_TOLERANCE = 0.002  # 2mm structural clearance
+
+CHAIR_PART_SPACING = 2.0
+CHAIR_SEAT_HEIGHT = 1.0
+CHAIR_BACK_OFFSET = -1.0
+CHAIR_SUPPORT_SPACING = 1.0
+CHAIR_PART_OBJECT_COUNTS = {
+    "supports": 4,
+}
+CHAIR_SEAT_THICKNESS_RATIO = 0.08  # of seatWidth
+CHAIR_BACK_WIDTH_RATIO = 0.9  # of seatWidth
+CHAIR_BACK_THICKNESS_RATIO = 0.8  # of the seat thickness
+CHAIR_SUPPORT_INSET_RATIO = 0.015  # of seatWidth
+
+TABLE_PART_SPACING = 2.0
+TABLE_PART_OBJECT_COUNTS = {
+    "supports": 4,
+}
+TABLE_LEG_THICKNESS_RATIO = 0.05  # of surfaceWidth
+TABLE_SURFACE_THICKNESS_RATIO = 0.08  # of min(surfaceWidth, surfaceDepth)
+
+BED_PART_SPACING = 2.0
+BED_PART_OBJECT_COUNTS = {
+    "frame": 4,
+}
+BED_LEG_THICKNESS_RATIO = 0.05  # of sleepingWidth
+BED_BACK_THICKNESS_RATIO = 0.8  # of mattressThickness
+BED_HEADBOARD_WIDTH_RATIO = 0.6  # of sleepingWidth
+
+SUPPORT_INSET = REALISER_TOLERANCE * 5  # table and bed legs
+
+Vector3 = Tuple[float, float, float]
+
+
+@dataclass
+class RealisationPlan:
+    assetId: str
+    archetype: str
+    names: List[str] = field(default_factory=list)
+    parents: array = field(default_factory=lambda: array("i"))
+    kinds: array = field(default_factory=lambda: array("b"))
+    locations: array = field(default_factory=lambda: array("d"))
+    scales: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(
+        self,
+        name: str,
+        kind: int,
+        location: Vector3,
+        scale: Vector3 = (1.0, 1.0, 1.0),
+        parent: int = -1,
+    ) -> int:
+        self.names.append(name)
+        self.parents.append(parent)
+        self.kinds.append(kind)
+        self.locations.extend(location)
+        self.scales.extend(scale)
+        return len(self.names) - 1
+
+    def location(self, index: int) -> Vector3:
+        return tuple(self.locations[index * 3 : index * 3 + 3])  # type: ignore[return-value]
+
+    def scale(self, index: int) -> Vector3:
+        return tuple(self.scales[index * 3 : index * 3 + 3])  # type: ignore[return-value]
+
+    def rows(self) -> Iterator[Tuple[int, str, int, int, Vector3, Vector3]]:
+        for index, name in enumerate(self.names):
+            location = self.location(index)
+            yield index, name, self.kinds[index], self.parents[index], location, self.scale(index)
+
+    def world_transforms(self) -> List[Tuple[Vector3, Vector3]]:
+        """(location, scale) of every object in world space; parents always precede children."""
+        world: List[Tuple[Vector3, Vector3]] = []
+        for index in range(len(self.names)):
+            location = self.location(index)
+            scale = self.scale(index)
+            parent = self.parents[index]
+            if parent >= 0:
+                (px, py, pz), (psx, psy, psz) = world[parent]
+                location = (px + psx * location[0], py + psy * location[1], pz + psz * location[2])
+                scale = (psx * scale[0], psy * scale[1], psz * scale[2])
+            world.append((location, scale))
+        return world
+
+    def part_ranges(self) -> List[Tuple[str, int, int]]:
+        """Consecutive runs of objects belonging to one part, as (part_id, start, stop)."""
+        ranges: List[Tuple[str, int, int]] = []
+        for index, name in enumerate(self.names):
+            pieces = name.split("::")
+            part_id = pieces[-2] if len(pieces) >= 3 else ""
+            if ranges and ranges[-1][0] == part_id:
+                ranges[-1] = (part_id, ranges[-1][1], index + 1)
+            else:
+                ranges.append((part_id, index, index + 1))
+        return ranges
+
+    def part_indices(self) -> Dict[str, List[int]]:
+        """Object indices of every part, in creation order (a part may span several ranges)."""
+        parts: Dict[str, List[int]] = {}
+        for part_id, start, stop in self.part_ranges():
+            parts.setdefault(part_id, []).extend(range(start, stop))
+        return parts
+
+    def part_fingerprints(self) -> Dict[str, str]:
+        """Hash of each part's planned objects (names, kinds, parents, transforms)."""
+        fingerprints: Dict[str, str] = {}
+        for part_id, indices in self.part_indices().items():
+            rows = [
+                [
+                    self.names[index],
+                    self.kinds[index],
+                    self.names[self.parents[index]] if self.parents[index] >= 0 else None,
+                    self.location(index),
+                    self.scale(index),
+                ]
+                for index in indices
+            ]
+            canonical = json.dumps(rows, separators=(",", ":"))
+            fingerprints[part_id] = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return fingerprints
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "assetId": self.assetId,
+            "archetype": self.archetype,
+            "names": list(self.names),
+            "parents": self.parents.tolist(),
+            "kinds": self.kinds.tolist(),
+            "locations": self.locations.tolist(),
+            "scales": self.scales.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, object]) -> "RealisationPlan":
+        return cls(
+            assetId=str(data["assetId"]),
+            archetype=str(data["archetype"]),
+            names=list(data["names"]),  # type: ignore[arg-type]
+            parents=array("i", data["parents"]),  # type: ignore[arg-type]
+            kinds=array("b", data["kinds"]),  # type: ignore[arg-type]
+            locations=array("d", data["locations"]),  # type: ignore[arg-type]
+            scales=array("d", data["scales"]),  # type: ignore[arg-type]
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+
+    def fingerprint(self) -> str:
+        return hashlib.sha256(self.to_json().encode("utf-8")).hexdigest()
+
+
+def _get_number(value: object) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+def _support_positions(
+    width: Optional[float],
+    depth: Optional[float],
+    leg_thickness: Optional[float],
+    inset: float,
+) -> Optional[List[Tuple[float, float]]]:
+    if width is None or depth is None or leg_thickness is None:
+        return None
+    half_w = width / 2
+    half_d = depth / 2
+    half_leg = leg_thickness / 2
+    return [
+        (-half_w + half_leg + inset, -half_d + half_leg + inset),
+        (half_w - half_leg - inset, -half_d + half_leg + inset),
+        (-half_w + half_leg + inset, half_d - half_leg - inset),
+        (half_w - half_leg - inset, half_d - half_leg - inset),
+    ]
+
+
+def _add_part_objects(
+    plan: RealisationPlan,
+    anchor: int,
+    part_id: str,
+    object_count: int,
+    support_part_id: str,
+    support_positions: Optional[List[Tuple[float, float]]],
+    support_spacing: Optional[float],
+    part_scale: Optional[Vector3],
+    part_offset_z: Callable[[Vector3], float],
+) -> None:
+    """Sub-object placement shared by every archetype: `assetId::part::index`."""
+    for sub_index in range(object_count):
+        location_x = 0.0
+        offset_y = 0.0
+        if part_id == support_part_id and support_positions is not None:
+            if sub_index < len(support_positions):
+                location_x, offset_y = support_positions[sub_index]
+        elif part_id == support_part_id and support_spacing is not None:
+            offset_y = sub_index * support_spacing
+
+        scale: Vector3 = (1.0, 1.0, 1.0)
+        offset_z = 0.0
+        if part_scale is not None:
+            scale = part_scale
+            offset_z = part_offset_z(part_scale)
+
+        plan.add(
+            f"{plan.assetId}::{part_id}::{sub_index}",
+            KIND_CUBE,
+            (location_x, offset_y, offset_z),
+            scale,
+            parent=anchor,
+        )
+
+
+def plan_chair(input_dict: Mapping[str, object]) -> RealisationPlan:
+    summary = debug_adapter_summary(input_dict)
+    plan = RealisationPlan(assetId=summary.assetId, archetype=summary.archetype)
+    physical = input_dict.get("physical")
+
+    seat_width_value: Optional[float] = None
+    seat_depth_value: Optional[float] = None
+    leg_thickness_value: Optional[float] = None
+    back_thickness_value: Optional[float] = None
+    seat_scale: Optional[Vector3] = None
+    back_scale: Optional[Vector3] = None
+    support_scale: Optional[Vector3] = None
+    seat_height_value: Optional[float] = None
+
+    if isinstance(physical, Mapping):
+        seat_width = _get_number(physical.get("seatWidth"))
+        seat_depth = _get_number(physical.get("seatDepth"))
+        seat_width_value = seat_width
+        seat_depth_value = seat_depth
+        footprint_width: Optional[float] = None
+        footprint = physical.get("footprint")
+        if isinstance(footprint, Mapping):
+            footprint_width = _get_number(footprint.get("width"))
+        total_height = _get_number(physical.get("totalHeight"))
+        seat_height = _get_number(physical.get("seatHeight"))
+        seat_height_value = seat_height
+
+        leg_thickness = None
+        if footprint_width is not None and seat_width is not None:
+            leg_thickness = (footprint_width - seat_width) / 2
+            leg_thickness_value = leg_thickness
+
+        seat_thickness = None
+        if seat_width is not None:
+            seat_thickness = seat_width * CHAIR_SEAT_THICKNESS_RATIO
+
+        back_width = None
+        back_thickness = None
+        back_height = None
+        if seat_width is not None:
+            back_width = seat_width * CHAIR_BACK_WIDTH_RATIO
+        if seat_thickness is not None:
+            back_thickness = seat_thickness * CHAIR_BACK_THICKNESS_RATIO
+            back_thickness_value = back_thickness
+        if total_height is not None and seat_height is not None:
+            back_height = total_height - seat_height
+
+        if seat_width is not None and seat_depth is not None and seat_thickness is not None:
+            seat_scale = (seat_width, seat_depth, seat_thickness)
+        if leg_thickness is not None and seat_height is not None:
+            support_scale = (leg_thickness, leg_thickness, seat_height - REALISER_TOLERANCE)
+        if back_width is not None and back_thickness is not None and back_height is not None:
+            back_scale = (back_width, back_thickness, back_height)
+
+    support_positions = None
+    if seat_width_value is not None:
+        support_positions = _support_positions(
+            seat_width_value,
+            seat_depth_value,
+            leg_thickness_value,
+            seat_width_value * CHAIR_SUPPORT_INSET_RATIO,
+        )
+
+    def _seat_offset_z(scale: Vector3) -> float:
+        if seat_height_value is not None:
+            return seat_height_value + (scale[2] / 2)
+        return -scale[2] / 2
+
+    for index, part in enumerate(summary.parts):
+        base_x = index * CHAIR_PART_SPACING
+        base_y = 0.0
+        base_z = 0.0
+
+        if seat_depth_value is not None and back_thickness_value is not None:
+            if part.id == "seat":
+                base_x = 0.0
+            elif part.id == "back":
+                base_x = 0.0
+                base_y = (seat_depth_value / 2) - (back_thickness_value / 2)
+            elif part.id == "supports" and support_positions is not None:
+                base_x = 0.0
+        elif part.id == "seat":
+            base_z = CHAIR_SEAT_HEIGHT
+        elif part.id == "back":
+            base_z = CHAIR_SEAT_HEIGHT
+            base_y = CHAIR_BACK_OFFSET
+
+        anchor = plan.add(f"{plan.assetId}::{part.id}::ANCHOR", KIND_EMPTY, (base_x, base_y, base_z))
+
+        part_scale: Optional[Vector3] = None
+        part_offset_z: Callable[[Vector3], float] = lambda scale: scale[2] / 2
+        if part.id == "seat":
+            part_scale = seat_scale
+            part_offset_z = _seat_offset_z
+        elif part.id == "back":
+            part_scale = back_scale
+        elif part.id == "supports":
+            part_scale = support_scale
+
+        _add_part_objects(
+            plan,
+            anchor,
+            part.id,
+            CHAIR_PART_OBJECT_COUNTS.get(part.id, 1),
+            "supports",
+            support_positions,
+            CHAIR_SUPPORT_SPACING,
+            part_scale,
+            part_offset_z,
+        )
+
+    return plan
+
+
+def plan_table(input_dict: Mapping[str, object]) -> RealisationPlan:
+    summary = debug_adapter_summary(input_dict)
+    plan = RealisationPlan(assetId=summary.assetId, archetype=summary.archetype)
+    physical = input_dict.get("physical")
+
+    surface_scale: Optional[Vector3] = None
+    support_scale: Optional[Vector3] = None
+    surface_height_value: Optional[float] = None
+    surface_width_value: Optional[float] = None
+    surface_depth_value: Optional[float] = None
+    leg_thickness_value: Optional[float] = None
+
+    if isinstance(physical, Mapping):
+        surface_width = _get_number(physical.get("surfaceWidth"))
+        surface_depth = _get_number(physical.get("surfaceDepth"))
+        surface_height = _get_number(physical.get("surfaceHeight"))
+
+        surface_width_value = surface_width
+        surface_depth_value = surface_depth
+        surface_height_value = surface_height
+
+        if surface_width is not None:
+            leg_thickness_value = surface_width * TABLE_LEG_THICKNESS_RATIO
+        if surface_width is not None and surface_depth is not None:
+            surface_thickness = min(surface_width, surface_depth) * TABLE_SURFACE_THICKNESS_RATIO
+            surface_scale = (surface_width, surface_depth, surface_thickness)
+        if leg_thickness_value is not None and surface_height is not None:
+            support_scale = (
+                leg_thickness_value,
+                leg_thickness_value,
+                surface_height - REALISER_TOLERANCE,
+            )
+
+    support_positions = _support_positions(
+        surface_width_value,
+        surface_depth_value,
+        leg_thickness_value,
+        SUPPORT_INSET,
+    )
+
+    def _surface_offset_z(scale: Vector3) -> float:
+        if surface_height_value is not None:
+            return surface_height_value + (scale[2] / 2)
+        return 0.0
+
+    for index, part in enumerate(summary.parts):
+        base_x = index * TABLE_PART_SPACING
+        if part.id == "surface":
+            base_x = 0.0
+        elif part.id == "supports" and support_positions is not None:
+            base_x = 0.0
+
+        anchor = plan.add(f"{plan.assetId}::{part.id}::ANCHOR", KIND_EMPTY, (base_x, 0.0, 0.0))
+
+        part_scale: Optional[Vector3] = None
+        part_offset_z: Callable[[Vector3], float] = lambda scale: scale[2] / 2
+        if part.id == "surface":
+            part_scale = surface_scale
+            part_offset_z = _surface_offset_z
+        elif part.id == "supports":
+            part_scale = support_scale
+
+        _add_part_objects(
+            plan,
+            anchor,
+            part.id,
+            TABLE_PART_OBJECT_COUNTS.get(part.id, 1),
+            "supports",
+            support_positions,
+            None,
+            part_scale,
+            part_offset_z,
+        )
+
+    return plan
+
+
+def plan_bed(input_dict: Mapping[str, object]) -> RealisationPlan:
+    summary = debug_adapter_summary(input_dict)
+    plan = RealisationPlan(assetId=summary.assetId, archetype=summary.archetype)
+    physical = input_dict.get("physical")
+
+    surface_scale: Optional[Vector3] = None
+    support_scale: Optional[Vector3] = None
+    headboard_scale: Optional[Vector3] = None
+    surface_height_value: Optional[float] = None
+    surface_width_value: Optional[float] = None
+    surface_depth_value: Optional[float] = None
+    leg_thickness_value: Optional[float] = None
+    back_thickness_value: Optional[float] = None
+
+    if isinstance(physical, Mapping):
+        surface_width = _get_number(physical.get("sleepingWidth"))
+        surface_depth = _get_number(physical.get("sleepingLength"))
+        sleeping_height = _get_number(physical.get("sleepingHeight"))
+        total_height = _get_number(physical.get("totalHeight"))
+        mattress_thickness = _get_number(physical.get("mattressThickness"))
+        clearance_under = _get_number(physical.get("clearanceUnder"))
+
+        surface_width_value = surface_width
+        surface_depth_value = surface_depth
+
+        if surface_width is not None:
+            leg_thickness_value = surface_width * BED_LEG_THICKNESS_RATIO
+        if mattress_thickness is not None:
+            back_thickness_value = mattress_thickness * BED_BACK_THICKNESS_RATIO
+        if sleeping_height is not None:
+            surface_height_value = sleeping_height - (mattress_thickness or 0.0)
+        if surface_width is not None and surface_depth is not None and mattress_thickness is not None:
+            surface_scale = (surface_width, surface_depth, mattress_thickness)
+        if leg_thickness_value is not None and clearance_under is not None:
+            support_scale = (
+                leg_thickness_value,
+                leg_thickness_value,
+                clearance_under - REALISER_TOLERANCE,
+            )
+        if total_height is not None and sleeping_height is not None:
+            headboard_height = total_height - sleeping_height
+            if surface_width is not None and back_thickness_value is not None and headboard_height > 0:
+                headboard_scale = (
+                    surface_width * BED_HEADBOARD_WIDTH_RATIO,
+                    back_thickness_value,
+                    headboard_height,
+                )
+
+    support_positions = _support_positions(
+        surface_width_value,
+        surface_depth_value,
+        leg_thickness_value,
+        SUPPORT_INSET,
+    )
+
+    def _surface_offset_z(scale: Vector3) -> float:
+        if surface_height_value is not None:
+            return surface_height_value + (scale[2] / 2)
+        return 0.0
+
+    for index, part in enumerate(summary.parts):
+        base_x = index * BED_PART_SPACING
+        if part.id == "sleepSurface":
+            base_x = 0.0
+        elif part.id == "frame" and support_positions is not None:
+            base_x = 0.0
+
+        anchor = plan.add(f"{plan.assetId}::{part.id}::ANCHOR", KIND_EMPTY, (base_x, 0.0, 0.0))
+
+        part_scale: Optional[Vector3] = None
+        part_offset_z: Callable[[Vector3], float] = lambda scale: scale[2] / 2
+        if part.id == "sleepSurface":
+            part_scale = surface_scale
+            part_offset_z = _surface_offset_z
+        elif part.id == "frame":
+            part_scale = support_scale
+
+        _add_part_objects(
+            plan,
+            anchor,
+            part.id,
+            BED_PART_OBJECT_COUNTS.get(part.id, 1),
+            "frame",
+            support_positions,
+            None,
+            part_scale,
+            part_offset_z,
+        )
+
+    if headboard_scale is not None:
+        base_y = 0.0
+        if surface_depth_value is not None and back_thickness_value is not None:
+            base_y = (surface_depth_value / 2) + (back_thickness_value / 2)
+        base_z = 0.0
+        if surface_height_value is not None:
+            surface_thickness = surface_scale[2] if surface_scale is not None else 0.0
+            base_z = surface_height_value + surface_thickness + (headboard_scale[2] / 2)
+        plan.add(f"{plan.assetId}::frame::HEADBOARD", KIND_CUBE, (0.0, base_y, base_z), headboard_scale)
+
+    return plan
+
+
+PLANNER_REGISTRY: Dict[str, Callable[[Mapping[str, object]], RealisationPlan]] = {
+    "chair": plan_chair,
+    "table": plan_table,
+    "bed": plan_bed,
+}
+
+
+def plan_realisation(input_dict: Mapping[str, object]) -> RealisationPlan:
+    archetype = input_dict.get("archetype")
+    planner = PLANNER_REGISTRY.get(archetype)  # type: ignore[arg-type]
+    if not planner:
+        raise RuntimeError(f"Unsupported archetype: {archetype}")
+    return planner(input_dict)
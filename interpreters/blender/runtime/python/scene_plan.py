@@ -0,0 +1,231 @@
+"""
+Pure-Python planning for whole scenes: which distinct adapter inputs must be
+realised, and where each placement of them goes.
+
+A scene placements file lists every placed asset with its transform:
+
+    {
+      "sceneId": "cafe",
+      "sources": {"chair": "chair_input.json"},
+      "placements": [
+        {"id": "chair_001", "source": "chair", "location": [1, 2, 0], "rotation": 90, "zone": "terrace"},
+        {"id": "table_001", "input": "table_input.json", "location": [0, 0, 0]}
+      ]
+    }
+
+A placement names its asset with `source` (a key of `sources`), `input` (an
+adapter input path) or an inline `adapterInput`. `rotation` is in degrees:
+one number turns about Z, three are an XYZ Euler. `scale` is one number or
+three. Relative paths resolve against the placements file.
+
+Identical adapter inputs collapse to one source, keyed by a hash of their
+canonical JSON, however they were referenced.
+
+Large scenes can be split into spatial chunks (`split_chunks`), by zone or by
+a square grid on the XY plane, each a self-contained `ScenePlan`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Mapping, Optional, Tuple
+
+Vector3 = Tuple[float, float, float]
+
+DEFAULT_ZONE = "default"
+
+CHUNK_ZONE = "zone"
+CHUNK_GRID = "grid"
+CHUNK_MODES = (CHUNK_ZONE, CHUNK_GRID)
+DEFAULT_CELL_SIZE = 20.0
+
+_UNSAFE_CHUNK_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def source_key(adapter_input: Mapping[str, object]) -> str:
+    canonical = json.dumps(adapter_input, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class Placement:
+    id: str
+    source: str
+    location: Vector3 = (0.0, 0.0, 0.0)
+    rotation: Vector3 = (0.0, 0.0, 0.0)  # radians, XYZ Euler
+    scale: Vector3 = (1.0, 1.0, 1.0)
+    zone: str = DEFAULT_ZONE
+    floor: Optional[str] = None
+
+
+@dataclass
+class ScenePlan:
+    sceneId: str
+    sources: Dict[str, Mapping[str, object]] = field(default_factory=dict)
+    placements: List[Placement] = field(default_factory=list)
+
+    def instance_counts(self) -> Dict[str, int]:
+        counts = {key: 0 for key in self.sources}
+        for placement in self.placements:
+            counts[placement.source] += 1
+        return counts
+
+    def source_asset_ids(self) -> Dict[str, str]:
+        """
+        Asset id each source is realised under. Distinct inputs that share an
+        assetId get `~2`, `~3`, ... suffixes in first-placement order so their
+        collections do not collide.
+        """
+        seen: Dict[str, int] = {}
+        asset_ids: Dict[str, str] = {}
+        for key, adapter_input in self.sources.items():
+            asset_id = str(adapter_input.get("assetId"))
+            seen[asset_id] = seen.get(asset_id, 0) + 1
+            asset_ids[key] = asset_id if seen[asset_id] == 1 else f"{asset_id}~{seen[asset_id]}"
+        return asset_ids
+
+    def fingerprint(self) -> str:
+        """Hash of everything realised: sources and placements, in order."""
+        canonical = json.dumps(
+            {"sources": self.sources, "placements": [asdict(placement) for placement in self.placements]},
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _vector(value: object, default: float, label: str) -> Vector3:
+    if value is None:
+        return (default, default, default)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (float(value), float(value), float(value))
+    if isinstance(value, (list, tuple)) and len(value) == 3:
+        return (float(value[0]), float(value[1]), float(value[2]))
+    raise ValueError(f"Placement '{label}' must be a number or three numbers.")
+
+
+def _rotation(value: object) -> Vector3:
+    if value is None:
+        return (0.0, 0.0, 0.0)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0.0, 0.0, math.radians(value))
+    degrees = _vector(value, 0.0, "rotation")
+    return (math.radians(degrees[0]), math.radians(degrees[1]), math.radians(degrees[2]))
+
+
+def _load_json(path: str, base_dir: Optional[str]) -> Mapping[str, object]:
+    if base_dir and not os.path.isabs(path):
+        path = os.path.join(base_dir, path)
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _resolve_input(value: object, base_dir: Optional[str], label: str) -> Mapping[str, object]:
+    if isinstance(value, str):
+        value = _load_json(value, base_dir)
+    if not isinstance(value, Mapping):
+        raise ValueError(f"{label} must be an adapter input object or a path to one.")
+    return value
+
+
+def plan_scene(scene: Mapping[str, object], base_dir: Optional[str] = None) -> ScenePlan:
+    scene_id = scene.get("sceneId")
+    if not isinstance(scene_id, str) or not scene_id:
+        raise ValueError("Scene placements need a 'sceneId'.")
+    placements = scene.get("placements")
+    if not isinstance(placements, list):
+        raise ValueError("Scene placements need a 'placements' list.")
+
+    named_sources = scene.get("sources") or {}
+    if not isinstance(named_sources, Mapping):
+        raise ValueError("Scene 'sources' must map names to adapter inputs.")
+    named_keys: Dict[str, str] = {}
+
+    plan = ScenePlan(sceneId=scene_id)
+
+    def _add_source(adapter_input: Mapping[str, object]) -> str:
+        key = source_key(adapter_input)
+        plan.sources.setdefault(key, adapter_input)
+        return key
+
+    for index, entry in enumerate(placements):
+        if not isinstance(entry, Mapping):
+            raise ValueError(f"Placement {index} must be an object.")
+        placement_id = str(entry.get("id") or f"placement_{index:04d}")
+        if "source" in entry:
+            name = str(entry["source"])
+            if name not in named_sources:
+                raise ValueError(f"Placement '{placement_id}' names unknown source '{name}'.")
+            if name not in named_keys:
+                source = _resolve_input(named_sources[name], base_dir, f"Source '{name}'")
+                named_keys[name] = _add_source(source)
+            key = named_keys[name]
+        elif "adapterInput" in entry:
+            key = _add_source(_resolve_input(entry["adapterInput"], base_dir, f"Placement '{placement_id}'"))
+        elif "input" in entry:
+            key = _add_source(_resolve_input(entry["input"], base_dir, f"Placement '{placement_id}'"))
+        else:
+            raise ValueError(f"Placement '{placement_id}' needs a 'source', 'input' or 'adapterInput'.")
+
+        floor = entry.get("floor")
+        plan.placements.append(
+            Placement(
+                id=placement_id,
+                source=key,
+                location=_vector(entry.get("location"), 0.0, "location"),
+                rotation=_rotation(entry.get("rotation")),
+                scale=_vector(entry.get("scale"), 1.0, "scale"),
+                zone=str(entry.get("zone") or DEFAULT_ZONE),
+                floor=str(floor) if floor is not None else None,
+            )
+        )
+
+    ids = [placement.id for placement in plan.placements]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Placement ids must be unique within a scene.")
+    return plan
+
+
+def chunk_id(placement: Placement, mode: str = CHUNK_ZONE, cell_size: float = DEFAULT_CELL_SIZE) -> str:
+    """File-name-safe chunk id: `zone_<zone>` or `grid_<ix>_<iy>` (cells of `cell_size` on X/Y)."""
+    if mode == CHUNK_ZONE:
+        return "zone_" + _UNSAFE_CHUNK_CHARS.sub("_", placement.zone)
+    if mode == CHUNK_GRID:
+        if cell_size <= 0:
+            raise ValueError("Grid cell size must be positive.")
+        column = math.floor(placement.location[0] / cell_size)
+        row = math.floor(placement.location[1] / cell_size)
+        return f"grid_{column}_{row}"
+    raise ValueError(f"Unsupported chunk mode: {mode} (expected one of {', '.join(CHUNK_MODES)})")
+
+
+def split_chunks(
+    plan: ScenePlan,
+    mode: str = CHUNK_ZONE,
+    cell_size: float = DEFAULT_CELL_SIZE,
+) -> Dict[str, ScenePlan]:
+    """
+    Split `plan` into one plan per chunk, in first-placement order. Each chunk
+    plan is named `sceneId::chunkId` and carries only the sources it places.
+    """
+    chunks: Dict[str, ScenePlan] = {}
+    for placement in plan.placements:
+        identifier = chunk_id(placement, mode, cell_size)
+        chunk = chunks.get(identifier)
+        if chunk is None:
+            chunk = chunks[identifier] = ScenePlan(sceneId=f"{plan.sceneId}::{identifier}")
+        chunk.sources.setdefault(placement.source, plan.sources[placement.source])
+        chunk.placements.append(placement)
+    return chunks
+
+
+def load_scene(path: str) -> ScenePlan:
+    with open(path, "r", encoding="utf-8") as handle:
+        scene = json.load(handle)
+    return plan_scene(scene, os.path.dirname(os.path.abspath(path)))
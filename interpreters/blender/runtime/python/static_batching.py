@@ -0,0 +1,437 @@
+"""
+Blender-free static batching for whole scenes.
+
+Every part object of every placement is baked into world space and merged
+into batches that share a material, a grid cell (by placement location, as in
+`scene_plan.chunk_id`) and stay under a vertex limit, so a scene of thousands
+of assets draws as a handful of meshes. Each batch keeps a lookup table from
+its vertex/triangle ranges back to `placementId` and `assetId::part::index`,
+so picking, culling and per-object edits still resolve to realised objects.
+
+Layout comes from `plan_export.realise_plan`, so transforms match the `.blend`
+and glTF outputs. Realisers assign no materials; the batch key is a part's
+optional `material` entry in the adapter input, else `DEFAULT_MATERIAL`.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from .blender_bounds import UNIT_CUBE_NAME
+from .plan_export import (
+    CUBE_CORNERS,
+    CUBE_FACES,
+    GENERATOR,
+    GL_ARRAY_BUFFER,
+    GL_ELEMENT_ARRAY_BUFFER,
+    GL_FLOAT,
+    GL_UNSIGNED_INT,
+    GL_UNSIGNED_SHORT,
+    realise_plan,
+    write_glb_document,
+)
+from .realisation_plan import KIND_CUBE
+from .scene_plan import DEFAULT_CELL_SIZE, Placement, ScenePlan
+
+DEFAULT_MATERIAL = "default"
+DEFAULT_VERTEX_LIMIT = 65535  # fits uint16 indices
+LOOKUP_SUFFIX = ".lookup.json"
+
+# Z-up (Blender) to Y-up (glTF): (x, y, z) -> (x, z, -y).
+Y_UP = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, -1.0, 0.0]])
+
+
+@dataclass(frozen=True)
+class BatchMesh:
+    """Local geometry shared by instances: (V,3) positions and normals, (T,3) triangles."""
+
+    positions: np.ndarray
+    normals: np.ndarray
+    triangles: np.ndarray
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.positions)
+
+
+def cube_mesh() -> BatchMesh:
+    """The flat-shaded `__unit_cube__` (24 vertices, 12 triangles) in Z-up."""
+    corners = np.array(CUBE_CORNERS, dtype=np.float64)
+    quads = np.array([face for _, face in CUBE_FACES], dtype=np.int64)
+    normals = np.repeat(np.array([normal for normal, _ in CUBE_FACES], dtype=np.float64), 4, axis=0)
+    base = np.arange(len(CUBE_FACES))[:, None] * 4
+    triangles = (base + np.array([[0, 1, 2, 0, 2, 3]])).reshape(-1, 3)
+    return BatchMesh(corners[quads.reshape(-1)], normals, triangles)
+
+
+@dataclass
+class StaticInstances:
+    """Parallel arrays, one row per object to bake: (N,4,4) world matrices, (N,3) anchors."""
+
+    objects: List[str]
+    placements: List[str]
+    materials: List[str]
+    meshes: List[str]
+    matrices: np.ndarray
+    anchors: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+
+@dataclass(frozen=True)
+class Batch:
+    name: str
+    material: str
+    cell: Tuple[int, int]
+    positions: np.ndarray
+    normals: np.ndarray
+    triangles: np.ndarray
+    objects: List[str]
+    placements: List[str]
+    first_vertex: np.ndarray
+    first_triangle: np.ndarray
+
+    def lookup(self) -> Dict[str, object]:
+        """Object `i` owns vertices `firstVertex[i]:firstVertex[i + 1]` (triangles likewise)."""
+        return {
+            "name": self.name,
+            "material": self.material,
+            "cell": list(self.cell),
+            "vertexCount": len(self.positions),
+            "triangleCount": len(self.triangles),
+            "objects": self.objects,
+            "placements": self.placements,
+            "firstVertex": self.first_vertex.tolist(),
+            "firstTriangle": self.first_triangle.tolist(),
+        }
+
+
+def placement_matrix(placement: Placement) -> np.ndarray:
+    """Location @ rotation (Euler XYZ, as Blender applies it) @ scale."""
+    x, y, z = placement.rotation
+    cx, sx, cy, sy, cz, sz = np.cos(x), np.sin(x), np.cos(y), np.sin(y), np.cos(z), np.sin(z)
+    rotate_x = np.array([[1.0, 0.0, 0.0], [0.0, cx, -sx], [0.0, sx, cx]])
+    rotate_y = np.array([[cy, 0.0, sy], [0.0, 1.0, 0.0], [-sy, 0.0, cy]])
+    rotate_z = np.array([[cz, -sz, 0.0], [sz, cz, 0.0], [0.0, 0.0, 1.0]])
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotate_z @ rotate_y @ rotate_x @ np.diag(placement.scale)
+    matrix[:3, 3] = placement.location
+    return matrix
+
+
+def part_material(adapter_input: Mapping[str, object], part_id: str) -> str:
+    parts = adapter_input.get("parts")
+    part = parts.get(part_id) if isinstance(parts, Mapping) else None
+    material = part.get("material") if isinstance(part, Mapping) else None
+    return str(material) if material else DEFAULT_MATERIAL
+
+
+def scene_instances(
+    scene: ScenePlan,
+    material_for: Callable[[Mapping[str, object], str], str] = part_material,
+) -> StaticInstances:
+    """World matrices for every part cube of every placement, in placement order."""
+    asset_ids = scene.source_asset_ids()
+    sources: Dict[str, Tuple[List[str], List[str], np.ndarray]] = {}
+    for key, adapter_input in scene.sources.items():
+        if asset_ids[key] != adapter_input.get("assetId"):
+            adapter_input = {**adapter_input, "assetId": asset_ids[key]}
+        plan, _ = realise_plan(adapter_input)
+        world = plan.world_transforms()
+        cubes = [index for index in range(len(plan)) if plan.kinds[index] == KIND_CUBE]
+        local = np.zeros((len(cubes), 4, 4))
+        local[:, 3, 3] = 1.0
+        for row, index in enumerate(cubes):
+            location, scale = world[index]
+            local[row, :3, :3] = np.diag(scale)
+            local[row, :3, 3] = location
+        names = [plan.names[index] for index in cubes]
+        materials = [material_for(adapter_input, name.split("::")[-2]) for name in names]
+        sources[key] = (names, materials, local)
+
+    objects: List[str] = []
+    placement_ids: List[str] = []
+    materials: List[str] = []
+    blocks: List[np.ndarray] = []
+    anchors: List[np.ndarray] = []
+    for placement in scene.placements:
+        names, source_materials, local = sources[placement.source]
+        objects.extend(names)
+        placement_ids.extend([placement.id] * len(names))
+        materials.extend(source_materials)
+        blocks.append(placement_matrix(placement) @ local)
+        anchors.append(np.repeat(np.array([placement.location], dtype=np.float64), len(names), axis=0))
+
+    return StaticInstances(
+        objects=objects,
+        placements=placement_ids,
+        materials=materials,
+        meshes=[UNIT_CUBE_NAME] * len(objects),
+        matrices=np.concatenate(blocks) if blocks else np.zeros((0, 4, 4)),
+        anchors=np.concatenate(anchors) if anchors else np.zeros((0, 3)),
+    )
+
+
+def assign_batches(
+    materials: Sequence[str],
+    anchors: np.ndarray,
+    vertex_counts: np.ndarray,
+    vertex_limit: int = DEFAULT_VERTEX_LIMIT,
+    cell_size: float = DEFAULT_CELL_SIZE,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Order instances by (material, cell, input order) and split each run at
+    `vertex_limit`. Returns the order, each ordered instance's batch number
+    and the (X, Y) cell of every instance.
+    """
+    if cell_size <= 0:
+        raise ValueError("Batch cell size must be positive.")
+    if len(vertex_counts) and int(vertex_counts.max()) > vertex_limit:
+        raise ValueError(f"A mesh has more than the {vertex_limit} vertex batch limit.")
+    cells = np.floor(anchors[:, :2] / cell_size).astype(np.int64)
+    _, material_codes = np.unique(np.asarray(materials, dtype=object).astype(str), return_inverse=True)
+    order = np.lexsort((np.arange(len(materials)), cells[:, 1], cells[:, 0], material_codes))
+
+    keys = np.stack([material_codes[order], cells[order, 0], cells[order, 1]], axis=1)
+    group_start = np.ones(len(order), dtype=bool)
+    group_start[1:] = np.any(keys[1:] != keys[:-1], axis=1)
+
+    batch_of = np.empty(len(order), dtype=np.int64)
+    batch, filled = -1, 0
+    for position, count in enumerate(vertex_counts[order].tolist()):
+        if group_start[position] or filled + count > vertex_limit:
+            batch, filled = batch + 1, 0
+        filled += count
+        batch_of[position] = batch
+    return order, batch_of, cells
+
+
+def _bake(
+    mesh: BatchMesh,
+    matrices: np.ndarray,
+    positions: np.ndarray,
+    normals: np.ndarray,
+    triangles: np.ndarray,
+    vertex_rows: np.ndarray,
+    triangle_rows: np.ndarray,
+    local_first: np.ndarray,
+) -> None:
+    linear = matrices[:, :3, :3]
+    vertices = np.arange(mesh.vertex_count)
+    moved = np.einsum("nij,vj->nvi", linear, mesh.positions) + matrices[:, None, :3, 3]
+    positions[vertex_rows[:, None] + vertices] = moved
+
+    normal_matrices = np.linalg.inv(linear).transpose(0, 2, 1)
+    baked = np.einsum("nij,vj->nvi", normal_matrices, mesh.normals)
+    normals[vertex_rows[:, None] + vertices] = baked / np.linalg.norm(baked, axis=2, keepdims=True)
+
+    corners = np.broadcast_to(mesh.triangles, (len(matrices),) + mesh.triangles.shape).copy()
+    mirrored = np.linalg.det(linear) < 0
+    corners[mirrored] = corners[mirrored][:, :, ::-1]  # keep faces counter-clockwise under mirroring
+    triangles[triangle_rows[:, None] + np.arange(len(mesh.triangles))] = corners + local_first[:, None, None]
+
+
+def build_batches(
+    instances: StaticInstances,
+    meshes: Mapping[str, BatchMesh],
+    vertex_limit: int = DEFAULT_VERTEX_LIMIT,
+    cell_size: float = DEFAULT_CELL_SIZE,
+    prefix: str = "batch",
+) -> List[Batch]:
+    """Bake `instances` into world-space batches (see `assign_batches`)."""
+    mesh_names = sorted(set(instances.meshes))
+    mesh_codes = np.searchsorted(mesh_names, np.asarray(instances.meshes, dtype=object).astype(str))
+    vertex_counts = np.array([meshes[name].vertex_count for name in mesh_names], dtype=np.int64)
+    vertex_counts = vertex_counts[mesh_codes]
+    triangle_counts = np.array([len(meshes[name].triangles) for name in mesh_names], dtype=np.int64)
+    triangle_counts = triangle_counts[mesh_codes]
+
+    order, batch_of, cells = assign_batches(
+        instances.materials, instances.anchors, vertex_counts, vertex_limit, cell_size
+    )
+    ordered_vertices = vertex_counts[order]
+    ordered_triangles = triangle_counts[order]
+    first_vertex = np.concatenate([[0], np.cumsum(ordered_vertices)])
+    first_triangle = np.concatenate([[0], np.cumsum(ordered_triangles)])
+    batch_count = int(batch_of[-1]) + 1 if len(order) else 0
+    batch_starts = np.searchsorted(batch_of, np.arange(batch_count + 1))
+    # Vertex offset of each ordered instance within its own batch.
+    local_first = first_vertex[:-1] - first_vertex[batch_starts[batch_of]]
+
+    positions = np.empty((first_vertex[-1], 3))
+    normals = np.empty((first_vertex[-1], 3))
+    triangles = np.empty((first_triangle[-1], 3), dtype=np.int64)
+    ordered_codes = mesh_codes[order]
+    for code, name in enumerate(mesh_names):
+        rows = np.flatnonzero(ordered_codes == code)
+        _bake(
+            meshes[name],
+            instances.matrices[order[rows]],
+            positions,
+            normals,
+            triangles,
+            first_vertex[rows],
+            first_triangle[rows],
+            local_first[rows],
+        )
+
+    batches: List[Batch] = []
+    counters: Dict[Tuple[str, int, int], int] = {}
+    for batch in range(batch_count):
+        start, stop = int(batch_starts[batch]), int(batch_starts[batch + 1])
+        rows = order[start:stop]
+        material = str(instances.materials[rows[0]])
+        cell = (int(cells[rows[0], 0]), int(cells[rows[0], 1]))
+        part = counters[(material, *cell)] = counters.get((material, *cell), -1) + 1
+        vertex_slice = slice(int(first_vertex[start]), int(first_vertex[stop]))
+        triangle_slice = slice(int(first_triangle[start]), int(first_triangle[stop]))
+        batches.append(
+            Batch(
+                name=f"{prefix}::{material}::{cell[0]}_{cell[1]}::{part}",
+                material=material,
+                cell=cell,
+                positions=positions[vertex_slice],
+                normals=normals[vertex_slice],
+                triangles=triangles[triangle_slice],
+                objects=[instances.objects[row] for row in rows],
+                placements=[instances.placements[row] for row in rows],
+                first_vertex=first_vertex[start : stop + 1] - first_vertex[start],
+                first_triangle=first_triangle[start : stop + 1] - first_triangle[start],
+            )
+        )
+    return batches
+
+
+def batch_scene(
+    scene: ScenePlan,
+    vertex_limit: int = DEFAULT_VERTEX_LIMIT,
+    cell_size: float = DEFAULT_CELL_SIZE,
+) -> List[Batch]:
+    return build_batches(
+        scene_instances(scene),
+        {UNIT_CUBE_NAME: cube_mesh()},
+        vertex_limit,
+        cell_size,
+        prefix=scene.sceneId,
+    )
+
+
+def build_batched_gltf(scene_id: str, batches: Sequence[Batch]) -> Tuple[Dict[str, object], bytes]:
+    """glTF JSON document and binary buffer: one mesh and node per batch, one material per key."""
+    material_names = sorted({batch.material for batch in batches})
+    chunks: List[bytes] = []
+    offset = 0
+    nodes: List[Dict[str, object]] = []
+    meshes: List[Dict[str, object]] = []
+    accessors: List[Dict[str, object]] = []
+    views: List[Dict[str, object]] = []
+
+    def _view(data: bytes, target: int) -> int:
+        nonlocal offset
+        views.append({"buffer": 0, "byteOffset": offset, "byteLength": len(data), "target": target})
+        padded = data + b"\0" * (-len(data) % 4)
+        chunks.append(padded)
+        offset += len(padded)
+        return len(views) - 1
+
+    for index, batch in enumerate(batches):
+        positions = (batch.positions @ Y_UP.T).astype("<f4") + np.float32(0.0)  # + 0.0 drops -0.0
+        normals = (batch.normals @ Y_UP.T).astype("<f4") + np.float32(0.0)
+        wide = len(batch.positions) > 0xFFFF
+        indices = batch.triangles.astype("<u4" if wide else "<u2")
+        accessors.append(
+            {
+                "bufferView": _view(positions.tobytes(), GL_ARRAY_BUFFER),
+                "componentType": GL_FLOAT,
+                "count": len(positions),
+                "type": "VEC3",
+                "min": positions.min(axis=0).tolist(),
+                "max": positions.max(axis=0).tolist(),
+            }
+        )
+        accessors.append(
+            {
+                "bufferView": _view(normals.tobytes(), GL_ARRAY_BUFFER),
+                "componentType": GL_FLOAT,
+                "count": len(normals),
+                "type": "VEC3",
+            }
+        )
+        accessors.append(
+            {
+                "bufferView": _view(indices.tobytes(), GL_ELEMENT_ARRAY_BUFFER),
+                "componentType": GL_UNSIGNED_INT if wide else GL_UNSIGNED_SHORT,
+                "count": indices.size,
+                "type": "SCALAR",
+            }
+        )
+        meshes.append(
+            {
+                "name": batch.name,
+                "primitives": [
+                    {
+                        "attributes": {"POSITION": 3 * index, "NORMAL": 3 * index + 1},
+                        "indices": 3 * index + 2,
+                        "material": material_names.index(batch.material),
+                    }
+                ],
+            }
+        )
+        nodes.append({"name": batch.name, "mesh": index})
+
+    buffer = b"".join(chunks)
+    document: Dict[str, object] = {
+        "asset": {"version": "2.0", "generator": GENERATOR},
+        "scene": 0,
+        "scenes": [{"name": scene_id, "nodes": list(range(len(nodes)))}],
+        "nodes": nodes,
+        "meshes": meshes,
+        "materials": [{"name": name} for name in material_names],
+        "accessors": accessors,
+        "bufferViews": views,
+        "buffers": [{"byteLength": len(buffer)}],
+    }
+    return document, buffer
+
+
+def lookup_path_for(output_path: str) -> str:
+    return output_path + LOOKUP_SUFFIX
+
+
+def write_batched_scene(
+    scene: ScenePlan,
+    output_path: str,
+    vertex_limit: int = DEFAULT_VERTEX_LIMIT,
+    cell_size: float = DEFAULT_CELL_SIZE,
+) -> Dict[str, object]:
+    """
+    Write `scene` as a batched `.glb` plus its `<output>.lookup.json`.
+    Returns the paths and batch/object/vertex counts.
+    """
+    batches = batch_scene(scene, vertex_limit, cell_size)
+    write_glb_document(*build_batched_gltf(scene.sceneId, batches), output_path)
+
+    lookup_path = lookup_path_for(output_path)
+    with open(lookup_path, "w", encoding="utf-8") as handle:
+        json.dump(
+            {
+                "sceneId": scene.sceneId,
+                "vertexLimit": vertex_limit,
+                "cellSize": cell_size,
+                "batches": [batch.lookup() for batch in batches],
+            },
+            handle,
+            separators=(",", ":"),
+        )
+    return {
+        "output": output_path,
+        "lookup": lookup_path,
+        "batches": len(batches),
+        "objects": sum(len(batch.objects) for batch in batches),
+        "vertices": sum(len(batch.positions) for batch in batches),
+    }
@@ -0,0 +1,164 @@
+"""
+Opt-in span tracing in Chrome/Perfetto trace-event format.
+
+Tracing is off until `enable()` is called (or `ARTWORKFLOW_TRACE` is set when
+the runner starts). While off, `span()` returns a shared no-op context manager,
+so instrumented code pays one global lookup and one call per span.
+
+    with span("save", output=path):
+        ...
+    write_trace(path + ".trace.json")
+
+Open the written file in https://ui.perfetto.dev or chrome://tracing.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+TRACE_ENV = "ARTWORKFLOW_TRACE"
+LAUNCHED_AT_ENV = "ARTWORKFLOW_LAUNCHED_AT"
+TRACE_SUFFIX = ".trace.json"
+
+# Anchor perf_counter to the wall clock once, so spans from different
+# processes (and the launcher's timestamp) share a timeline.
+_EPOCH_OFFSET = time.time() - time.perf_counter()
+
+
+def _now_us() -> float:
+    return (time.perf_counter() + _EPOCH_OFFSET) * 1_000_000
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: Dict[str, object]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self._start = _now_us()
+        return self
+
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        if exc_type is not None:
+            self._args["error"] = getattr(exc_type, "__name__", str(exc_type))
+        self._tracer.complete(self._name, self._start, _now_us() - self._start, self._category, self._args)
+
+
+class Tracer:
+    """Collects complete ("X") events until they are written out."""
+
+    def __init__(self) -> None:
+        self.events: List[Dict[str, object]] = []
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def complete(
+        self,
+        name: str,
+        start_us: float,
+        duration_us: float,
+        category: str = "realise",
+        args: Optional[Dict[str, object]] = None,
+    ) -> None:
+        event: Dict[str, object] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round(start_us, 3),
+            "dur": round(duration_us, 3),
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    def drain(self) -> List[Dict[str, object]]:
+        with self._lock:
+            events, self.events = self.events, []
+        return events
+
+
+_TRACER: Optional[Tracer] = None
+
+
+def enable() -> Tracer:
+    global _TRACER
+    if _TRACER is None:
+        _TRACER = Tracer()
+    return _TRACER
+
+
+def disable() -> None:
+    global _TRACER
+    _TRACER = None
+
+
+def enabled() -> bool:
+    return _TRACER is not None
+
+
+def enabled_from_env() -> bool:
+    return os.environ.get(TRACE_ENV, "").strip().lower() not in ("", "0", "false", "no")
+
+
+def span(name: str, category: str = "realise", **args: object):
+    """Time the enclosed block as one trace event; free when tracing is off."""
+    tracer = _TRACER
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, category, args)
+
+
+def record_launch(name: str = "blender.startup") -> None:
+    """
+    Record process startup as a span, from the `ARTWORKFLOW_LAUNCHED_AT` epoch
+    seconds set by whoever launched Blender up to now.
+    """
+    tracer = _TRACER
+    launched_at = os.environ.get(LAUNCHED_AT_ENV)
+    if tracer is None or not launched_at:
+        return
+    try:
+        start_us = float(launched_at) * 1_000_000
+    except ValueError:
+        return
+    tracer.complete(name, start_us, max(0.0, _now_us() - start_us), "startup")
+
+
+def trace_path_for(output_path: str) -> str:
+    return output_path + TRACE_SUFFIX
+
+
+def write_trace(path: str) -> Optional[str]:
+    """Write and clear the collected events; returns the path, or None when tracing is off."""
+    tracer = _TRACER
+    if tracer is None:
+        return None
+    events = tracer.drain()
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, handle)
+    return path
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from tools.bench import fake_bpy as fake_bpy_module
+
+RUNTIME_PACKAGE = "interpreters.blender.runtime.python"
+
+
+def _drop_runtime_modules() -> None:
+    # Runtime modules bind `bpy` at import time; re-import them per test.
+    for name in [name for name in sys.modules if name.startswith(RUNTIME_PACKAGE + ".blender_")]:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def fake_bpy():
+    _drop_runtime_modules()
+    fake = fake_bpy_module.install()
+    try:
+        yield fake
+    finally:
+        fake_bpy_module.uninstall()
+        _drop_runtime_modules()
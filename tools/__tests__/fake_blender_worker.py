@@ -0,0 +1,79 @@
+"""
+Stand-in for `run_blender.py -- --worker` that needs no Blender.
+
+It speaks the same JSON-lines protocol and writes the adapter input back out as
+the "artefact", plus a stand-in ergonomics sidecar for inputs with `physical`
+values. Behaviour can be steered per job with test-only keys:
+`fakeDelay` (seconds to sleep), `fakeNoise` (seconds to spend emitting
+messages for no job first), `fakeFail` (error message to raise) and
+`fakeCrashOnce` (a marker path; the worker exits abruptly if it is missing).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Dict, Mapping
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from tools.realisation_cache import SIDECAR_SUFFIX  # noqa: E402
+from tools.worker_protocol import encode_line, serve_stream  # noqa: E402
+
+SUPPORTED_ARCHETYPES = ("chair", "table", "bed")
+
+
+def _handle(job: Mapping[str, object]) -> Dict[str, object]:
+    delay = job.get("fakeDelay")
+    if isinstance(delay, (int, float)):
+        time.sleep(delay)
+    noise = job.get("fakeNoise")
+    if isinstance(noise, (int, float)):
+        until = time.monotonic() + noise
+        while time.monotonic() < until:
+            sys.stdout.write(encode_line({"event": "progress"}))
+            sys.stdout.flush()
+            time.sleep(0.05)
+    crash_marker = job.get("fakeCrashOnce")
+    if isinstance(crash_marker, str) and not os.path.exists(crash_marker):
+        with open(crash_marker, "w", encoding="utf-8"):
+            pass
+        os._exit(3)
+    failure = job.get("fakeFail")
+    if isinstance(failure, str):
+        raise RuntimeError(failure)
+
+    adapter_input = job.get("adapterInput")
+    if adapter_input is None:
+        with open(str(job["input"]), "r", encoding="utf-8") as handle:
+            adapter_input = json.load(handle)
+    archetype = adapter_input.get("archetype")
+    if archetype not in SUPPORTED_ARCHETYPES:
+        raise RuntimeError(f"Unsupported archetype: {archetype}")
+
+    output_path = str(job["output"])
+    with open(output_path, "w", encoding="utf-8") as handle:
+        json.dump(adapter_input, handle, sort_keys=True)
+    sidecar_path = output_path + SIDECAR_SUFFIX
+    physical = adapter_input.get("physical")
+    if physical is not None:
+        with open(sidecar_path, "w", encoding="utf-8") as handle:
+            json.dump({"assetId": adapter_input.get("assetId"), "declared": physical}, handle)
+    elif os.path.exists(sidecar_path):
+        os.unlink(sidecar_path)
+    return {
+        "output": output_path,
+        "sidecar": sidecar_path if physical is not None else None,
+        "objectCount": len(adapter_input.get("parts", {})),
+        "fingerprint": hashlib.sha256(json.dumps(adapter_input, sort_keys=True).encode("utf-8")).hexdigest(),
+        "timings": {"realise": 0.0, "save": 0.0},
+    }
+
+
+if __name__ == "__main__":
+    serve_stream(_handle, sys.stdin, sys.stdout)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from tools.bench.bench_realisers import compare, run_benchmarks
+
+
+def test_benchmarks_report_latency_and_object_counts() -> None:
+    report = run_benchmarks(sizes=[1, 3], archetypes=["chair"])
+    by_key = {(result["benchmark"], result["assets"]): result for result in report["results"]}
+
+    realise = by_key[("realise", 3)]
+    assert realise["objects"] == 27
+    assert realise["stats"]["object_created"] == 27
+    assert realise["stats"].get("evaluated_get", 0) == 0
+    assert by_key[("collection_bounds", 3)]["objects"] == 27
+    assert set(by_key) == {
+        (benchmark, size)
+        for benchmark in ("realise", "collection_bounds", "debug_adapter_summary")
+        for size in (1, 3)
+    }
+
+
+def test_compare_flags_per_asset_regressions() -> None:
+    previous = {"results": [{"benchmark": "realise", "archetype": "chair", "assets": 10, "perAssetMs": 1.0}]}
+    current = {"results": [{"benchmark": "realise", "archetype": "chair", "assets": 10, "perAssetMs": 2.0}]}
+    assert len(compare(previous, current)) == 1
+    assert compare(previous, previous) == []
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import json
+import os
+
+from tools.realisation_cache import job_variant
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _input(archetype: str) -> dict:
+    with open(os.path.join(REPO_ROOT, f"{archetype}_input.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def test_library_output_writes_only_the_asset_collection(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_output import save_output
+    from interpreters.blender.runtime.python.blender_table_realiser import realise_table
+
+    leftover = fake_bpy.data.objects.new("leftover", None)
+    fake_bpy.context.scene.collection.objects.link(leftover)
+    adapter_input = _input("table")
+    realise_table(adapter_input)
+    save_output(adapter_input["assetId"], "table.blend", "library", compress=True)
+
+    written = fake_bpy.library_writes["table.blend"]
+    assert "leftover" not in written
+    assert "__unit_cube__" in written
+    assert adapter_input["assetId"] in written
+    assert len(written) == len(fake_bpy.data.collections[adapter_input["assetId"]].all_objects) + 2
+
+
+def test_output_mode_is_part_of_the_cache_variant() -> None:
+    assert job_variant({"output": "a.blend"}) == ".blend"
+    assert job_variant({"output": "a.blend", "outputMode": "library", "compress": True}) == ".blend:library:compress"
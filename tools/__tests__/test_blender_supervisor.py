@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+
+from tools.blender_supervisor import SupervisorConfig, build_report, main, run_jobs
+from tools.realisation_cache import RealisationCache
+
+FAKE_WORKER = [sys.executable, os.path.join(os.path.dirname(__file__), "fake_blender_worker.py")]
+
+
+def _job(job_id: str, tmp_path, archetype: str = "chair", **extra) -> dict:
+    return {
+        "id": job_id,
+        "adapterInput": {"assetId": f"assets.{job_id}", "archetype": archetype, "parts": {}},
+        "output": str(tmp_path / f"{job_id}.blend"),
+        **extra,
+    }
+
+
+def test_jobs_are_sharded_across_the_pool(tmp_path) -> None:
+    jobs = [_job(f"asset_{index}", tmp_path, fakeDelay=0.05) for index in range(8)]
+    progress: list = []
+
+    results = run_jobs(
+        jobs,
+        SupervisorConfig(worker_command=FAKE_WORKER, workers=4, timeout=10),
+        on_progress=lambda result, done, total: progress.append((done, total)),
+    )
+
+    assert [result["id"] for result in results] == [job["id"] for job in jobs]
+    assert all(result["ok"] for result in results)
+    assert len({result["worker"] for result in results}) > 1
+    assert progress[-1] == (8, 8)
+    assert all(os.path.exists(job["output"]) for job in jobs)
+
+
+def test_timeouts_and_crashes_are_retried_on_a_fresh_worker(tmp_path) -> None:
+    jobs = [
+        _job("slow", tmp_path, fakeDelay=5),
+        _job("crashes_once", tmp_path, fakeCrashOnce=str(tmp_path / "crashed")),
+        _job("lamp", tmp_path, archetype="lamp"),
+    ]
+
+    results = run_jobs(jobs, SupervisorConfig(worker_command=FAKE_WORKER, workers=2, timeout=0.5, retries=1))
+    by_id = {result["id"]: result for result in results}
+
+    assert by_id["slow"]["ok"] is False
+    assert by_id["slow"]["attempts"] == 2
+    assert "timed out" in by_id["slow"]["error"]
+    assert by_id["crashes_once"]["ok"] is True
+    assert by_id["crashes_once"]["attempts"] == 2
+    assert by_id["lamp"]["attempts"] == 1
+    assert by_id["lamp"]["error"] == "RuntimeError: Unsupported archetype: lamp"
+
+    report = build_report(results, SupervisorConfig(worker_command=FAKE_WORKER, workers=2), 1.0)
+    assert report["summary"] == {
+        "total": 3,
+        "succeeded": 1,
+        "failed": 2,
+        "cached": 0,
+        "retried": 2,
+        "seconds": 1.0,
+    }
+
+
+class _FailingStoreCache(RealisationCache):
+    def store(self, key, artefact_path, meta=None) -> None:  # type: ignore[no-untyped-def]
+        raise OSError(f"cannot store {os.path.basename(artefact_path)}")
+
+
+def test_unexpected_errors_fail_the_job_without_stalling_the_pool(tmp_path) -> None:
+    jobs = [_job(f"asset_{index}", tmp_path) for index in range(3)]
+    cache = _FailingStoreCache(str(tmp_path / "cache"))
+    results: list = []
+
+    runner = threading.Thread(
+        target=lambda: results.extend(run_jobs(jobs, SupervisorConfig(worker_command=FAKE_WORKER, workers=2), cache=cache)),
+        daemon=True,
+    )
+    runner.start()
+    runner.join(timeout=30)
+
+    assert not runner.is_alive()
+    assert [result["id"] for result in results] == [job["id"] for job in jobs]
+    assert all(result["ok"] is False for result in results)
+    assert results[0]["error"] == "OSError: cannot store asset_0.blend"
+
+
+def test_cli_writes_merged_report(tmp_path) -> None:
+    manifest_path = tmp_path / "jobs.json"
+    manifest_path.write_text(json.dumps({"jobs": [_job("a", tmp_path), _job("b", tmp_path)], "report": "report.json"}))
+
+    exit_code = main([str(manifest_path), "--workers", "2", "--worker-command", " ".join(FAKE_WORKER)])
+
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert exit_code == 0
+    assert report["ok"] is True
+    assert [job["id"] for job in report["jobs"]] == ["a", "b"]
+
+
+def test_gltf_and_obj_jobs_are_exported_without_a_worker(tmp_path) -> None:
+    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    jobs = [
+        {"id": "chair", "input": os.path.join(repo_root, "chair_input.json"), "output": str(tmp_path / "chair.glb")},
+        {"id": "bed", "input": os.path.join(repo_root, "bed_input.json"), "output": str(tmp_path / "bed.obj")},
+    ]
+    results = run_jobs(jobs, SupervisorConfig(worker_command=["/nonexistent/blender"]))
+
+    assert [result["ok"] for result in results] == [True, True]
+    assert all(result["worker"] is None for result in results)
+    assert (tmp_path / "chair.glb").exists() and (tmp_path / "bed.obj").exists()
+
+
+def test_exports_run_while_the_pool_realises_blender_jobs(tmp_path, monkeypatch) -> None:
+    from interpreters.blender.runtime.python import plan_export
+
+    blender_done = threading.Event()
+    waited: list = []
+
+    def _slow_export(adapter_input, output_path, lods=False):  # type: ignore[no-untyped-def]
+        waited.append(blender_done.wait(timeout=10))
+        return {"output": output_path, "objectCount": 0, "ergonomics": None}
+
+    monkeypatch.setattr(plan_export, "export_realisation", _slow_export)
+    jobs = [
+        {**_job("export", tmp_path), "output": str(tmp_path / "export.glb")},
+        _job("blender", tmp_path),
+    ]
+
+    def _progress(result, done, total):  # type: ignore[no-untyped-def]
+        if result["id"] == "blender":
+            blender_done.set()
+
+    results = run_jobs(jobs, SupervisorConfig(worker_command=FAKE_WORKER, timeout=10), on_progress=_progress)
+
+    assert [result["ok"] for result in results] == [True, True]
+    assert waited == [True]
+
+
+def test_messages_for_other_jobs_do_not_extend_the_timeout(tmp_path) -> None:
+    jobs = [_job("noisy", tmp_path, fakeNoise=5)]
+
+    results = run_jobs(jobs, SupervisorConfig(worker_command=FAKE_WORKER, timeout=0.5, retries=0))
+
+    assert results[0]["ok"] is False
+    assert "timed out after 0.5s" in results[0]["error"]
+    assert results[0]["seconds"] < 4
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+
+def test_analytic_bounds_match_the_depsgraph_for_a_parented_scaled_cube(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_bounds import build_bounds_index
+    from interpreters.blender.runtime.python.blender_plan_applier import ensure_unit_cube
+
+    anchor = fake_bpy.data.objects.new("chairs.a::seat::ANCHOR", None)
+    anchor.location = (1.0, -2.0, 0.5)
+    anchor.scale = (2.0, 0.5, 3.0)
+    cube = fake_bpy.data.objects.new("chairs.a::seat::0", ensure_unit_cube())
+    cube.parent = anchor
+    cube.location = (0.25, 1.0, -0.1)
+    cube.scale = (0.4, -0.6, 0.2)  # a mirrored axis still spans |scale|
+
+    analytic = build_bounds_index([anchor, cube])
+    cube.modifiers.append(object())  # anything with modifiers is evaluated instead
+    evaluated = build_bounds_index([anchor, cube])
+
+    assert (analytic.analytic_count, analytic.evaluated_count) == (1, 0)
+    assert (evaluated.analytic_count, evaluated.evaluated_count) == (0, 1)
+    assert fake_bpy.stats["depsgraph_get"] == 1
+    for a, b in zip(analytic.objects["chairs.a::seat::0"], evaluated.objects["chairs.a::seat::0"]):
+        assert abs(a - b) < 1e-9
+    assert analytic.parts.keys() == evaluated.parts.keys() == {"seat"}
+    assert all(abs(a - b) < 1e-9 for a, b in zip(analytic.bounds, evaluated.bounds))
+    # World centre (1.5, -1.5, 0.2), world half extents (0.4, 0.15, 0.3).
+    assert all(abs(a - b) < 1e-9 for a, b in zip(analytic.bounds, (1.1, 1.9, -1.65, -1.35, -0.1, 0.5)))
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import copy
+import importlib
+import json
+import os
+import sys
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+CHAIR_ID = "assets.furniture.chair_simple"
+
+
+def _input(archetype: str) -> dict:
+    with open(os.path.join(REPO_ROOT, f"{archetype}_input.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def test_fingerprint_is_stable_and_tracks_the_realisation(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_chair_realiser import realise_chair
+    from interpreters.blender.runtime.python.blender_fingerprint import FINGERPRINT_PROP, stamp_fingerprint
+
+    realise_chair(_input("chair"))
+    fresh = stamp_fingerprint(CHAIR_ID)
+    assert fake_bpy.data.collections[CHAIR_ID][FINGERPRINT_PROP] == fresh
+    # Stored properties (the fingerprint, regen bookkeeping) do not feed back into the hash.
+    assert stamp_fingerprint(CHAIR_ID) == fresh
+
+    edited = copy.deepcopy(_input("chair"))
+    edited["physical"]["seatHeight"] = 0.5
+    realise_chair(edited)
+    assert stamp_fingerprint(CHAIR_ID) != fresh
+    realise_chair(_input("chair"))
+    assert stamp_fingerprint(CHAIR_ID) == fresh
+
+    fake_bpy.reset()
+    realise_chair(_input("chair"), geometry="merged")
+    merged = stamp_fingerprint(CHAIR_ID)
+    fake_bpy.reset()
+    realise_chair(_input("chair"), geometry="merged")
+    assert stamp_fingerprint(CHAIR_ID) == merged != fresh
+    assert stamp_fingerprint("missing") is None
+
+
+def test_run_results_carry_the_fingerprint(fake_bpy, tmp_path) -> None:
+    sys.modules.pop("tools.run_blender", None)
+    run_blender = importlib.import_module("tools.run_blender")
+    registry = run_blender._load_realiser_registry()
+    options = {"outputMode": "mainfile", "compress": False, "geometry": "objects"}
+
+    first = run_blender._realise_input(_input("bed"), str(tmp_path / "a.blend"), registry, options)
+    fake_bpy.reset()
+    second = run_blender._realise_input(_input("bed"), str(tmp_path / "b.blend"), registry, options)
+
+    assert first["fingerprint"] and first["fingerprint"] == second["fingerprint"]
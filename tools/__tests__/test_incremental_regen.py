@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import copy
+import importlib
+import json
+import os
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _input(archetype: str) -> dict:
+    with open(os.path.join(REPO_ROOT, f"{archetype}_input.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _transforms(fake_bpy) -> dict:
+    return {
+        obj.name: (
+            obj.parent.name if obj.parent else None,
+            tuple(round(value, 6) for value in obj.location),
+            tuple(round(value, 6) for value in obj.scale),
+        )
+        for obj in fake_bpy.data.objects
+    }
+
+
+def test_rerun_touches_only_changed_parts(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_chair_realiser import realise_chair
+
+    adapter_input = _input("chair")
+    realise_chair(adapter_input)
+    collection = fake_bpy.data.collections[adapter_input["assetId"]]
+    first = json.loads(collection["regen_report"])
+    assert first["created"] == ["back", "seat", "supports"]
+
+    fake_bpy.stats.clear()
+    realise_chair(adapter_input)
+    again = json.loads(collection["regen_report"])
+    assert again["unchanged"] == ["back", "seat", "supports"]
+    assert again["objectsUpdated"] == again["objectsCreated"] == 0
+    assert fake_bpy.stats["object_created"] == 0
+
+    edited = copy.deepcopy(adapter_input)
+    edited["physical"]["seatHeight"] = 0.5
+    before = _transforms(fake_bpy)
+    edited_report = realise_chair(edited)
+    incremental = _transforms(fake_bpy)
+    edited_regen = json.loads(collection["regen_report"])
+    assert edited_regen["updated"]
+    moved = {name for name, transform in incremental.items() if before[name] != transform}
+    # The seat ANCHOR is written back to its planned spot before the ergonomics lift it
+    # again; the supports ANCHOR keeps its place and is not counted.
+    assert edited_regen["objectsUpdated"] == len(moved) + 1 == len(incremental) - 1
+
+    fake_bpy.reset()
+    fresh_report = realise_chair(edited)
+    assert incremental == _transforms(fake_bpy)
+    assert edited_report == fresh_report
+
+
+def test_object_count_changes_add_and_remove_objects(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_plan_applier import apply_plan_incremental, ensure_collection
+    from interpreters.blender.runtime.python.realisation_plan import RealisationPlan, plan_table
+
+    plan = plan_table(_input("table"))
+    collection = ensure_collection(plan.assetId)
+    apply_plan_incremental(plan, collection)
+
+    data = plan.to_dict()
+    keep = [index for index, name in enumerate(data["names"]) if not name.endswith("::supports::3")]
+    fewer = RealisationPlan.from_dict(
+        {
+            **data,
+            "names": [data["names"][index] for index in keep],
+            "parents": [data["parents"][index] - (1 if data["parents"][index] > 4 else 0) for index in keep],
+            "kinds": [data["kinds"][index] for index in keep],
+            "locations": [value for index in keep for value in data["locations"][index * 3 : index * 3 + 3]],
+            "scales": [value for index in keep for value in data["scales"][index * 3 : index * 3 + 3]],
+        }
+    )
+    report = apply_plan_incremental(fewer, collection)
+
+    assert report["updated"] == ["supports"]
+    assert report["unchanged"] == ["surface"]
+    assert report["objectsRemoved"] == 1
+    # The remaining legs keep their transforms, so none of them counts as updated.
+    assert report["objectsUpdated"] == 0
+    assert f"{plan.assetId}::supports::3" not in fake_bpy.data.objects
+
+    report = apply_plan_incremental(plan, collection)
+    assert report["objectsCreated"] == 1
+    assert fake_bpy.data.objects[f"{plan.assetId}::supports::3"].parent.name == f"{plan.assetId}::supports::ANCHOR"
+
+
+def test_non_incremental_runs_drop_the_last_regen_report(fake_bpy, monkeypatch) -> None:
+    from interpreters.blender.runtime.python.blender_chair_realiser import realise_chair
+    from interpreters.blender.runtime.python.blender_plan_applier import REGEN_REPLACE
+
+    adapter_input = _input("chair")
+    realise_chair(adapter_input)
+    collection = fake_bpy.data.collections[adapter_input["assetId"]]
+    assert "regen_report" in collection
+
+    realise_chair(adapter_input, geometry="merged")
+    assert "regen_report" not in collection
+
+    realise_chair(adapter_input)
+    monkeypatch.setattr(importlib.import_module(realise_chair.__module__), "REGEN_MODE", REGEN_REPLACE)
+    realise_chair(adapter_input)
+    assert "regen_report" not in collection
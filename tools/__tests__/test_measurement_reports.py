@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sys
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _input(archetype: str) -> dict:
+    with open(os.path.join(REPO_ROOT, f"{archetype}_input.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _metrics(report: dict) -> dict:
+    return {metric["metric"]: metric["after"] for metric in report["metrics"]}
+
+
+def test_table_and_bed_reports_match_the_offline_audit(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_bed_realiser import realise_bed
+    from interpreters.blender.runtime.python.blender_table_realiser import realise_table
+    from interpreters.blender.runtime.python.ergonomics_audit import audit_inputs
+
+    bed = _input("bed")
+    bed["physical"]["totalHeight"] = 1.1
+    reports = [realise_table(_input("table")), realise_bed(bed), realise_bed(bed, geometry="merged")]
+    audited = audit_inputs([("table", _input("table")), ("bed", bed), ("bed", bed)])["assets"]
+
+    for report, expected in zip(reports, audited):
+        assert report["ok"] == expected["ok"]
+        assert _metrics(report) == {metric["metric"]: metric["after"] for metric in expected["metrics"]}
+    # The HEADBOARD, not the mattress, sets the bed's totalHeight.
+    assert _metrics(reports[1])["totalHeight"] == 1.1
+    assert fake_bpy.stats["depsgraph_get"] == 0
+
+
+def test_shipped_table_clearance_is_checked_as_a_minimum(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_table_realiser import realise_table
+
+    table = _input("table")
+    clearance = {metric["metric"]: metric for metric in realise_table(table)["metrics"]}["clearanceHeight"]
+    # The declared value is the knee clearance the table needs; the free height under the top exceeds it.
+    assert clearance["declared"] == 0.51 and clearance["after"] > 0.51 and clearance["ok"]
+
+    table["physical"]["clearanceHeight"] = 0.8
+    clearance = {metric["metric"]: metric for metric in realise_table(table)["metrics"]}["clearanceHeight"]
+    assert not clearance["ok"]
+
+
+def test_realised_outputs_get_a_compact_sidecar(fake_bpy, tmp_path) -> None:
+    sys.modules.pop("tools.run_blender", None)
+    run_blender = importlib.import_module("tools.run_blender")
+    registry = run_blender._load_realiser_registry()
+    options = {"outputMode": "mainfile", "compress": False, "geometry": "objects"}
+    output = str(tmp_path / "table.blend")
+
+    outcome = run_blender._realise_input(_input("table"), output, registry, options)
+
+    assert outcome["sidecar"] == output + ".ergonomics.json"
+    with open(outcome["sidecar"], "r", encoding="utf-8") as handle:
+        sidecar = json.load(handle)
+    assert sidecar["assetId"] == "assets.furniture.table_simple" and not sidecar["ok"]
+    assert sidecar["metrics"]["surfaceHeight"] == {"measured": 0.76904, "declared": 0.73, "delta": 0.03904, "ok": False}
+
+    no_physical = {key: value for key, value in _input("table").items() if key != "physical"}
+    assert run_blender._realise_input(no_physical, output, registry, options)["sidecar"] is None
+    assert not os.path.exists(output + ".ergonomics.json")
+
+
+def test_lods_option_writes_the_chain_next_to_the_output(fake_bpy, tmp_path) -> None:
+    sys.modules.pop("tools.run_blender", None)
+    run_blender = importlib.import_module("tools.run_blender")
+    registry = run_blender._load_realiser_registry()
+    output = str(tmp_path / "chair.blend")
+    options = run_blender._output_options({"lods": True}, {"outputMode": "mainfile", "compress": False, "geometry": "objects"})
+
+    outcome = run_blender._realise_input({**_input("chair"), "detailTier": "carved"}, output, registry, options)
+
+    assert outcome["lods"]["output"] == output + ".lod.glb" and os.path.exists(output + ".lod.glb")
+    assert [level["form"] for level in outcome["lods"]["levels"]] == ["carved", "profiled", "boxes", "parts", "bounds"]
+    options["lods"] = False
+    assert run_blender._realise_input(_input("chair"), output, registry, options)["lods"] is None
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+import os
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _input(archetype: str) -> dict:
+    with open(os.path.join(REPO_ROOT, f"{archetype}_input.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def test_merged_chair_keeps_part_bounds_and_ergonomics(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_bounds import build_bounds_index
+    from interpreters.blender.runtime.python.blender_chair_realiser import realise_chair
+
+    adapter_input = _input("chair")
+    per_object_report = realise_chair(adapter_input)
+    per_object = build_bounds_index(fake_bpy.data.objects)
+
+    fake_bpy.reset()
+    merged_report = realise_chair(adapter_input, geometry="merged")
+    merged = build_bounds_index(fake_bpy.data.objects)
+    obj = fake_bpy.data.objects[f"{adapter_input['assetId']}::merged"]
+
+    assert len(fake_bpy.data.objects) == 1
+    assert merged_report == per_object_report
+    assert merged.evaluated_count == 0
+    assert set(merged.objects) == set(per_object.objects)
+    for name, bounds in per_object.objects.items():
+        assert all(abs(a - b) < 1e-6 for a, b in zip(bounds, merged.objects[name]))
+    assert [group.name for group in obj.vertex_groups] == ["back", "seat", "supports"]
+    assert len(obj.data.polygons) == 6 * len(per_object.objects)
+
+
+def test_switching_geometry_modes_replaces_the_other_modes_objects(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_chair_realiser import realise_chair
+    from interpreters.blender.runtime.python.blender_fingerprint import stamp_fingerprint
+
+    adapter_input = _input("chair")
+    asset_id = adapter_input["assetId"]
+    per_object_report = realise_chair(adapter_input)
+
+    merged_report = realise_chair(adapter_input, geometry="merged")
+    assert [obj.name for obj in fake_bpy.data.collections[asset_id].objects] == [f"{asset_id}::merged"]
+    assert merged_report == per_object_report
+    fingerprint = stamp_fingerprint(asset_id)
+
+    # Re-runs refill the same mesh instead of adding `::merged.001`, so the fingerprint holds.
+    realise_chair(adapter_input, geometry="merged")
+    assert [mesh.name for mesh in fake_bpy.data.meshes if "merged" in mesh.name] == [f"{asset_id}::merged"]
+    assert stamp_fingerprint(asset_id) == fingerprint
+
+    assert realise_chair(adapter_input) == per_object_report
+    assert f"{asset_id}::merged" not in fake_bpy.data.objects
+
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+import os
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _chair(asset_id: str, detail_tier: str) -> dict:
+    with open(os.path.join(REPO_ROOT, "chair_input.json"), "r", encoding="utf-8") as handle:
+        chair = json.load(handle)
+    chair["assetId"] = asset_id
+    chair["detailTier"] = detail_tier
+    return chair
+
+
+def test_identical_parts_share_one_mesh(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_bounds import SHAPE_KEY_PROP
+    from interpreters.blender.runtime.python.blender_chair_realiser import realise_chair
+    from interpreters.blender.runtime.python.blender_mesh_cache import session_mesh_cache
+
+    boxes = realise_chair(_chair("chairs.boxes", "basic"))
+    fake_bpy.stats.clear()
+    first = realise_chair(_chair("chairs.a", "carved"))
+    realise_chair(_chair("chairs.b", "carved"))
+
+    shaped = [obj for obj in fake_bpy.data.objects if obj.type == "MESH" and not obj.name.startswith("chairs.boxes")]
+    meshes = {obj.data.name for obj in shaped}
+    assert all(fake_bpy.data.meshes[name].get(SHAPE_KEY_PROP) == name for name in meshes)
+    # Legs within a chair and every part across the two chairs reuse meshes.
+    assert len(meshes) < len(shaped) // 2
+    assert fake_bpy.stats["depsgraph_get"] == 0
+    # Shapes fill the unit cube, so measured bounds match the plain boxes.
+    assert first["metrics"] == boxes["metrics"]
+
+    cache = session_mesh_cache()
+    assert len(cache) == len(meshes)
+    fake_bpy.reset()  # stands in for opening a file: the cache starts over
+    assert session_mesh_cache() is not cache
+
+
+def test_cache_rebuilds_from_mesh_properties(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_chair_realiser import realise_chair
+    from interpreters.blender.runtime.python.blender_mesh_cache import MeshCache, session_mesh_cache
+
+    realise_chair(_chair("chairs.a", "profiled"))
+    rebuilt = MeshCache(fake_bpy.data.meshes)
+    assert len(rebuilt) == len(session_mesh_cache()) > 0
+
+    count = len(fake_bpy.data.meshes)
+    realise_chair(_chair("chairs.b", "profiled"))
+    assert len(fake_bpy.data.meshes) == count
+
+
+def test_tier_change_swaps_meshes_and_basic_keeps_the_unit_cube(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_bounds import UNIT_CUBE_NAME
+    from interpreters.blender.runtime.python.blender_chair_realiser import realise_chair
+
+    realise_chair(_chair("chairs.a", "basic"))
+    assert {obj.data.name for obj in fake_bpy.data.objects if obj.type == "MESH"} == {UNIT_CUBE_NAME}
+
+    realise_chair(_chair("chairs.a", "carved"))
+    assert UNIT_CUBE_NAME not in {obj.data.name for obj in fake_bpy.data.objects if obj.type == "MESH"}
+
+    # Going back releases the shapes, and the teardown frees them with the run.
+    realise_chair(_chair("chairs.a", "basic"))
+    assert [mesh.name for mesh in fake_bpy.data.meshes] == [UNIT_CUBE_NAME]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import copy
+import json
+import os
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _input(archetype: str) -> dict:
+    with open(os.path.join(REPO_ROOT, f"{archetype}_input.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _variant(base: dict, index: int) -> dict:
+    adapter_input = copy.deepcopy(base)
+    adapter_input["assetId"] = f"{base['assetId']}_{index:03d}"
+    return adapter_input
+
+
+def test_realisers_do_not_look_objects_up_in_bpy_data(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_chair_realiser import realise_chair
+
+    base = _input("chair")
+    for index in range(50):
+        realise_chair(_variant(base, index))
+    fake_bpy.stats.clear()
+
+    realise_chair(_variant(base, 50))
+    realise_chair(_variant(base, 0))
+
+    # Only the shared unit cube mesh and the asset collection are looked up.
+    assert fake_bpy.stats["data_lookups"] == 4
+    assert fake_bpy.stats["data_scans"] == 0
+
+
+def test_registry_follows_teardown_and_file_loads(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_object_registry import session_registry
+    from interpreters.blender.runtime.python.blender_table_realiser import realise_table
+    from interpreters.blender.runtime.python.blender_teardown import teardown
+
+    adapter_input = _input("table")
+    asset_id = adapter_input["assetId"]
+    realise_table(adapter_input)
+    registry = session_registry()
+    assert [obj.name for obj in registry.part_objects(asset_id, "surface")] == [
+        f"{asset_id}::surface::ANCHOR",
+        f"{asset_id}::surface::0",
+    ]
+    assert registry.anchor(asset_id, "supports") is fake_bpy.data.objects[f"{asset_id}::supports::ANCHOR"]
+
+    teardown(registry.part_objects(asset_id, "supports"))
+    assert registry.part_objects(asset_id, "supports") == []
+    assert len(registry.asset_objects(asset_id)) == 2
+
+    fake_bpy.ops.wm.read_homefile(use_factory_startup=True)
+    assert session_registry() is not registry
+    assert session_registry().asset_objects(asset_id) == []
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+from tools.blender_supervisor import SupervisorConfig, run_jobs
+from tools.realisation_cache import (
+    SIDECAR_SUFFIX,
+    RealisationCache,
+    cache_key,
+    canonical_input_hash,
+    realiser_fingerprint,
+)
+
+FAKE_WORKER = [sys.executable, os.path.join(os.path.dirname(__file__), "fake_blender_worker.py")]
+
+CHAIR_INPUT = {
+    "assetId": "assets.furniture.chair_simple",
+    "archetype": "chair",
+    "detailTier": "basic",
+    "parts": {"seat": {"kind": "seat"}, "back": {"kind": "back"}},
+    "physical": {"seatHeight": 0.437, "totalHeight": 1},
+}
+
+
+def _artefact(tmp_path, name: str, size: int) -> str:
+    path = tmp_path / name
+    path.write_bytes(b"x" * size)
+    return str(path)
+
+
+def test_input_hash_ignores_key_order() -> None:
+    reordered = json.loads(json.dumps(CHAIR_INPUT, sort_keys=True))
+    reordered["physical"] = {"totalHeight": 1, "seatHeight": 0.437}
+    assert canonical_input_hash(reordered) == canonical_input_hash(CHAIR_INPUT)
+    assert cache_key(reordered) == cache_key(CHAIR_INPUT)
+    assert cache_key(CHAIR_INPUT, ".glb") != cache_key(CHAIR_INPUT, ".blend")
+
+
+def test_fingerprint_tracks_only_the_archetypes_realiser(tmp_path) -> None:
+    runtime_dir = tmp_path / "runtime"
+    runtime_dir.mkdir()
+    for name in ("blender_chair_realiser.py", "blender_table_realiser.py", "blender_bed_realiser.py"):
+        (runtime_dir / name).write_text(f"# {name}\n")
+    chair_before = realiser_fingerprint("chair", str(runtime_dir))
+    table_before = realiser_fingerprint("table", str(runtime_dir))
+
+    (runtime_dir / "blender_chair_realiser.py").write_text("# changed\n")
+    realiser_fingerprint.cache_clear()
+
+    assert realiser_fingerprint("chair", str(runtime_dir)) != chair_before
+    assert realiser_fingerprint("table", str(runtime_dir)) == table_before
+
+
+def test_fetch_store_and_lru_eviction(tmp_path) -> None:
+    cache = RealisationCache(str(tmp_path / "cache"), max_bytes=250)
+    cache.store("a" * 64, _artefact(tmp_path, "a.blend", 100))
+    cache.store("b" * 64, _artefact(tmp_path, "b.blend", 100))
+    assert cache.fetch("a" * 64, str(tmp_path / "out" / "a.blend"))
+
+    cache.store("c" * 64, _artefact(tmp_path, "c.blend", 100))
+
+    assert [entry["key"][0] for entry in cache.entries()] == ["c", "a"]
+    assert not cache.fetch("b" * 64, str(tmp_path / "b_out.blend"))
+    assert (tmp_path / "out" / "a.blend").read_bytes() == b"x" * 100
+    assert sorted(cache.purge()) == ["a" * 64, "c" * 64]
+    assert cache.total_bytes() == 0
+
+
+def test_supervisor_skips_workers_on_cache_hits(tmp_path) -> None:
+    cache = RealisationCache(str(tmp_path / "cache"))
+    job = {"id": "chair", "adapterInput": CHAIR_INPUT, "output": str(tmp_path / "chair.blend")}
+
+    first = run_jobs([job], SupervisorConfig(worker_command=FAKE_WORKER), cache=cache)
+    os.unlink(job["output"])
+    # A worker that cannot launch proves the second run never needed one.
+    second = run_jobs([job], SupervisorConfig(worker_command=["/nonexistent/blender"]), cache=cache)
+
+    assert first[0]["cached"] is False
+    assert second[0]["ok"] is True
+    assert second[0]["cached"] is True
+    assert second[0]["fingerprint"] == first[0]["fingerprint"] is not None
+    assert json.loads(open(job["output"], encoding="utf-8").read()) == CHAIR_INPUT
+
+
+def test_cache_hits_restore_the_ergonomics_sidecar(tmp_path) -> None:
+    cache = RealisationCache(str(tmp_path / "cache"))
+    job = {"id": "chair", "adapterInput": CHAIR_INPUT, "output": str(tmp_path / "chair.blend")}
+    sidecar = tmp_path / f"chair.blend{SIDECAR_SUFFIX}"
+
+    first = run_jobs([job], SupervisorConfig(worker_command=FAKE_WORKER), cache=cache)
+    written = sidecar.read_text(encoding="utf-8")
+    os.unlink(job["output"])
+    sidecar.write_text("stale", encoding="utf-8")
+    second = run_jobs([job], SupervisorConfig(worker_command=["/nonexistent/blender"]), cache=cache)
+
+    assert first[0]["sidecar"] == second[0]["sidecar"] == str(sidecar)
+    assert second[0]["cached"] is True
+    assert sidecar.read_text(encoding="utf-8") == written
+
+    # An entry realised without a sidecar removes one left by an earlier run.
+    bare_input = {key: value for key, value in CHAIR_INPUT.items() if key != "physical"}
+    bare = {"id": "bare", "adapterInput": bare_input, "output": job["output"]}
+    run_jobs([bare], SupervisorConfig(worker_command=FAKE_WORKER), cache=cache)
+    sidecar.write_text("stale", encoding="utf-8")
+    third = run_jobs([bare], SupervisorConfig(worker_command=["/nonexistent/blender"]), cache=cache)
+
+    assert third[0]["cached"] is True and third[0]["sidecar"] is None
+    assert not sidecar.exists()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sys
+
+RUNTIME_PACKAGE = "interpreters.blender.runtime.python"
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _run_blender():
+    sys.modules.pop("tools.run_blender", None)
+    return importlib.import_module("tools.run_blender")
+
+
+def test_registry_imports_only_the_requested_realiser(fake_bpy) -> None:
+    run_blender = _run_blender()
+    registry = run_blender._load_realiser_registry()
+
+    assert f"{RUNTIME_PACKAGE}.blender_bed_realiser" not in sys.modules
+    assert registry.get("table") is not None
+    assert registry.get("lamp") is None
+    assert f"{RUNTIME_PACKAGE}.blender_table_realiser" in sys.modules
+    assert f"{RUNTIME_PACKAGE}.blender_bed_realiser" not in sys.modules
+    assert set(run_blender._STARTUP["imports"]) == {"table"}
+
+
+def test_template_scenes_reset_by_reopening_the_template(fake_bpy, monkeypatch) -> None:
+    run_blender = _run_blender()
+    fake_bpy.context.scene[run_blender.TEMPLATE_MARKER] = 1
+    fake_bpy.data.filepath = "/templates/startup.blend"
+    monkeypatch.setattr(run_blender, "_TEMPLATE_PATH", run_blender._loaded_template())
+
+    run_blender._reset_scene()
+
+    assert fake_bpy.data.filepath == "/templates/startup.blend"
+    assert fake_bpy.stats["open_mainfile"] == 1
+    assert fake_bpy.stats["read_homefile"] == 0
+
+
+def test_update_jobs_realise_into_the_existing_output(fake_bpy, tmp_path) -> None:
+    run_blender = _run_blender()
+    fake_bpy.write_files = True
+    defaults = {"outputMode": "mainfile", "compress": False, "geometry": "objects"}
+    handler = run_blender._make_job_handler(run_blender._load_realiser_registry(), defaults)
+    with open(os.path.join(REPO_ROOT, "chair_input.json"), "r", encoding="utf-8") as handle:
+        chair = json.load(handle)
+    job = {"adapterInput": chair, "output": str(tmp_path / "chair.blend"), "update": True}
+
+    first = handler(job)
+    chair["physical"]["totalHeight"] = 1.1
+    second = handler(job)
+
+    # No output yet: a fresh realisation. Then the saved file is opened instead of a reset.
+    assert first["regen"]["created"] and "reset" not in first["timings"]
+    assert "open" in second["timings"] and fake_bpy.stats["read_homefile"] == 0
+    assert second["regen"]["created"] == [] and second["regen"]["objectsCreated"] == 0
+    assert second["regen"]["updated"] == ["back"] and second["regen"]["unchanged"]
+
+    third = handler({**job, "update": False})
+    assert "reset" in third["timings"] and third["regen"]["updated"] == []
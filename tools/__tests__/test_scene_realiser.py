@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import os
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _scene(tmp_path, chairs: int) -> str:
+    placements = [
+        {"id": f"chair_{index:03d}", "source": "chair", "location": [index, 0, 0], "rotation": 90, "zone": "terrace"}
+        for index in range(chairs)
+    ]
+    placements.append({"id": "table_001", "input": "table_input.json", "zone": "hall"})
+    path = tmp_path / "cafe.json"
+    path.write_text(
+        json.dumps(
+            {
+                "sceneId": "cafe",
+                "sources": {"chair": os.path.join(REPO_ROOT, "chair_input.json")},
+                "placements": placements,
+            }
+        ),
+        encoding="utf-8",
+    )
+    (tmp_path / "table_input.json").write_text(
+        open(os.path.join(REPO_ROOT, "table_input.json"), encoding="utf-8").read(), encoding="utf-8"
+    )
+    return str(path)
+
+
+def test_repeated_inputs_are_realised_once_and_instanced(fake_bpy, tmp_path) -> None:
+    from interpreters.blender.runtime.python.blender_chair_realiser import realise_chair
+    from interpreters.blender.runtime.python.blender_scene_realiser import realise_scene
+    from interpreters.blender.runtime.python.blender_table_realiser import realise_table
+    from interpreters.blender.runtime.python.scene_plan import load_scene
+
+    scene = load_scene(_scene(tmp_path, 200))
+    report = realise_scene(scene, {"chair": realise_chair, "table": realise_table})
+
+    assert report["sourceCount"] == 2
+    assert report["instanceCount"] == 201
+    assert report["zones"] == {"terrace": 200, "hall": 1}
+    chair_source = report["sources"][0]
+    assert chair_source["instances"] == 200
+    assert chair_source["ergonomics"] is not None
+
+    empties = [obj for obj in fake_bpy.data.objects if obj.instance_type == "COLLECTION"]
+    assert len(empties) == 201
+    assert len(fake_bpy.data.objects) == report["sourceObjects"] + 201
+    chair = fake_bpy.data.objects["cafe::chair_007"]
+    assert chair.instance_collection is fake_bpy.data.collections[chair_source["assetId"]]
+    assert tuple(chair.location) == (7.0, 0.0, 0.0)
+    assert abs(chair.rotation_euler[2] - 1.5707963) < 1e-6
+
+    sources = fake_bpy.data.collections["cafe::sources"]
+    assert fake_bpy.context.view_layer.excluded == {"cafe::sources"}
+    # Layer exclusion does not survive library writes; the collection flags do.
+    assert sources.hide_render and sources.hide_viewport
+    assert {child.name for child in sources.children} == {chair_source["assetId"], report["sources"][1]["assetId"]}
+    assert [child.name for child in fake_bpy.context.scene.collection.children] == ["cafe"]
+
+
+
+def test_chunked_scene_rewrites_only_changed_chunks(fake_bpy, tmp_path) -> None:
+    from interpreters.blender.runtime.python.blender_chair_realiser import realise_chair
+    from interpreters.blender.runtime.python.blender_scene_chunks import write_chunked_scene
+    from interpreters.blender.runtime.python.blender_table_realiser import realise_table
+    from interpreters.blender.runtime.python.scene_plan import load_scene
+
+    fake_bpy.write_files = True
+    registry = {"chair": realise_chair, "table": realise_table}
+    scene_path = _scene(tmp_path, 3)
+    output_dir = str(tmp_path / "out")
+
+    first = write_chunked_scene(load_scene(scene_path), output_dir, registry, fake_bpy.reset)
+    assert [chunk["id"] for chunk in first["chunks"]] == ["zone_terrace", "zone_hall"]
+    assert first["written"] == 2 and first["masterWritten"]
+    master = fake_bpy.data.collections["cafe"]
+    assert [(child.name, child.library) for child in master.children] == [
+        ("cafe::zone_terrace", os.path.join(output_dir, "chunks", "zone_terrace.blend")),
+        ("cafe::zone_hall", os.path.join(output_dir, "chunks", "zone_hall.blend")),
+    ]
+
+    scene = json.loads(open(scene_path, encoding="utf-8").read())
+    scene["placements"][0]["location"] = [0, 5, 0]
+    with open(scene_path, "w", encoding="utf-8") as handle:
+        json.dump(scene, handle)
+    fake_bpy.saved.clear()
+    second = write_chunked_scene(load_scene(scene_path), output_dir, registry, fake_bpy.reset)
+
+    assert [chunk["written"] for chunk in second["chunks"]] == [True, False]
+    assert not second["masterWritten"]
+    assert fake_bpy.saved == [os.path.join(output_dir, "chunks", "zone_terrace.blend")]
+
+    scene["placements"] = [placement for placement in scene["placements"] if placement["zone"] == "terrace"]
+    with open(scene_path, "w", encoding="utf-8") as handle:
+        json.dump(scene, handle)
+    third = write_chunked_scene(load_scene(scene_path), output_dir, registry, fake_bpy.reset)
+
+    assert third["removed"] == ["zone_hall"] and third["masterWritten"]
+    assert not os.path.exists(os.path.join(output_dir, "chunks", "zone_hall.blend"))
+    assert os.path.exists(os.path.join(output_dir, "chunks", "zone_terrace.blend"))
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import os
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _input(archetype: str) -> dict:
+    with open(os.path.join(REPO_ROOT, f"{archetype}_input.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def test_clear_collection_removes_in_one_batch_and_purges_orphans(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_plan_applier import ensure_collection
+    from interpreters.blender.runtime.python.blender_table_realiser import realise_table
+    from interpreters.blender.runtime.python.blender_teardown import clear_collection
+
+    adapter_input = _input("table")
+    realise_table(adapter_input)
+    collection = ensure_collection(adapter_input["assetId"])
+    object_count = len(collection.objects)
+    fake_bpy.stats.clear()
+
+    report = clear_collection(collection)
+
+    assert report == {"removed": object_count, "purged": 1, "freed": {"objects": object_count, "meshes": 1}}
+    assert fake_bpy.stats["batch_remove"] == 1
+    assert fake_bpy.stats["removes"] == 0
+    assert len(fake_bpy.data.objects) == 0 and len(fake_bpy.data.meshes) == 0
+
+
+def test_teardown_only_frees_data_its_objects_leave_unused(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_bounds import UNIT_CUBE_NAME
+    from interpreters.blender.runtime.python.blender_plan_applier import ensure_collection
+    from interpreters.blender.runtime.python.blender_table_realiser import realise_table
+    from interpreters.blender.runtime.python.blender_teardown import clear_collection
+
+    adapter_input = _input("table")
+    realise_table(adapter_input)
+    fake_bpy.data.meshes[UNIT_CUBE_NAME].use_fake_user = True  # as in the startup template
+    fake_bpy.data.meshes.new("scratch")  # an orphan the realiser does not own
+    linked = fake_bpy.data.meshes.new("linked")
+    linked.library = "//library.blend"
+
+    report = clear_collection(ensure_collection(adapter_input["assetId"]))
+
+    assert report["purged"] == 0
+    assert sorted(mesh.name for mesh in fake_bpy.data.meshes) == [UNIT_CUBE_NAME, "linked", "scratch"]
+    assert fake_bpy.stats["orphans_purge"] == 0
+
+
+def test_replace_mode_rebuilds_through_teardown(fake_bpy, monkeypatch) -> None:
+    from interpreters.blender.runtime.python import blender_chair_realiser
+
+    adapter_input = _input("chair")
+    monkeypatch.setattr(blender_chair_realiser, "REGEN_MODE", "replace")
+    first = blender_chair_realiser.realise_chair(adapter_input)
+    names = sorted(obj.name for obj in fake_bpy.data.objects)
+    fake_bpy.stats.clear()
+
+    assert blender_chair_realiser.realise_chair(adapter_input) == first
+    assert sorted(obj.name for obj in fake_bpy.data.objects) == names
+    assert fake_bpy.stats["batch_remove"] == 1
+    assert fake_bpy.stats["removes"] == 0
+
+
+def test_remove_ids_dedups_wrappers_of_the_same_id(fake_bpy) -> None:
+    from interpreters.blender.runtime.python.blender_teardown import remove_ids
+
+    class _Wrapper:
+        # A second Python wrapper for the same datablock, as Blender returns on each access.
+        def __init__(self, item: object) -> None:
+            self._item = item
+
+        def __getattr__(self, name: str) -> object:
+            return getattr(self._item, name)
+
+    mesh = fake_bpy.data.meshes.new("mesh")
+    obj = fake_bpy.data.objects.new("object", mesh)
+
+    assert remove_ids([obj, _Wrapper(obj), mesh, mesh]) == 2
+    assert fake_bpy.stats["batch_remove"] == 1
+    assert len(fake_bpy.data.objects) == 0 and len(fake_bpy.data.meshes) == 0
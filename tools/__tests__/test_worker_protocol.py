@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tools.worker_protocol import decode_line, encode_line, load_manifest, serve, serve_records
+
+FAKE_WORKER = os.path.join(os.path.dirname(__file__), "fake_blender_worker.py")
+
+CHAIR_INPUT = {
+    "assetId": "assets.furniture.chair_simple",
+    "archetype": "chair",
+    "detailTier": "basic",
+    "parts": {"seat": {"kind": "seat"}, "back": {"kind": "back"}},
+}
+
+
+def test_serve_reports_success_and_failure_per_job() -> None:
+    lines = [
+        encode_line({"id": "a", "adapterInput": CHAIR_INPUT, "output": "a.blend"}),
+        "Blender log noise\n",
+        encode_line({"id": "b", "adapterInput": {"archetype": "lamp"}, "output": "b.blend"}),
+        encode_line({"op": "shutdown"}),
+        encode_line({"id": "never-run", "output": "c.blend"}),
+    ]
+    results: list = []
+
+    def _handle(job):
+        if job["adapterInput"]["archetype"] != "chair":
+            raise RuntimeError("Unsupported archetype: lamp")
+        return {"objectCount": 9, "timings": {"realise": 0.001}}
+
+    stopped = serve(lines, results.append, _handle)
+
+    assert stopped is True
+    assert [result["id"] for result in results] == ["a", "b", None]
+    assert results[0]["ok"] is True
+    assert results[0]["objectCount"] == 9
+    assert set(results[0]["timings"]) == {"realise", "total"}
+    assert results[1]["ok"] is False
+    assert results[1]["error"] == "RuntimeError: Unsupported archetype: lamp"
+    assert results[2]["op"] == "shutdown"
+
+
+def test_serve_rejects_malformed_lines_without_stopping() -> None:
+    results: list = []
+    serve(["{not json\n", encode_line({"id": "p", "op": "ping"})], results.append, dict)
+    assert results[0]["ok"] is False
+    assert results[1]["ok"] is True
+
+
+def test_fake_worker_handles_a_job_stream(tmp_path) -> None:
+    output_path = tmp_path / "chair.blend"
+    jobs = [
+        {"id": "chair", "adapterInput": CHAIR_INPUT, "output": str(output_path)},
+        {"id": "boom", "adapterInput": CHAIR_INPUT, "output": str(output_path), "fakeFail": "boom"},
+        {"op": "shutdown"},
+    ]
+    completed = subprocess.run(
+        [sys.executable, FAKE_WORKER],
+        input="".join(encode_line(job) for job in jobs),
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=True,
+    )
+    messages = [decode_line(line) for line in completed.stdout.splitlines()]
+
+    assert messages[0]["event"] == "ready"
+    assert messages[1]["ok"] is True
+    assert messages[1]["objectCount"] == 2
+    assert messages[2]["error"] == "RuntimeError: boom"
+    assert json.loads(output_path.read_text()) == CHAIR_INPUT
+
+
+def test_serve_records_streams_one_result_per_record(tmp_path) -> None:
+    lines = [
+        json.dumps(CHAIR_INPUT) + "\n",
+        "\n",
+        "{broken\n",
+        json.dumps({"id": "explicit", "adapterInput": CHAIR_INPUT, "output": "chair.blend"}) + "\n",
+    ]
+    emitted: list = []
+    handled: list = []
+
+    def _handle(job):
+        handled.append(job["output"])
+        return {"output": job["output"], "objectCount": 9}
+
+    summary = serve_records(iter(lines), emitted.append, _handle, str(tmp_path))
+
+    assert handled == [str(tmp_path / "assets.furniture.chair_simple-1.blend"), "chair.blend"]
+    assert [result.get("line") for result in emitted[:-1]] == [1, 3, 4]
+    assert [result.get("ok") for result in emitted[:-1]] == [True, False, True]
+    assert emitted[-1] is summary
+    assert (summary["total"], summary["failed"]) == (3, 1)
+
+
+def test_serve_records_never_reuses_an_output(tmp_path) -> None:
+    lines = [
+        json.dumps(CHAIR_INPUT),
+        json.dumps(CHAIR_INPUT),
+        json.dumps({"id": "a", "adapterInput": CHAIR_INPUT, "output": "chair.blend"}),
+        json.dumps({"id": "b", "adapterInput": CHAIR_INPUT, "output": "chair.blend"}),
+    ]
+    emitted: list = []
+    handled: list = []
+
+    def _handle(job):
+        handled.append(job["output"])
+        return {"output": job["output"]}
+
+    summary = serve_records(iter(lines), emitted.append, _handle, str(tmp_path))
+
+    assert handled == [
+        str(tmp_path / "assets.furniture.chair_simple-1.blend"),
+        str(tmp_path / "assets.furniture.chair_simple-2.blend"),
+        "chair.blend",
+    ]
+    assert [result["id"] for result in emitted[:-1]] == ["assets.furniture.chair_simple"] * 2 + ["a", "b"]
+    assert emitted[3]["error"] == "Output chair.blend is already used by line 3"
+    assert (summary["total"], summary["failed"]) == (4, 1)
+
+
+def test_manifest_paths_resolve_against_the_manifest(tmp_path) -> None:
+    manifest_dir = tmp_path / "batch"
+    manifest_dir.mkdir()
+    manifest_path = manifest_dir / "jobs.json"
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "jobs": [
+                    {"id": "chair", "input": "inputs/chair.json", "output": "../out/chair.blend"},
+                    {"adapterInput": CHAIR_INPUT, "output": str(tmp_path / "abs.blend")},
+                ],
+                "report": "report.json",
+            }
+        )
+    )
+
+    jobs, report_path = load_manifest(str(manifest_path))
+
+    assert report_path == str(manifest_dir / "report.json")
+    assert [job["id"] for job in jobs] == ["chair", "1"]
+    assert jobs[0]["input"] == str(manifest_dir / "inputs" / "chair.json")
+    assert jobs[0]["output"] == str(tmp_path / "out" / "chair.blend")
+    assert jobs[1]["output"] == str(tmp_path / "abs.blend")
+    assert jobs[1]["adapterInput"] == CHAIR_INPUT
+
+
+def test_manifest_list_form_has_no_report(tmp_path) -> None:
+    manifest_path = tmp_path / "jobs.json"
+    manifest_path.write_text(json.dumps([{"input": "chair.json", "output": "chair.blend"}]))
+
+    jobs, report_path = load_manifest(str(manifest_path))
+
+    assert report_path is None
+    assert jobs == [{"id": "0", "input": str(tmp_path / "chair.json"), "output": str(tmp_path / "chair.blend")}]
+
+    manifest_path.write_text(json.dumps({"jobs": [{"input": "chair.json"}]}))
+    with pytest.raises(ValueError, match="needs an 'output' path"):
+        load_manifest(str(manifest_path))
+
+
+def test_serve_records_default_outputs_follow_the_line_number(tmp_path) -> None:
+    lines = [json.dumps(CHAIR_INPUT)] * 3 + [
+        json.dumps({"id": "late", "adapterInput": CHAIR_INPUT, "output": str(tmp_path / "x.blend")}),
+        json.dumps({"id": "again", "adapterInput": CHAIR_INPUT, "output": str(tmp_path / "x.blend")}),
+    ]
+    emitted: list = []
+
+    serve_records(iter(lines), emitted.append, lambda job: {"output": job["output"]}, str(tmp_path))
+
+    outputs = [result["output"] for result in emitted[:3]]
+    assert outputs == [str(tmp_path / f"assets.furniture.chair_simple-{line}.blend") for line in (1, 2, 3)]
+    assert [result["ok"] for result in emitted[3:-1]] == [True, False]
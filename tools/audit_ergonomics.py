@@ -0,0 +1,69 @@
+"""
+Audit declared ergonomics of a furniture catalogue without Blender.
+
+    python tools/audit_ergonomics.py catalogue/ extra.jsonl --report audit.json
+
+Inputs are adapter input JSON files, directories of them (searched
+recursively) or JSONL files with one adapter input per line. Exits with code
+1 when any asset is outside the tolerance, so it can gate CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Optional, Sequence
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from interpreters.blender.runtime.python.ergonomics_audit import (  # noqa: E402
+    TOLERANCE,
+    audit_inputs,
+    load_adapter_inputs,
+)
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Audit measured vs declared ergonomics without Blender.")
+    parser.add_argument("inputs", nargs="+", help="Adapter input JSON/JSONL files or directories.")
+    parser.add_argument("--report", help="Write the JSON report here.")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help=f"Allowed |delta| (default {TOLERANCE}).")
+    parser.add_argument("--failures-only", action="store_true", help="Only list failing assets in the report.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    started = time.perf_counter()
+    report = audit_inputs(load_adapter_inputs(args.inputs), args.tolerance)
+    report["seconds"] = round(time.perf_counter() - started, 6)
+    if args.failures_only:
+        report["assets"] = [asset for asset in report["assets"] if not asset["ok"]]  # type: ignore[union-attr]
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    summary = report["summary"]
+    for asset in report["assets"]:  # type: ignore[union-attr]
+        for metric in asset["metrics"]:
+            if not metric["ok"]:
+                print(
+                    f"  {asset['assetId']} {metric['metric']}: measured={metric['after']:.4f}, "
+                    f"declared={metric['declared']:.4f}, Δ={metric['delta']:.4f}"
+                )
+    print(
+        f"[Audit] {summary['assets']} assets, {summary['failed']} outside ±{args.tolerance} "  # type: ignore[index]
+        f"({summary['closedForm']} closed-form, {summary['planned']} planned, "  # type: ignore[index]
+        f"{summary['skipped']} skipped) in {report['seconds']}s"  # type: ignore[index]
+    )
+    return 1 if summary["failed"] else 0  # type: ignore[index]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Bake a scene placements file into a statically batched glTF without Blender.
+
+    python tools/batch_scene.py scene.json scene.glb
+    python tools/batch_scene.py scene.json scene.glb --vertex-limit 30000 --cell-size 10
+
+Part objects are merged per material, grid cell and vertex limit; the lookup
+table (`scene.glb.lookup.json`) maps batch ranges back to placements and objects.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Optional, Sequence
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from interpreters.blender.runtime.python.scene_plan import DEFAULT_CELL_SIZE, load_scene  # noqa: E402
+from interpreters.blender.runtime.python.static_batching import (  # noqa: E402
+    DEFAULT_VERTEX_LIMIT,
+    write_batched_scene,
+)
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Bake a scene into statically batched glTF without Blender.")
+    parser.add_argument("scene", help="Scene placements JSON.")
+    parser.add_argument("output", help="Output .glb path.")
+    parser.add_argument("--vertex-limit", type=int, default=DEFAULT_VERTEX_LIMIT, help="Most vertices per batch.")
+    parser.add_argument("--cell-size", type=float, default=DEFAULT_CELL_SIZE, help="Grid cell edge in metres.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    scene = load_scene(args.scene)
+
+    started = time.perf_counter()
+    result = write_batched_scene(scene, args.output, args.vertex_limit, args.cell_size)
+    seconds = round(time.perf_counter() - started, 6)
+    print(
+        f"[Batch] {scene.sceneId} -> {args.output} "
+        f"({result['objects']} objects in {result['batches']} batches, {result['vertices']} vertices, {seconds}s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+"""
+Benchmarks for the Python realisers, run against the fake `bpy` in this folder.
+
+    python tools/bench/bench_realisers.py --out bench_results.json
+    python tools/bench/bench_realisers.py --sizes 1,10,100 --compare bench_results.json
+
+For each archetype and session size N it measures:
+
+- realise: realising N distinct assets into one session (latency per asset,
+  objects created, and the bpy calls counted by the fake)
+- collection_bounds: bounds of one collection holding N assets' objects
+- debug_adapter_summary: summarising N adapter inputs
+
+Timings exclude Blender itself, so they isolate the cost of our Python.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from tools.bench import fake_bpy  # noqa: E402
+
+ARCHETYPES = ("chair", "table", "bed")
+DEFAULT_SIZES = (1, 10, 100, 1000, 10000)
+REGRESSION_RATIO = 1.25
+RUNTIME_PACKAGE = "interpreters.blender.runtime.python"
+
+
+def _load_input(archetype: str) -> Dict[str, object]:
+    with open(os.path.join(REPO_ROOT, f"{archetype}_input.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _variant(base: Mapping[str, object], index: int) -> Dict[str, object]:
+    adapter_input = copy.deepcopy(dict(base))
+    adapter_input["assetId"] = f"{base['assetId']}_{index:05d}"
+    return adapter_input
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def _timed(fake: fake_bpy.FakeBpy, run: Callable[[], None]) -> tuple[float, Dict[str, int]]:
+    fake.stats.clear()
+    started = time.perf_counter()
+    run()
+    return time.perf_counter() - started, fake.stats.snapshot()
+
+
+def bench_realise(fake: fake_bpy.FakeBpy, archetype: str, size: int) -> Dict[str, object]:
+    module = importlib.import_module(f"{RUNTIME_PACKAGE}.blender_{archetype}_realiser")
+    realiser = getattr(module, f"realise_{archetype}")
+    base = _load_input(archetype)
+    inputs = [_variant(base, index) for index in range(size)]
+    fake.reset()
+    latencies: List[float] = []
+
+    def _run() -> None:
+        for adapter_input in inputs:
+            started = time.perf_counter()
+            realiser(adapter_input)
+            latencies.append(time.perf_counter() - started)
+
+    seconds, stats = _timed(fake, _run)
+    latencies.sort()
+    return {
+        "benchmark": "realise",
+        "archetype": archetype,
+        "assets": size,
+        "seconds": round(seconds, 6),
+        "perAssetMs": round(seconds * 1000 / size, 4),
+        "p95Ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 4),
+        "objects": len(fake.data.objects),
+        "stats": stats,
+    }
+
+
+def bench_collection_bounds(fake: fake_bpy.FakeBpy, archetype: str, size: int) -> Dict[str, object]:
+    applier = importlib.import_module(f"{RUNTIME_PACKAGE}.blender_plan_applier")
+    bounds = importlib.import_module(f"{RUNTIME_PACKAGE}.blender_bounds")
+    planning = importlib.import_module(f"{RUNTIME_PACKAGE}.realisation_plan")
+    base = _load_input(archetype)
+    fake.reset()
+    collection = applier.ensure_collection(f"bench::{archetype}")
+    for index in range(size):
+        applier.apply_plan(planning.plan_realisation(_variant(base, index)), collection)
+
+    seconds, stats = _timed(fake, lambda: bounds.collection_bounds(collection))
+    return {
+        "benchmark": "collection_bounds",
+        "archetype": archetype,
+        "assets": size,
+        "seconds": round(seconds, 6),
+        "perAssetMs": round(seconds * 1000 / size, 4),
+        "objects": len(collection.objects),
+        "stats": stats,
+    }
+
+
+def bench_debug_adapter_summary(fake: fake_bpy.FakeBpy, archetype: str, size: int) -> Dict[str, object]:
+    adapter = importlib.import_module(f"{RUNTIME_PACKAGE}.blender_debug_adapter")
+    base = _load_input(archetype)
+    inputs = [_variant(base, index) for index in range(size)]
+
+    def _run() -> None:
+        for adapter_input in inputs:
+            adapter.debug_adapter_summary(adapter_input)
+
+    seconds, stats = _timed(fake, _run)
+    return {
+        "benchmark": "debug_adapter_summary",
+        "archetype": archetype,
+        "assets": size,
+        "seconds": round(seconds, 6),
+        "perAssetMs": round(seconds * 1000 / size, 4),
+        "objects": 0,
+        "stats": stats,
+    }
+
+
+BENCHMARKS = {
+    "realise": bench_realise,
+    "collection_bounds": bench_collection_bounds,
+    "debug_adapter_summary": bench_debug_adapter_summary,
+}
+
+
+def _drop_runtime_modules() -> None:
+    # Runtime modules bind `bpy` at import time, so they must be imported after the fake.
+    for module in [name for name in sys.modules if name.startswith(RUNTIME_PACKAGE)]:
+        del sys.modules[module]
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    archetypes: Sequence[str] = ARCHETYPES,
+    benchmarks: Sequence[str] = tuple(BENCHMARKS),
+    on_result: Optional[Callable[[Mapping[str, object]], None]] = None,
+) -> Dict[str, object]:
+    _drop_runtime_modules()
+    fake = fake_bpy.install()
+    try:
+        results: List[Dict[str, object]] = []
+        for name in benchmarks:
+            for archetype in archetypes:
+                for size in sizes:
+                    result = BENCHMARKS[name](fake, archetype, size)
+                    results.append(result)
+                    if on_result is not None:
+                        on_result(result)
+    finally:
+        fake_bpy.uninstall()
+        _drop_runtime_modules()
+    return {
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "sizes": list(sizes),
+        "results": results,
+    }
+
+
+def compare(
+    previous: Mapping[str, object],
+    current: Mapping[str, object],
+    ratio: float = REGRESSION_RATIO,
+) -> List[str]:
+    """Return one line per benchmark whose per-asset time grew by more than `ratio`."""
+
+    def _key(result: Mapping[str, object]) -> tuple:
+        return (result["benchmark"], result["archetype"], result["assets"])
+
+    baseline = {_key(result): result for result in previous.get("results", [])}  # type: ignore[union-attr]
+    regressions: List[str] = []
+    for result in current.get("results", []):  # type: ignore[union-attr]
+        before = baseline.get(_key(result))
+        if before is None or not before["perAssetMs"]:
+            continue
+        growth = result["perAssetMs"] / before["perAssetMs"]
+        if growth > ratio:
+            regressions.append(
+                f"{result['benchmark']} {result['archetype']} x{result['assets']}: "
+                f"{before['perAssetMs']}ms -> {result['perAssetMs']}ms per asset ({growth:.2f}x)"
+            )
+    return regressions
+
+
+def _print_result(result: Mapping[str, object]) -> None:
+    print(
+        f"[Bench] {result['benchmark']:<22} {result['archetype']:<6} x{result['assets']:<6} "
+        f"{result['perAssetMs']:>9.4f} ms/asset  {result['objects']:>7} objects",
+        flush=True,
+    )
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the realisers against a fake bpy.")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES))
+    parser.add_argument("--archetypes", default=",".join(ARCHETYPES))
+    parser.add_argument("--benchmarks", default=",".join(BENCHMARKS))
+    parser.add_argument("--out", help="Write results JSON here.")
+    parser.add_argument("--compare", help="Previous results JSON; exit 1 on regressions.")
+    parser.add_argument("--ratio", type=float, default=REGRESSION_RATIO)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    report = run_benchmarks(
+        sizes=[int(size) for size in args.sizes.split(",")],
+        archetypes=args.archetypes.split(","),
+        benchmarks=args.benchmarks.split(","),
+        on_result=_print_result,
+    )
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as handle:
+            regressions = compare(json.load(handle), report, args.ratio)
+        for line in regressions:
+            print(f"[Bench] regression: {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+Cold-start timing for Blender realisation runs, with and without the startup
+template from tools/build_startup_template.py.
+
+    python tools/bench/bench_startup.py chair_input.json --runs 5 --out startup_bench.json
+
+Each run launches Blender once and realises one input. Wall time is measured
+here; the phases inside Blender come from run_blender.py's startup report
+($ARTWORKFLOW_STARTUP_REPORT): launch to script, default-mesh cleanup, realiser
+import, realise and save. Medians are reported per configuration.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Mapping, Optional, Sequence
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from tools.blender_supervisor import DEFAULT_BLENDER_BIN, startup_template_path  # noqa: E402
+
+RUN_BLENDER = os.path.join(REPO_ROOT, "tools", "run_blender.py")
+
+
+def _command(blender: str, template: Optional[str], input_path: str, output_path: str) -> List[str]:
+    return [
+        blender,
+        "--background",
+        "--factory-startup",
+        *([template] if template else []),
+        "--python",
+        RUN_BLENDER,
+        "--",
+        input_path,
+        output_path,
+    ]
+
+
+def _phases(report: Mapping[str, object], wall: float) -> Dict[str, float]:
+    phases = {"wall": wall}
+    for key in ("launchToScript", "cleanup", "scriptSetup"):
+        if isinstance(report.get(key), (int, float)):
+            phases[key] = float(report[key])  # type: ignore[arg-type]
+    imports = report.get("imports")
+    if isinstance(imports, Mapping):
+        phases["imports"] = float(sum(imports.values()))
+    first_job = report.get("firstJob")
+    if isinstance(first_job, Mapping):
+        for key in ("realise", "save"):
+            if key in first_job:
+                phases[key] = float(first_job[key])
+    return phases
+
+
+def run_configuration(
+    blender: str,
+    template: Optional[str],
+    input_path: str,
+    runs: int,
+) -> Dict[str, object]:
+    samples: List[Dict[str, float]] = []
+    with tempfile.TemporaryDirectory() as scratch:
+        output_path = os.path.join(scratch, "output.blend")
+        report_path = os.path.join(scratch, "startup.json")
+        env = dict(os.environ)
+        for key in ("PYTHONHOME", "PYTHONPATH", "VIRTUAL_ENV"):
+            env.pop(key, None)
+        env["ARTWORKFLOW_STARTUP_REPORT"] = report_path
+        for _ in range(runs):
+            env["ARTWORKFLOW_LAUNCHED_AT"] = repr(time.time())
+            started = time.perf_counter()
+            subprocess.run(
+                _command(blender, template, input_path, output_path),
+                env=env,
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+            wall = time.perf_counter() - started
+            with open(report_path, "r", encoding="utf-8") as handle:
+                samples.append(_phases(json.load(handle), wall))
+
+    phases = sorted({key for sample in samples for key in sample})
+    return {
+        "template": template,
+        "runs": runs,
+        "median": {
+            key: round(statistics.median(sample[key] for sample in samples if key in sample), 6) for key in phases
+        },
+        "samples": samples,
+    }
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure Blender cold-start cost per realisation.")
+    parser.add_argument("input", help="Adapter input JSON to realise on every run.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--blender", default=os.environ.get("BLENDER_BIN", DEFAULT_BLENDER_BIN))
+    parser.add_argument("--template", help="Startup template (defaults to the built one, if any).")
+    parser.add_argument("--out", help="Write results JSON here.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    input_path = os.path.abspath(args.input)
+    template = args.template or startup_template_path()
+
+    configurations = {"factory": run_configuration(args.blender, None, input_path, args.runs)}
+    if template:
+        configurations["template"] = run_configuration(args.blender, template, input_path, args.runs)
+    else:
+        print("[Startup] no template built; run tools/build_startup_template.py to compare", file=sys.stderr)
+
+    for name, result in configurations.items():
+        median = result["median"]
+        print(f"[Startup] {name:<8} " + "  ".join(f"{key}={value * 1000:.1f}ms" for key, value in median.items()))
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as handle:
+            json.dump({"input": input_path, "configurations": configurations}, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,684 @@
+"""
+In-process stand-in for the parts of `bpy` and `mathutils` the realisers use.
+
+It keeps just enough state to run `realise_chair`, `realise_table` and
+`realise_bed` outside Blender, and counts the calls that matter for cost:
+object creation, collection links, removals and depsgraph evaluations.
+
+    fake = install()          # registers `bpy` / `mathutils` in sys.modules
+    ...import and run realisers...
+    fake.stats.snapshot()
+    fake.reset()              # empty session, like `read_homefile`
+
+`save_mainfile` keeps a copy of the session in memory, and `open_mainfile`
+on the same path restores it.
+    uninstall()
+
+It is a measuring aid, not an emulator: only the API surface the runtime
+touches is modelled.
+"""
+
+from __future__ import annotations
+
+import copy
+import sys
+import types
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+
+class Stats(Counter):
+    def snapshot(self) -> Dict[str, int]:
+        return dict(sorted(self.items()))
+
+
+STATS = Stats()
+
+
+class Vector:
+    __slots__ = ("_values",)
+
+    def __init__(self, values: Iterable[float] = (0.0, 0.0, 0.0)) -> None:
+        self._values = [float(value) for value in values]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._values)
+
+    def __getitem__(self, index: int) -> float:
+        return self._values[index]
+
+    def __setitem__(self, index: int, value: float) -> None:
+        self._values[index] = float(value)
+
+    def __eq__(self, other: object) -> bool:
+        try:
+            return list(self) == [float(value) for value in other]  # type: ignore[union-attr]
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Vector({tuple(self._values)!r})"
+
+    def _axis(index: int):  # type: ignore[misc]
+        def _get(self: "Vector") -> float:
+            return self._values[index]
+
+        def _set(self: "Vector", value: float) -> None:
+            self._values[index] = float(value)
+
+        return property(_get, _set)
+
+    x = _axis(0)
+    y = _axis(1)
+    z = _axis(2)
+    del _axis
+
+    def copy(self) -> "Vector":
+        return Vector(self._values)
+
+
+class Matrix:
+    __slots__ = ("rows",)
+
+    def __init__(self, rows: Optional[Sequence[Sequence[float]]] = None) -> None:
+        if rows is None:
+            rows = [[1.0 if row == col else 0.0 for col in range(4)] for row in range(4)]
+        self.rows = [[float(value) for value in row] for row in rows]
+
+    @classmethod
+    def Identity(cls, size: int) -> "Matrix":
+        return cls([[1.0 if row == col else 0.0 for col in range(size)] for row in range(size)])
+
+    @classmethod
+    def _from_loc_scale(cls, location: Vector, scale: Vector) -> "Matrix":
+        return cls(
+            [
+                [scale[0], 0.0, 0.0, location[0]],
+                [0.0, scale[1], 0.0, location[1]],
+                [0.0, 0.0, scale[2], location[2]],
+                [0.0, 0.0, 0.0, 1.0],
+            ]
+        )
+
+    @property
+    def is_identity(self) -> bool:
+        return self.rows == Matrix.Identity(4).rows
+
+    def __matmul__(self, other):  # type: ignore[no-untyped-def]
+        if isinstance(other, Matrix):
+            return Matrix(
+                [
+                    [sum(self.rows[row][k] * other.rows[k][col] for k in range(4)) for col in range(4)]
+                    for row in range(4)
+                ]
+            )
+        point = list(other) + [1.0]
+        return Vector(sum(self.rows[row][k] * point[k] for k in range(4)) for row in range(3))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Matrix) and self.rows == other.rows
+
+
+class _Property:
+    """Vector-valued attribute that accepts tuple assignment, like bpy props."""
+
+    def __init__(self, default: Tuple[float, ...]) -> None:
+        self.default = default
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr = f"_{name}"
+
+    def __get__(self, instance: object, owner: type) -> Vector:
+        if instance is None:
+            return self  # type: ignore[return-value]
+        value = instance.__dict__.get(self.attr)
+        if value is None:
+            value = Vector(self.default)
+            instance.__dict__[self.attr] = value
+        return value
+
+    def __set__(self, instance: object, value: Iterable[float]) -> None:
+        instance.__dict__[self.attr] = Vector(value)
+
+
+class _ID:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._props: Dict[str, object] = {}
+        self.use_fake_user = False
+        self.library: Optional[str] = None
+
+    def as_pointer(self) -> int:
+        return id(self)
+
+    @property
+    def users(self) -> int:
+        # As in Blender: one per object using this as its data, one per mesh
+        # material slot holding it, plus the fake user.
+        data = getattr(sys.modules.get("bpy"), "data", None)
+        count = int(self.use_fake_user)
+        if data is not None:
+            count += sum(1 for obj in data.objects._items.values() if obj.data is self)
+            count += sum(mesh.materials.count(self) for mesh in data.meshes._items.values())
+        return count
+
+    def __getitem__(self, key: str) -> object:
+        return self._props[key]
+
+    def __setitem__(self, key: str, value: object) -> None:
+        self._props[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._props[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._props
+
+    def get(self, key: str, default: object = None) -> object:
+        return self._props.get(key, default)
+
+    def keys(self) -> List[str]:
+        return list(self._props)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class _Attribute:
+    def __init__(self, name: str, type_: str, domain: str, size: int) -> None:
+        self.name = name
+        self.data_type = type_
+        self.domain = domain
+        self.data = _ElementArray({"value": 1})
+        self.data.add(size)
+        self.data.foreach_set("value", [0] * size)
+
+
+class _Attributes(dict):
+    def __init__(self, mesh: "Mesh") -> None:
+        super().__init__()
+        self._mesh = mesh
+
+    def new(self, name: str, type: str, domain: str) -> _Attribute:  # noqa: A002
+        size = len(self._mesh.polygons) if domain == "FACE" else len(self._mesh.vertices)
+        attribute = _Attribute(name, type, domain, size)
+        self[name] = attribute
+        return attribute
+
+    def remove(self, attribute: _Attribute) -> None:
+        self.pop(attribute.name, None)
+
+
+class _ElementArray(list):
+    """Mesh element storage supporting `add` and flat `foreach_set`/`foreach_get`."""
+
+    def __init__(self, fields: Dict[str, int]) -> None:
+        super().__init__()
+        self._fields = fields
+
+    def add(self, count: int) -> None:
+        for _ in range(count):
+            self.append(types.SimpleNamespace(**{key: None for key in self._fields}))
+
+    def foreach_set(self, key: str, values: Sequence[float]) -> None:
+        STATS["foreach_set"] += 1
+        width = self._fields[key]
+        flat = list(values)
+        for index, item in enumerate(self):
+            if width == 1:
+                setattr(item, key, flat[index])
+            else:
+                setattr(item, key, tuple(flat[index * width : (index + 1) * width]))
+
+    def foreach_get(self, key: str, buffer: List[float]) -> None:
+        width = self._fields[key]
+        for index, item in enumerate(self):
+            value = getattr(item, key)
+            if width == 1:
+                buffer[index] = value
+            else:
+                buffer[index * width : (index + 1) * width] = list(value)
+
+
+class Mesh(_ID):
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.vertices = _ElementArray({"co": 3})
+        self.loops = _ElementArray({"vertex_index": 1})
+        self.polygons = _ElementArray({"loop_start": 1, "loop_total": 1})
+        self.attributes = _Attributes(self)
+        self.materials: List[object] = []
+
+    def from_pydata(self, vertices, edges, faces) -> None:  # type: ignore[no-untyped-def]
+        self.vertices.add(len(vertices))
+        self.vertices.foreach_set("co", [value for vertex in vertices for value in vertex])
+        loop_start = 0
+        starts: List[int] = []
+        totals: List[int] = []
+        indices: List[int] = []
+        for face in faces:
+            starts.append(loop_start)
+            totals.append(len(face))
+            indices.extend(face)
+            loop_start += len(face)
+        self.loops.add(len(indices))
+        self.loops.foreach_set("vertex_index", indices)
+        self.polygons.add(len(faces))
+        self.polygons.foreach_set("loop_start", starts)
+        self.polygons.foreach_set("loop_total", totals)
+
+    def clear_geometry(self) -> None:
+        self.vertices = _ElementArray({"co": 3})
+        self.loops = _ElementArray({"vertex_index": 1})
+        self.polygons = _ElementArray({"loop_start": 1, "loop_total": 1})
+
+    def update(self) -> None:
+        STATS["mesh_updates"] += 1
+
+    def validate(self) -> bool:
+        return False
+
+    def local_bounds(self) -> Optional[List[Tuple[float, float, float]]]:
+        if not self.vertices:
+            return None
+        xs = [vertex.co[0] for vertex in self.vertices]
+        ys = [vertex.co[1] for vertex in self.vertices]
+        zs = [vertex.co[2] for vertex in self.vertices]
+        lo = (min(xs), min(ys), min(zs))
+        hi = (max(xs), max(ys), max(zs))
+        return [
+            (x, y, z)
+            for x in (lo[0], hi[0])
+            for y in (lo[1], hi[1])
+            for z in (lo[2], hi[2])
+        ]
+
+
+class Object(_ID):
+    location = _Property((0.0, 0.0, 0.0))
+    scale = _Property((1.0, 1.0, 1.0))
+    rotation_euler = _Property((0.0, 0.0, 0.0))
+
+    def __init__(self, name: str, data: Optional[_ID]) -> None:
+        super().__init__(name)
+        self.data = data
+        self.type = "MESH" if isinstance(data, Mesh) else "EMPTY"
+        self.rotation_mode = "XYZ"
+        self.parent: Optional[Object] = None
+        self.matrix_parent_inverse = Matrix.Identity(4)
+        self.modifiers: List[object] = []
+        self.vertex_groups = _VertexGroups()
+        self.users_collection: List[Collection] = []
+        self.instance_type = "NONE"
+        self.instance_collection: Optional[Collection] = None
+        self.empty_display_size = 1.0
+        self.hide_viewport = False
+        self.hide_render = False
+
+    @property
+    def matrix_basis(self) -> Matrix:
+        return Matrix._from_loc_scale(self.location, self.scale)
+
+    @property
+    def matrix_world(self) -> Matrix:
+        local = self.matrix_basis
+        if self.parent is None:
+            return local
+        return self.parent.matrix_world @ self.matrix_parent_inverse @ local
+
+    @property
+    def bound_box(self) -> Optional[List[Tuple[float, float, float]]]:
+        if isinstance(self.data, Mesh):
+            return self.data.local_bounds()
+        return None
+
+    def evaluated_get(self, depsgraph: "Depsgraph") -> "Object":
+        STATS["evaluated_get"] += 1
+        return self
+
+
+class _VertexGroup:
+    def __init__(self, name: str, index: int) -> None:
+        self.name = name
+        self.index = index
+        self.weights: Dict[int, float] = {}
+
+    def add(self, indices: Sequence[int], weight: float, mode: str) -> None:
+        STATS["vertex_group_add"] += 1
+        for index in indices:
+            self.weights[index] = weight
+
+
+class _VertexGroups(list):
+    def new(self, name: str) -> _VertexGroup:
+        group = _VertexGroup(name, len(self))
+        self.append(group)
+        return group
+
+    def get(self, name: str) -> Optional[_VertexGroup]:
+        for group in self:
+            if group.name == name:
+                return group
+        return None
+
+
+class _CollectionObjects:
+    def __init__(self, owner: "Collection") -> None:
+        self._owner = owner
+        self._objects: Dict[str, Object] = {}
+
+    def link(self, obj: Object) -> None:
+        STATS["links"] += 1
+        if obj.name in self._objects:
+            raise RuntimeError(f"Object '{obj.name}' already in collection '{self._owner.name}'")
+        self._objects[obj.name] = obj
+        obj.users_collection.append(self._owner)
+
+    def unlink(self, obj: Object) -> None:
+        STATS["unlinks"] += 1
+        self._objects.pop(obj.name, None)
+        if self._owner in obj.users_collection:
+            obj.users_collection.remove(self._owner)
+
+    def get(self, name: str) -> Optional[Object]:
+        return self._objects.get(name)
+
+    def __iter__(self) -> Iterator[Object]:
+        STATS["collection_scans"] += 1
+        return iter(list(self._objects.values()))
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._objects
+
+
+class _CollectionChildren(list):
+    def link(self, collection: "Collection") -> None:
+        self.append(collection)
+
+    def unlink(self, collection: "Collection") -> None:
+        self.remove(collection)
+
+
+class Collection(_ID):
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.objects = _CollectionObjects(self)
+        self.children = _CollectionChildren()
+        self.hide_render = False
+        self.hide_viewport = False
+        self.instance_offset = Vector((0.0, 0.0, 0.0))
+
+    @property
+    def all_objects(self) -> List[Object]:
+        found = list(self.objects._objects.values())
+        for child in self.children:
+            found.extend(child.all_objects)
+        return found
+
+
+class _IDCollection:
+    def __init__(self, factory) -> None:  # type: ignore[no-untyped-def]
+        self._factory = factory
+        self._items: Dict[str, _ID] = {}
+
+    def _unique_name(self, name: str) -> str:
+        if name not in self._items:
+            return name
+        suffix = 1
+        while f"{name}.{suffix:03d}" in self._items:
+            suffix += 1
+        return f"{name}.{suffix:03d}"
+
+    def new(self, name: str, *args: object) -> _ID:
+        STATS[f"{self._factory.__name__.lower()}_created"] += 1
+        item = self._factory(self._unique_name(name), *args)
+        self._items[item.name] = item
+        return item
+
+    def get(self, name: str, default: object = None) -> Optional[_ID]:
+        STATS["data_lookups"] += 1
+        return self._items.get(name, default)  # type: ignore[return-value]
+
+    def __contains__(self, name: object) -> bool:
+        STATS["data_lookups"] += 1
+        return name in self._items
+
+    def __getitem__(self, name: str) -> _ID:
+        return self._items[name]
+
+    def __iter__(self) -> Iterator[_ID]:
+        STATS["data_scans"] += 1
+        return iter(list(self._items.values()))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def remove(self, item: _ID, do_unlink: bool = True) -> None:
+        STATS["removes"] += 1
+        self._discard(item)
+
+    def _discard(self, item: _ID) -> None:
+        self._items.pop(item.name, None)
+        if isinstance(item, Object):
+            for collection in list(item.users_collection):
+                collection.objects._objects.pop(item.name, None)
+            item.users_collection.clear()
+
+
+class Depsgraph:
+    pass
+
+
+class _Scene(dict):
+    # Custom properties live in the dict, as with bpy ID properties.
+    def __init__(self) -> None:
+        super().__init__()
+        self.collection = Collection("Scene Collection")
+
+
+class _LayerCollection:
+    # Built on access from the scene's collection tree; exclusion is kept by name.
+    def __init__(self, collection: Collection, excluded: Set[str]) -> None:
+        self.collection = collection
+        self.name = collection.name
+        self._excluded = excluded
+
+    @property
+    def children(self) -> List["_LayerCollection"]:
+        return [_LayerCollection(child, self._excluded) for child in self.collection.children]
+
+    @property
+    def exclude(self) -> bool:
+        return self.name in self._excluded
+
+    @exclude.setter
+    def exclude(self, value: bool) -> None:
+        if value:
+            self._excluded.add(self.name)
+        else:
+            self._excluded.discard(self.name)
+
+
+class _ViewLayer:
+    def __init__(self, scene: _Scene) -> None:
+        self._scene = scene
+        self.excluded: Set[str] = set()
+
+    @property
+    def layer_collection(self) -> _LayerCollection:
+        return _LayerCollection(self._scene.collection, self.excluded)
+
+    def update(self) -> None:
+        return None
+
+
+class _LibraryLoad:
+    # `with bpy.data.libraries.load(path, link=True) as (data_from, data_to)`:
+    # names put on data_to become linked datablocks on exit.
+    def __init__(self, module: "FakeBpy", filepath: str) -> None:
+        self._module = module
+        self._filepath = filepath
+        self._data_to = types.SimpleNamespace(collections=[], objects=[])
+
+    def __enter__(self) -> Tuple[types.SimpleNamespace, types.SimpleNamespace]:
+        STATS["library_loads"] += 1
+        return types.SimpleNamespace(collections=[], objects=[]), self._data_to
+
+    def __exit__(self, *exc_info: object) -> None:
+        linked = []
+        for name in self._data_to.collections:
+            collection = self._module.data.collections.new(name)
+            collection.library = self._filepath
+            linked.append(collection)
+        self._data_to.collections = linked
+
+
+class _Ops:
+    def __init__(self, module: "FakeBpy") -> None:
+        self.wm = types.SimpleNamespace(
+            save_mainfile=module._save_mainfile,
+            read_homefile=module._read_homefile,
+            open_mainfile=module._open_mainfile,
+            save_as_mainfile=module._save_mainfile,
+        )
+
+
+# The `bpy.data` collections a saved file carries.
+SESSION_DATA = ("objects", "meshes", "collections", "cameras", "lights", "materials", "worlds")
+
+
+class FakeBpy(types.ModuleType):
+    def __init__(self) -> None:
+        super().__init__("bpy")
+        self.stats = STATS
+        self.saved: List[str] = []
+        self.library_writes: Dict[str, List[str]] = {}
+        # When set, saves also create the file on disk (for code that checks it exists).
+        self.write_files = False
+        self._files: Dict[str, Dict[str, object]] = {}
+        self.ops = _Ops(self)
+        self.app = types.SimpleNamespace(
+            handlers=types.SimpleNamespace(load_post=[], persistent=lambda handler: handler),
+        )
+        self.types = types.SimpleNamespace(Object=Object, Collection=Collection, Mesh=Mesh)
+        self.reset()
+
+    def reset(self, saved: Optional[Dict[str, object]] = None) -> None:
+        self.data = types.SimpleNamespace(
+            objects=_IDCollection(Object),
+            meshes=_IDCollection(Mesh),
+            collections=_IDCollection(Collection),
+            cameras=_IDCollection(_ID),
+            lights=_IDCollection(_ID),
+            materials=_IDCollection(_ID),
+            worlds=_IDCollection(_ID),
+            batch_remove=self._batch_remove,
+            orphans_purge=self._orphans_purge,
+            libraries=types.SimpleNamespace(write=self._libraries_write, load=self._libraries_load),
+            filepath="",
+        )
+        self._depsgraph = Depsgraph()
+        self.context = types.SimpleNamespace(
+            scene=_Scene(),
+            evaluated_depsgraph_get=self._evaluated_depsgraph_get,
+        )
+        self.context.view_layer = _ViewLayer(self.context.scene)
+        if saved is not None:
+            restored = copy.deepcopy(saved)
+            for name in SESSION_DATA:
+                setattr(self.data, name, restored[name])
+            self.context.scene = restored["scene"]
+            self.context.view_layer = _ViewLayer(self.context.scene)
+            self.context.view_layer.excluded = restored["excluded"]
+        # A reset stands in for loading a file.
+        for handler in list(self.app.handlers.load_post):
+            handler(None)
+
+    def _evaluated_depsgraph_get(self) -> Depsgraph:
+        STATS["depsgraph_get"] += 1
+        return self._depsgraph
+
+    def _save_mainfile(self, filepath: str, **_: object) -> Dict[str, str]:
+        STATS["saves"] += 1
+        self.saved.append(filepath)
+        self.data.filepath = filepath
+        self._files[filepath] = copy.deepcopy(
+            {
+                **{name: getattr(self.data, name) for name in SESSION_DATA},
+                "scene": self.context.scene,
+                "excluded": self.context.view_layer.excluded,
+            }
+        )
+        self._touch(filepath)
+        return {"FINISHED"}  # type: ignore[return-value]
+
+    def _read_homefile(self, **_: object) -> Dict[str, str]:
+        STATS["read_homefile"] += 1
+        self.reset()
+        return {"FINISHED"}  # type: ignore[return-value]
+
+    def _open_mainfile(self, filepath: str, **_: object) -> Dict[str, str]:
+        # Restores what `save_mainfile` wrote there, or an empty session at `filepath`.
+        STATS["open_mainfile"] += 1
+        self.reset(self._files.get(filepath))
+        self.data.filepath = filepath
+        return {"FINISHED"}  # type: ignore[return-value]
+
+    def _batch_remove(self, ids: Iterable[_ID]) -> None:
+        STATS["batch_remove"] += 1
+        for item in list(ids):
+            for collection in (
+                self.data.objects,
+                self.data.meshes,
+                self.data.collections,
+                self.data.cameras,
+                self.data.lights,
+                self.data.materials,
+                self.data.worlds,
+            ):
+                if collection._items.get(item.name) is item:
+                    collection._discard(item)
+
+    def _orphans_purge(self, do_local_ids: bool = True, do_linked_ids: bool = True, do_recursive: bool = False) -> int:
+        STATS["orphans_purge"] += 1
+        used = {id(obj.data) for obj in self.data.objects if obj.data is not None}
+        orphans = [mesh for mesh in self.data.meshes if id(mesh) not in used and not mesh.use_fake_user]
+        for mesh in orphans:
+            self.data.meshes._discard(mesh)
+        return len(orphans)
+
+    def _libraries_write(self, filepath: str, datablocks: Iterable[_ID], **_: object) -> None:
+        STATS["library_writes"] += 1
+        self.saved.append(filepath)
+        self.library_writes[filepath] = sorted(item.name for item in datablocks)
+        self._touch(filepath)
+
+    def _libraries_load(self, filepath: str, link: bool = False, relative: bool = False) -> _LibraryLoad:
+        return _LibraryLoad(self, filepath)
+
+    def _touch(self, filepath: str) -> None:
+        if self.write_files:
+            with open(filepath, "wb") as handle:
+                handle.write(b"BLENDER")
+
+
+def install() -> FakeBpy:
+    fake = FakeBpy()
+    mathutils = types.ModuleType("mathutils")
+    mathutils.Vector = Vector  # type: ignore[attr-defined]
+    mathutils.Matrix = Matrix  # type: ignore[attr-defined]
+    sys.modules["bpy"] = fake
+    sys.modules["mathutils"] = mathutils
+    STATS.clear()
+    return fake
+
+
+def uninstall() -> None:
+    sys.modules.pop("bpy", None)
+    sys.modules.pop("mathutils", None)
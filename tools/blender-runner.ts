@@ -1,5 +1,5 @@
 import { spawnSync } from "child_process";
-import { writeFileSync } from "fs";
+import { existsSync, writeFileSync } from "fs";
 import { resolve } from "path";
 import type { AdapterInput } from "../assets/adapters/adapter-input.interface";
 import { buildBedAdapterInput } from "../assets/adapters/buildAdapterInput";
@@ -66,6 +66,12 @@ const BLENDER_BIN =
   process.env.BLENDER_BIN ??
   "/Applications/Blender.app/Contents/MacOS/Blender";
 
+// Built by tools/build_startup_template.py; falls back to factory startup.
+const STARTUP_TEMPLATE =
+  process.env.ARTWORKFLOW_STARTUP_TEMPLATE ??
+  resolve(process.cwd(), "tools", "startup_template.blend");
+const startupArgs = existsSync(STARTUP_TEMPLATE) ? [STARTUP_TEMPLATE] : [];
+
 const env = { ...process.env };
 delete env.PYTHONHOME;
 delete env.PYTHONPATH;
@@ -76,6 +82,7 @@ const result = spawnSync(
   [
     "--background",
     "--factory-startup",
+    ...startupArgs,
     "--python",
     resolve(process.cwd(), "tools", "run_blender.py"),
     "--",
@@ -0,0 +1,438 @@
+"""
+Process-pool supervisor for realisation jobs.
+
+Runs a pool of long-lived workers (`run_blender.py -- --worker` by default),
+shards a job manifest across them, enforces per-job timeouts and retries,
+streams progress as jobs finish and writes a merged results report.
+
+The worker command is pluggable so any process speaking the JSON-lines
+protocol in `tools/worker_protocol.py` can stand in for Blender.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import queue
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from tools.realisation_cache import (  # noqa: E402
+    SIDECAR_SUFFIX,
+    RealisationCache,
+    cache_key,
+    job_adapter_input,
+    job_variant,
+)
+from tools.worker_protocol import decode_line, encode_line, load_manifest  # noqa: E402
+
+DEFAULT_BLENDER_BIN = "/Applications/Blender.app/Contents/MacOS/Blender"
+DEFAULT_TEMPLATE_PATH = os.path.join(REPO_ROOT, "tools", "startup_template.blend")
+TEMPLATE_ENV = "ARTWORKFLOW_STARTUP_TEMPLATE"
+DEFAULT_TIMEOUT = 300.0
+DEFAULT_STARTUP_TIMEOUT = 120.0
+DEFAULT_RETRIES = 1
+# Mirrors plan_export.WRITERS; kept here so the supervisor imports NumPy only when needed.
+EXPORT_EXTENSIONS = (".glb", ".gltf", ".obj")
+
+# Read by interpreters/blender/runtime/python/tracing.py inside the worker.
+TRACE_ENV = "ARTWORKFLOW_TRACE"
+LAUNCHED_AT_ENV = "ARTWORKFLOW_LAUNCHED_AT"
+
+ProgressCallback = Callable[[Mapping[str, object], int, int], None]
+
+
+def startup_template_path() -> Optional[str]:
+    """The startup template from tools/build_startup_template.py, if one has been built."""
+    path = os.environ.get(TEMPLATE_ENV, DEFAULT_TEMPLATE_PATH)
+    return path if path and os.path.exists(path) else None
+
+
+def default_worker_command() -> List[str]:
+    template = startup_template_path()
+    return [
+        os.environ.get("BLENDER_BIN", DEFAULT_BLENDER_BIN),
+        "--background",
+        "--factory-startup",
+        *([template] if template else []),
+        "--python",
+        os.path.join(REPO_ROOT, "tools", "run_blender.py"),
+        "--",
+        "--worker",
+    ]
+
+
+@dataclass(frozen=True)
+class SupervisorConfig:
+    worker_command: Sequence[str]
+    workers: int = 1
+    timeout: float = DEFAULT_TIMEOUT
+    startup_timeout: float = DEFAULT_STARTUP_TIMEOUT
+    retries: int = DEFAULT_RETRIES
+    trace: bool = False
+
+
+class WorkerFailure(RuntimeError):
+    """The worker process timed out, exited or stopped speaking the protocol."""
+
+
+class _Worker:
+    def __init__(self, command: Sequence[str], startup_timeout: float, trace: bool = False) -> None:
+        env = dict(os.environ)
+        # Same isolation as tools/blender-runner.ts: Blender ships its own Python.
+        for key in ("PYTHONHOME", "PYTHONPATH", "VIRTUAL_ENV"):
+            env.pop(key, None)
+        if trace:
+            env[TRACE_ENV] = "1"
+            env[LAUNCHED_AT_ENV] = repr(time.time())
+        try:
+            self._process = subprocess.Popen(
+                list(command),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                env=env,
+            )
+        except OSError as exc:
+            raise WorkerFailure(f"Failed to launch worker: {exc}") from exc
+        self._messages: "queue.Queue[Optional[Dict[str, object]]]" = queue.Queue()
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+        ready = self._next_message(time.monotonic() + startup_timeout, startup_timeout)
+        if ready.get("event") != "ready":
+            self.kill()
+            raise WorkerFailure(f"Worker did not report ready: {ready}")
+
+    @property
+    def pid(self) -> int:
+        return self._process.pid
+
+    def _read(self) -> None:
+        assert self._process.stdout is not None
+        for line in self._process.stdout:
+            try:
+                message = decode_line(line)
+            except ValueError:
+                continue
+            if message is not None:
+                self._messages.put(message)
+        self._messages.put(None)
+
+    def _next_message(self, deadline: float, timeout: float) -> Dict[str, object]:
+        try:
+            message = self._messages.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            raise WorkerFailure(f"Worker timed out after {timeout:g}s") from None
+        if message is None:
+            raise WorkerFailure(f"Worker exited with code {self._process.wait()}")
+        return message
+
+    def run(self, job: Mapping[str, object], timeout: float) -> Dict[str, object]:
+        assert self._process.stdin is not None
+        try:
+            self._process.stdin.write(encode_line(job))
+            self._process.stdin.flush()
+        except OSError as exc:
+            raise WorkerFailure(f"Worker rejected job: {exc}") from exc
+        # One deadline per job: messages for other ids do not extend it.
+        deadline = time.monotonic() + timeout
+        while True:
+            message = self._next_message(deadline, timeout)
+            if message.get("id") == job.get("id"):
+                return message
+
+    def stop(self) -> None:
+        try:
+            assert self._process.stdin is not None
+            self._process.stdin.write(encode_line({"op": "shutdown"}))
+            self._process.stdin.close()
+            self._process.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+
+    def kill(self) -> None:
+        self._process.kill()
+        self._process.wait()
+
+
+def _export_in_process(job: Mapping[str, object]) -> Dict[str, object]:
+    from interpreters.blender.runtime.python.plan_export import export_realisation
+
+    started = time.perf_counter()
+    error: Optional[str] = None
+    outcome: Dict[str, object] = {}
+    try:
+        outcome = export_realisation(job_adapter_input(job), str(job["output"]), lods=bool(job.get("lods")))
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    seconds = time.perf_counter() - started
+    return {
+        "id": job.get("id"),
+        "input": job.get("input"),
+        "output": job.get("output"),
+        "ok": error is None,
+        "error": error,
+        "cached": False,
+        "objectCount": outcome.get("objectCount"),
+        "lods": outcome.get("lods"),
+        "timings": {"total": round(seconds, 6)},
+        "attempts": 1,
+        "worker": None,
+        "seconds": round(seconds, 4),
+    }
+
+
+def _worker_result(
+    job: Mapping[str, object],
+    outcome: Mapping[str, object],
+    attempt: int,
+    slot: int,
+    started: float,
+) -> Dict[str, object]:
+    return {
+        "id": job.get("id"),
+        "input": job.get("input"),
+        "output": job.get("output"),
+        "ok": bool(outcome.get("ok")),
+        "error": outcome.get("error"),
+        "cached": False,
+        "objectCount": outcome.get("objectCount"),
+        "timings": outcome.get("timings"),
+        "fingerprint": outcome.get("fingerprint"),
+        "sidecar": outcome.get("sidecar"),
+        "lods": outcome.get("lods"),
+        "trace": outcome.get("trace"),
+        "attempts": attempt,
+        "worker": slot,
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+
+
+def _cached_lods(job: Mapping[str, object]) -> Optional[Dict[str, object]]:
+    # The cache holds the main artefact only; the LOD chain is cheap to rebuild without Blender.
+    if not job.get("lods"):
+        return None
+    from interpreters.blender.runtime.python.lod_chain import write_lod_chain
+
+    return write_lod_chain(job_adapter_input(job), str(job["output"]))
+
+
+def run_jobs(
+    jobs: Sequence[Mapping[str, object]],
+    config: SupervisorConfig,
+    on_progress: Optional[ProgressCallback] = None,
+    cache: Optional[RealisationCache] = None,
+) -> List[Dict[str, object]]:
+    """
+    Realise `jobs` across `config.workers` workers and return one result per
+    job, in input order. Timeouts and worker crashes are retried up to
+    `config.retries` times on a fresh worker; errors reported by the realiser
+    itself are deterministic and are not retried.
+
+    With a `cache`, hits are copied into place without touching a worker and
+    successful realisations are stored for next time.
+
+    Jobs whose output is glTF/OBJ (`EXPORT_EXTENSIONS`) need no Blender and are
+    exported in-process by `plan_export` instead of being sent to a worker,
+    on the calling thread once the pool is already working on the rest.
+    """
+    results: List[Optional[Dict[str, object]]] = [None] * len(jobs)
+    remaining = [len(jobs)]
+    lock = threading.Lock()
+    keys: List[Optional[str]] = [None] * len(jobs)
+
+    def _finish(index: int, result: Dict[str, object]) -> None:
+        with lock:
+            results[index] = result
+            remaining[0] -= 1
+            done = len(jobs) - remaining[0]
+            if on_progress is not None:
+                on_progress(result, done, len(jobs))
+
+    pending: "queue.Queue[tuple[int, int]]" = queue.Queue()
+    exports: List[int] = []
+    for index, job in enumerate(jobs):
+        if cache is not None:
+            try:
+                keys[index] = cache_key(job_adapter_input(job), job_variant(job))
+            except (OSError, ValueError, KeyError):
+                keys[index] = None
+            entry = cache.fetch(keys[index], str(job["output"])) if keys[index] is not None else None
+            if entry is not None:
+                _finish(
+                    index,
+                    {
+                        "id": job.get("id"),
+                        "input": job.get("input"),
+                        "output": job.get("output"),
+                        "ok": True,
+                        "error": None,
+                        "cached": True,
+                        "fingerprint": entry.get("fingerprint"),
+                        "sidecar": f"{job['output']}{SIDECAR_SUFFIX}" if entry.get("sidecar") else None,
+                        "lods": _cached_lods(job),
+                        "attempts": 0,
+                        "worker": None,
+                        "seconds": 0.0,
+                    },
+                )
+                continue
+        if os.path.splitext(str(job.get("output", "")))[1].lower() in EXPORT_EXTENSIONS:
+            exports.append(index)
+            continue
+        pending.put((index, 1))
+
+    def _worker_loop(slot: int) -> None:
+        worker: Optional[_Worker] = None
+        try:
+            while True:
+                with lock:
+                    if remaining[0] == 0:
+                        return
+                try:
+                    index, attempt = pending.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                job = jobs[index]
+                started = time.perf_counter()
+                try:
+                    try:
+                        if worker is None:
+                            worker = _Worker(config.worker_command, config.startup_timeout, config.trace)
+                        outcome = worker.run(job, config.timeout)
+                    except WorkerFailure as exc:
+                        if worker is not None:
+                            worker.kill()
+                            worker = None
+                        if attempt <= config.retries:
+                            pending.put((index, attempt + 1))
+                            continue
+                        outcome = {"ok": False, "error": f"WorkerFailure: {exc}"}
+                    result = _worker_result(job, outcome, attempt, slot, started)
+                    key = keys[index]
+                    if cache is not None and key is not None and result["ok"]:
+                        cache.store(
+                            key,
+                            str(job["output"]),
+                            {"assetId": job_adapter_input(job).get("assetId"), "fingerprint": result["fingerprint"]},
+                        )
+                except Exception as exc:
+                    # Anything else fails this job only; every job must reach _finish or the pool never drains.
+                    failure = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+                    result = _worker_result(job, failure, attempt, slot, started)
+                _finish(index, result)
+        finally:
+            if worker is not None:
+                worker.stop()
+
+    threads = [
+        threading.Thread(target=_worker_loop, args=(slot,), daemon=True)
+        for slot in range(max(1, min(config.workers, len(jobs))))
+    ]
+    for thread in threads:
+        thread.start()
+    for index in exports:
+        _finish(index, _export_in_process(jobs[index]))
+    for thread in threads:
+        thread.join()
+    return [result for result in results if result is not None]
+
+
+def build_report(
+    results: Sequence[Mapping[str, object]],
+    config: SupervisorConfig,
+    seconds: float,
+) -> Dict[str, object]:
+    failed = [result for result in results if not result.get("ok")]
+    return {
+        "ok": not failed,
+        "workers": config.workers,
+        "summary": {
+            "total": len(results),
+            "succeeded": len(results) - len(failed),
+            "failed": len(failed),
+            "cached": sum(1 for result in results if result.get("cached")),
+            "retried": sum(1 for result in results if int(result.get("attempts", 1)) > 1),
+            "seconds": round(seconds, 4),
+        },
+        "jobs": list(results),
+    }
+
+
+def _print_progress(result: Mapping[str, object], done: int, total: int) -> None:
+    status = "ok" if result.get("ok") else f"failed ({result.get('error')})"
+    if result.get("cached"):
+        print(f"[Supervisor] {done}/{total} {result.get('id')}: cached", flush=True)
+        return
+    print(
+        f"[Supervisor] {done}/{total} {result.get('id')}: {status} "
+        f"({result.get('seconds')}s, worker {result.get('worker')}, attempt {result.get('attempts')})",
+        flush=True,
+    )
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Realise a job manifest across a pool of workers.")
+    parser.add_argument("manifest", help="Job manifest (same format as run_blender.py --manifest).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Per-job timeout in seconds.")
+    parser.add_argument("--startup-timeout", type=float, default=DEFAULT_STARTUP_TIMEOUT)
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES)
+    parser.add_argument("--report", help="Where to write the merged report (defaults to the manifest's).")
+    parser.add_argument(
+        "--worker-command",
+        help="Worker command line; defaults to Blender running run_blender.py in worker mode.",
+    )
+    parser.add_argument("--cache", action="store_true", help="Reuse and fill the realisation cache.")
+    parser.add_argument("--cache-dir", help="Cache location (implies --cache).")
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Have workers write a Chrome trace next to each output (<output>.trace.json).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    jobs, manifest_report_path = load_manifest(args.manifest)
+    worker_command = shlex.split(args.worker_command) if args.worker_command else default_worker_command()
+    config = SupervisorConfig(
+        worker_command=worker_command,
+        workers=max(1, args.workers),
+        timeout=args.timeout,
+        startup_timeout=args.startup_timeout,
+        retries=max(0, args.retries),
+        trace=args.trace,
+    )
+
+    started = time.perf_counter()
+    cache = RealisationCache(args.cache_dir) if args.cache or args.cache_dir else None
+    results = run_jobs(jobs, config, on_progress=_print_progress, cache=cache)
+    report = build_report(results, config, time.perf_counter() - started)
+
+    report_path = args.report or manifest_report_path
+    if report_path:
+        with open(report_path, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    summary = report["summary"]
+    print(
+        f"[Supervisor] {summary['succeeded']}/{summary['total']} succeeded "
+        f"in {summary['seconds']}s across {config.workers} workers"
+    )
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
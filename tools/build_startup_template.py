@@ -0,0 +1,69 @@
+"""
+Build the minimal startup template that realisation runs open instead of
+Blender's factory startup file.
+
+    blender --background --factory-startup --python tools/build_startup_template.py -- [tools/startup_template.blend]
+
+The template holds an empty scene (no cube, camera, light, world or material)
+and the shared `__unit_cube__` mesh, kept with a fake user. Launch it with:
+
+    blender --background --factory-startup tools/startup_template.blend --python tools/run_blender.py -- ...
+
+`run_blender.py` recognises the template by a scene property, skips the default
+mesh cleanup and reopens the template between jobs. Add-ons are preferences,
+not file data, so `--factory-startup` is what keeps user add-ons from loading.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import bpy  # type: ignore
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+DEFAULT_TEMPLATE_PATH = os.path.join(REPO_ROOT, "tools", "startup_template.blend")
+TEMPLATE_MARKER = "artworkflow_template"
+TEMPLATE_VERSION = 1
+
+
+def _output_path(argv: list[str]) -> str:
+    args = argv[argv.index("--") + 1 :] if "--" in argv else []
+    return os.path.abspath(args[0]) if args else DEFAULT_TEMPLATE_PATH
+
+
+def _clear_startup_data() -> int:
+    from interpreters.blender.runtime.python.blender_teardown import teardown
+
+    doomed = [
+        item
+        for datablocks in (
+            bpy.data.objects,
+            bpy.data.meshes,
+            bpy.data.cameras,
+            bpy.data.lights,
+            bpy.data.materials,
+            bpy.data.worlds,
+        )
+        for item in datablocks
+    ]
+    return int(teardown(doomed)["removed"])
+
+
+def build_template(output_path: str) -> None:
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    from interpreters.blender.runtime.python.blender_plan_applier import ensure_unit_cube
+
+    removed = _clear_startup_data()
+    cube_mesh = ensure_unit_cube()
+    cube_mesh.use_fake_user = True
+    bpy.context.scene[TEMPLATE_MARKER] = TEMPLATE_VERSION
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    bpy.ops.wm.save_as_mainfile(filepath=output_path, compress=False)
+    print(f"[Template] wrote {output_path} (removed {removed} startup datablocks)")
+
+
+if __name__ == "__main__":
+    build_template(_output_path(sys.argv))
@@ -0,0 +1,97 @@
+"""
+Compute and compare realisation plans without Blender.
+
+    python tools/plan_realisation.py plan chair_input.json table_input.json --out plans/
+    python tools/plan_realisation.py diff plans/old.plan.json plans/new.plan.json
+
+`diff` exits with code 1 when the plans differ, so it can gate CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from interpreters.blender.runtime.python.realisation_plan import (  # noqa: E402
+    RealisationPlan,
+    plan_realisation,
+)
+
+DIFF_PRECISION = 6
+
+
+def _load_plan(path: str) -> RealisationPlan:
+    with open(path, "r", encoding="utf-8") as handle:
+        return RealisationPlan.from_dict(json.load(handle))
+
+
+def _rows(plan: RealisationPlan) -> Dict[str, Tuple[object, ...]]:
+    rows: Dict[str, Tuple[object, ...]] = {}
+    for _, name, kind, parent, location, scale in plan.rows():
+        parent_name = plan.names[parent] if parent >= 0 else None
+        rows[name] = (
+            kind,
+            parent_name,
+            tuple(round(value, DIFF_PRECISION) for value in location),
+            tuple(round(value, DIFF_PRECISION) for value in scale),
+        )
+    return rows
+
+
+def diff_plans(old: RealisationPlan, new: RealisationPlan) -> List[str]:
+    old_rows = _rows(old)
+    new_rows = _rows(new)
+    lines: List[str] = []
+    for name in new.names:
+        if name not in old_rows:
+            lines.append(f"+ {name} {new_rows[name]}")
+        elif old_rows[name] != new_rows[name]:
+            lines.append(f"~ {name} {old_rows[name]} -> {new_rows[name]}")
+    for name in old.names:
+        if name not in new_rows:
+            lines.append(f"- {name} {old_rows[name]}")
+    return lines
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compute or compare realisation plans.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    plan = commands.add_parser("plan")
+    plan.add_argument("inputs", nargs="+", help="Adapter input JSON files.")
+    plan.add_argument("--out", help="Directory for <assetId>.plan.json files (default: stdout).")
+    diff = commands.add_parser("diff")
+    diff.add_argument("old")
+    diff.add_argument("new")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.command == "diff":
+        lines = diff_plans(_load_plan(args.old), _load_plan(args.new))
+        for line in lines:
+            print(line)
+        return 1 if lines else 0
+
+    for input_path in args.inputs:
+        with open(input_path, "r", encoding="utf-8") as handle:
+            plan = plan_realisation(json.load(handle))
+        if not args.out:
+            print(plan.to_json())
+            continue
+        os.makedirs(args.out, exist_ok=True)
+        with open(os.path.join(args.out, f"{plan.assetId}.plan.json"), "w", encoding="utf-8") as handle:
+            handle.write(plan.to_json())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+"""
+Content-addressed cache of realised artefacts.
+
+Entries are keyed on a canonical hash of the adapter input plus a fingerprint
+of the realiser source that would produce them, so the same input realised by
+the same code is only ever built once. The cache is size bounded and evicts
+least recently used entries first.
+
+    python tools/realisation_cache.py stats
+    python tools/realisation_cache.py list
+    python tools/realisation_cache.py purge [--key KEY ... | --older-than DAYS]
+    python tools/realisation_cache.py evict [--max-bytes N]
+    python tools/realisation_cache.py fetch chair_input.json chair_output.blend
+    python tools/realisation_cache.py store chair_input.json chair_output.blend
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from typing import Dict, List, Mapping, Optional, Sequence
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+RUNTIME_DIR = os.path.join(REPO_ROOT, "interpreters", "blender", "runtime", "python")
+RUN_BLENDER_PATH = os.path.join(REPO_ROOT, "tools", "run_blender.py")
+
+REALISER_MODULES = {
+    "chair": "blender_chair_realiser.py",
+    "table": "blender_table_realiser.py",
+    "bed": "blender_bed_realiser.py",
+}
+
+DEFAULT_MAX_BYTES = 2 * 1024**3
+INDEX_FILE = "index.json"
+# Mirrors blender_ergonomics.SIDECAR_SUFFIX; kept here so the cache needs no NumPy.
+SIDECAR_SUFFIX = ".ergonomics.json"
+
+
+def default_cache_dir() -> str:
+    configured = os.environ.get("ARTWORKFLOW_CACHE_DIR")
+    if configured:
+        return configured
+    return os.path.join(os.path.expanduser("~"), ".cache", "artworkflow", "realisations")
+
+
+def default_max_bytes() -> int:
+    configured = os.environ.get("ARTWORKFLOW_CACHE_MAX_BYTES")
+    return int(configured) if configured else DEFAULT_MAX_BYTES
+
+
+def canonical_input_hash(adapter_input: Mapping[str, object]) -> str:
+    canonical = json.dumps(adapter_input, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def realiser_fingerprint(archetype: str, runtime_dir: str = RUNTIME_DIR) -> str:
+    """
+    Hash the archetype's realiser module, the shared runtime modules it may
+    import, and the runner that saves the result. Other archetypes' realisers
+    are left out so editing one realiser does not invalidate the others.
+    """
+    module = REALISER_MODULES.get(archetype)
+    if module is None:
+        raise ValueError(f"Unsupported archetype: {archetype}")
+    other_realisers = set(REALISER_MODULES.values()) - {module}
+    sources = [
+        os.path.join(runtime_dir, name)
+        for name in sorted(os.listdir(runtime_dir))
+        if name.endswith(".py") and name not in other_realisers
+    ]
+    if os.path.exists(RUN_BLENDER_PATH):
+        sources.append(RUN_BLENDER_PATH)
+
+    digest = hashlib.sha256()
+    for path in sources:
+        digest.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as handle:
+            digest.update(handle.read())
+    return digest.hexdigest()
+
+
+def cache_key(adapter_input: Mapping[str, object], variant: str = "") -> str:
+    """`variant` distinguishes output options that change the artefact (e.g. file format)."""
+    archetype = str(adapter_input.get("archetype"))
+    parts = [canonical_input_hash(adapter_input), realiser_fingerprint(archetype), variant]
+    return hashlib.sha256(":".join(parts).encode("utf-8")).hexdigest()
+
+
+def job_adapter_input(job: Mapping[str, object]) -> Mapping[str, object]:
+    adapter_input = job.get("adapterInput")
+    if isinstance(adapter_input, Mapping):
+        return adapter_input
+    with open(str(job["input"]), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def job_variant(job: Mapping[str, object]) -> str:
+    # Anything that changes the artefact for the same input belongs here.
+    variant = os.path.splitext(str(job.get("output", "")))[1]
+    if job.get("outputMode", "mainfile") != "mainfile":
+        variant += f":{job['outputMode']}"
+    if job.get("compress"):
+        variant += ":compress"
+    if job.get("geometry", "objects") != "objects":
+        variant += f":{job['geometry']}"
+    return variant
+
+
+class RealisationCache:
+    def __init__(self, root: Optional[str] = None, max_bytes: Optional[int] = None) -> None:
+        self.root = root or default_cache_dir()
+        self.max_bytes = default_max_bytes() if max_bytes is None else max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.root, exist_ok=True)
+
+    def _index_path(self) -> str:
+        return os.path.join(self.root, INDEX_FILE)
+
+    def _read_index(self) -> Dict[str, Dict[str, object]]:
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index: Mapping[str, Mapping[str, object]]) -> None:
+        temp_path = f"{self._index_path()}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(index, handle, indent=2, sort_keys=True)
+        os.replace(temp_path, self._index_path())
+
+    def _artefact_path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.root, "objects", key[:2], f"{key}{suffix}")
+
+    def entries(self) -> List[Dict[str, object]]:
+        with self._lock:
+            index = self._read_index()
+        return [
+            {"key": key, **entry}
+            for key, entry in sorted(index.items(), key=lambda item: item[1]["lastUsed"], reverse=True)
+        ]
+
+    def total_bytes(self) -> int:
+        return sum(int(entry["size"]) for entry in self.entries())
+
+    def fetch(self, key: str, destination: str, link: bool = False) -> Optional[Dict[str, object]]:
+        """
+        Copy (or hard-link) a cached artefact to `destination`, together with its
+        ergonomics sidecar; a sidecar already there is removed when the entry
+        has none. Returns its index entry (the stored meta, such as the
+        fingerprint, plus bookkeeping), or None on a miss.
+        """
+        with self._lock:
+            index = self._read_index()
+            entry = index.get(key)
+            if entry is None:
+                return None
+            source = os.path.join(self.root, str(entry["file"]))
+            sidecar = os.path.join(self.root, str(entry["sidecar"])) if entry.get("sidecar") else None
+            if not os.path.exists(source) or (sidecar is not None and not os.path.exists(sidecar)):
+                self._remove(index, key)
+                self._write_index(index)
+                return None
+            os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+            _place(source, destination, link)
+            if sidecar is not None:
+                _place(sidecar, destination + SIDECAR_SUFFIX, link)
+            elif os.path.exists(destination + SIDECAR_SUFFIX):
+                os.unlink(destination + SIDECAR_SUFFIX)
+            entry["lastUsed"] = time.time()
+            entry["hits"] = int(entry.get("hits", 0)) + 1
+            self._write_index(index)
+        return dict(entry)
+
+    def store(self, key: str, artefact_path: str, meta: Optional[Mapping[str, object]] = None) -> None:
+        suffix = os.path.splitext(artefact_path)[1]
+        target = self._artefact_path(key, suffix)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        temp_path = f"{target}.{os.getpid()}.tmp"
+        shutil.copyfile(artefact_path, temp_path)
+        os.replace(temp_path, target)
+        size = os.path.getsize(target)
+        sidecar: Optional[str] = None
+        if os.path.exists(artefact_path + SIDECAR_SUFFIX):
+            sidecar = target + SIDECAR_SUFFIX
+            shutil.copyfile(artefact_path + SIDECAR_SUFFIX, temp_path)
+            os.replace(temp_path, sidecar)
+            size += os.path.getsize(sidecar)
+        elif os.path.exists(target + SIDECAR_SUFFIX):
+            os.unlink(target + SIDECAR_SUFFIX)
+        now = time.time()
+        with self._lock:
+            index = self._read_index()
+            index[key] = {
+                **(meta or {}),
+                "file": os.path.relpath(target, self.root),
+                "sidecar": os.path.relpath(sidecar, self.root) if sidecar is not None else None,
+                "size": size,
+                "created": now,
+                "lastUsed": now,
+                "hits": 0,
+            }
+            self._evict(index, self.max_bytes)
+            self._write_index(index)
+
+    def _remove(self, index: Dict[str, Dict[str, object]], key: str) -> None:
+        entry = index.pop(key)
+        for name in (entry["file"], entry.get("sidecar")):
+            path = os.path.join(self.root, str(name)) if name else None
+            if path is not None and os.path.exists(path):
+                os.unlink(path)
+
+    def _evict(self, index: Dict[str, Dict[str, object]], max_bytes: int) -> List[str]:
+        total = sum(int(entry["size"]) for entry in index.values())
+        evicted: List[str] = []
+        for key in sorted(index, key=lambda item: index[item]["lastUsed"]):
+            if total <= max_bytes:
+                break
+            total -= int(index[key]["size"])
+            self._remove(index, key)
+            evicted.append(key)
+        return evicted
+
+    def evict(self, max_bytes: Optional[int] = None) -> List[str]:
+        with self._lock:
+            index = self._read_index()
+            evicted = self._evict(index, self.max_bytes if max_bytes is None else max_bytes)
+            self._write_index(index)
+        return evicted
+
+    def purge(self, keys: Optional[Sequence[str]] = None, older_than: Optional[float] = None) -> List[str]:
+        """Remove the given keys, entries unused for `older_than` seconds, or everything."""
+        with self._lock:
+            index = self._read_index()
+            if keys is not None:
+                targets = [key for key in keys if key in index]
+            elif older_than is not None:
+                cutoff = time.time() - older_than
+                targets = [key for key, entry in index.items() if float(entry["lastUsed"]) < cutoff]
+            else:
+                targets = list(index)
+            for key in targets:
+                self._remove(index, key)
+            self._write_index(index)
+        return targets
+
+
+def _place(source: str, destination: str, link: bool) -> None:
+    if os.path.exists(destination):
+        os.unlink(destination)
+    if link:
+        try:
+            os.link(source, destination)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(source, destination)
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect and maintain the realisation cache.")
+    parser.add_argument("--cache-dir", default=None)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats")
+    commands.add_parser("list")
+    purge = commands.add_parser("purge")
+    purge.add_argument("--key", action="append")
+    purge.add_argument("--older-than", type=float, help="Days since last use.")
+    evict = commands.add_parser("evict")
+    evict.add_argument("--max-bytes", type=int)
+    for name in ("fetch", "store"):
+        command = commands.add_parser(name)
+        command.add_argument("input")
+        command.add_argument("output")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    cache = RealisationCache(args.cache_dir)
+
+    if args.command == "stats":
+        entries = cache.entries()
+        print(
+            json.dumps(
+                {
+                    "root": cache.root,
+                    "entries": len(entries),
+                    "bytes": sum(int(entry["size"]) for entry in entries),
+                    "maxBytes": cache.max_bytes,
+                    "hits": sum(int(entry.get("hits", 0)) for entry in entries),
+                },
+                indent=2,
+            )
+        )
+    elif args.command == "list":
+        for entry in cache.entries():
+            print(f"{entry['key'][:16]}  {entry['size']:>10}  {entry.get('assetId', '-')}  {entry['file']}")
+    elif args.command == "purge":
+        older_than = args.older_than * 86400 if args.older_than is not None else None
+        removed = cache.purge(keys=args.key, older_than=older_than)
+        print(f"[Cache] purged {len(removed)} entries")
+    elif args.command == "evict":
+        removed = cache.evict(args.max_bytes)
+        print(f"[Cache] evicted {len(removed)} entries")
+    else:
+        job = {"input": args.input, "output": args.output}
+        adapter_input = job_adapter_input(job)
+        key = cache_key(adapter_input, job_variant(job))
+        if args.command == "fetch":
+            if cache.fetch(key, args.output) is None:
+                print(f"[Cache] miss {key[:16]}")
+                return 1
+            print(f"[Cache] hit {key[:16]} -> {args.output}")
+        else:
+            cache.store(key, args.output, {"assetId": adapter_input.get("assetId")})
+            print(f"[Cache] stored {key[:16]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
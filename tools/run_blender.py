@@ -1,63 +1,627 @@
 from __future__ import annotations
 
+import importlib
 import json
 import os
 import sys
+import time
+import traceback
+from typing import Callable, Dict, List, Mapping, Optional, TextIO
 
 import bpy  # type: ignore
 
+MANIFEST_FLAG = "--manifest"
+WORKER_FLAG = "--worker"
+SOCKET_FLAG = "--socket"
+STREAM_FLAG = "--stream"
+SCENE_FLAG = "--scene"
+SCENE_CHUNKS_FLAG = "--scene-chunks"
+STDIN_PATH = "-"
+TRACE_FLAG = "--trace"
+LIBRARY_FLAG = "--library"
+COMPRESS_FLAG = "--compress"
+MERGED_FLAG = "--merged"
+LODS_FLAG = "--lods"
+UPDATE_FLAG = "--update"
+OPTION_FLAGS = (TRACE_FLAG, LIBRARY_FLAG, COMPRESS_FLAG, MERGED_FLAG, LODS_FLAG, UPDATE_FLAG)
 
-def _parse_args(argv: list[str]) -> tuple[str, str]:
+STARTUP_REPORT_ENV = "ARTWORKFLOW_STARTUP_REPORT"
+LAUNCHED_AT_ENV = "ARTWORKFLOW_LAUNCHED_AT"
+# Set on the scene by tools/build_startup_template.py.
+TEMPLATE_MARKER = "artworkflow_template"
+
+REALISER_MODULES = {
+    "chair": ("interpreters.blender.runtime.python.blender_chair_realiser", "realise_chair"),
+    "table": ("interpreters.blender.runtime.python.blender_table_realiser", "realise_table"),
+    "bed": ("interpreters.blender.runtime.python.blender_bed_realiser", "realise_bed"),
+}
+
+# realise(adapter_input, geometry=...) -> ergonomics report or None
+Realiser = Callable[..., Optional[Mapping[str, object]]]
+
+# Cold-start phases in seconds, written to $ARTWORKFLOW_STARTUP_REPORT on exit.
+_STARTUP: Dict[str, object] = {}
+_TEMPLATE_PATH: Optional[str] = None
+
+
+def _script_args(argv: list[str]) -> list[str]:
     if "--" not in argv:
         raise ValueError("Missing '--' separator for Blender arguments.")
     sep_index = argv.index("--")
-    args = argv[sep_index + 1 :]
+    return [arg for arg in argv[sep_index + 1 :] if arg not in OPTION_FLAGS]
+
+
+def _flag_requested(argv: list[str], flag: str) -> bool:
+    return "--" in argv and flag in argv[argv.index("--") + 1 :]
+
+
+def _output_options(
+    job: Mapping[str, object],
+    defaults: Mapping[str, object],
+) -> Dict[str, object]:
+    # Jobs may override the command-line defaults with "outputMode",
+    # "compress", "geometry", "lods" and "update".
+    return {
+        "outputMode": str(job.get("outputMode", defaults["outputMode"])),
+        "compress": bool(job.get("compress", defaults["compress"])),
+        "geometry": str(job.get("geometry", defaults["geometry"])),
+        "lods": bool(job.get("lods", defaults.get("lods", False))),
+        "update": bool(job.get("update", defaults.get("update", False))),
+    }
+
+
+def _parse_args(args: list[str]) -> tuple[str, str]:
     if len(args) < 2:
         raise ValueError("Expected input and output paths after '--'.")
     return args[0], args[1]
 
 
-def main() -> None:
-    input_path, output_path = _parse_args(sys.argv)
+def _parse_manifest_args(args: list[str]) -> tuple[str, Optional[str]]:
+    if len(args) < 2:
+        raise ValueError(f"Expected a manifest path after '{MANIFEST_FLAG}'.")
+    report_path = args[2] if len(args) > 2 else None
+    return args[1], report_path
+
+
+def _parse_stream_args(args: list[str]) -> tuple[str, str]:
+    if len(args) < 3:
+        raise ValueError(
+            f"Expected an input JSONL path (or '{STDIN_PATH}') and an output directory after '{STREAM_FLAG}'."
+        )
+    return args[1], args[2]
 
+
+def _parse_scene_args(args: list[str]) -> tuple[str, str, Optional[str]]:
+    if len(args) < 3:
+        raise ValueError(f"Expected a scene placements path and an output path after '{SCENE_FLAG}'.")
+    report_path = args[3] if len(args) > 3 else None
+    return args[1], args[2], report_path
+
+
+def _parse_scene_chunks_args(args: list[str]) -> tuple[str, str, str, Optional[float]]:
+    # --scene-chunks scene.json out_dir [zone | grid | grid:<cell size>]
+    if len(args) < 3:
+        raise ValueError(
+            f"Expected a scene placements path and an output directory after '{SCENE_CHUNKS_FLAG}'."
+        )
+    mode, _, cell_size = (args[3] if len(args) > 3 else "zone").partition(":")
+    return args[1], args[2], mode, float(cell_size) if cell_size else None
+
+
+def _parse_worker_args(args: list[str]) -> Optional[str]:
+    if SOCKET_FLAG not in args:
+        return None
+    socket_index = args.index(SOCKET_FLAG)
+    if socket_index + 1 >= len(args):
+        raise ValueError(f"Expected a socket path after '{SOCKET_FLAG}'.")
+    return args[socket_index + 1]
+
+
+def _ensure_repo_on_path() -> None:
     repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    
-    
     if repo_root not in sys.path:
         sys.path.insert(0, repo_root)
 
-    # Remove default mesh objects (e.g. Blender startup cube)
-    for obj in list(bpy.data.objects):
-        if obj.type == "MESH":
-            bpy.data.objects.remove(obj, do_unlink=True)
 
-    with open(input_path, "r", encoding="utf-8") as handle:
-        adapter_input = json.load(handle)
+def _remove_default_meshes() -> Dict[str, object]:
+    # Remove default mesh objects (e.g. Blender startup cube) and their data.
+    from interpreters.blender.runtime.python.blender_teardown import teardown
+
+    return teardown([obj for obj in bpy.data.objects if obj.type == "MESH"])
+
+
+def _loaded_template() -> Optional[str]:
+    if bpy.context.scene.get(TEMPLATE_MARKER) is None:
+        return None
+    return bpy.data.filepath or None
+
+
+def _reset_scene() -> None:
+    # Reload the startup state (template or factory startup file) so every
+    # job starts from the same state a fresh launch would give it.
+    from interpreters.blender.runtime.python.tracing import span
+
+    with span("reset_scene", category="startup"):
+        if _TEMPLATE_PATH:
+            bpy.ops.wm.open_mainfile(filepath=_TEMPLATE_PATH, load_ui=False)
+            return
+        bpy.ops.wm.read_homefile(use_factory_startup=True)
+        _remove_default_meshes()
+
+
+def _open_output(output_path: str, options: Mapping[str, object]) -> bool:
+    # With "update", realise into the existing output so incremental
+    # regeneration only touches the parts that changed.
+    if not options.get("update") or not os.path.exists(output_path):
+        return False
+    from interpreters.blender.runtime.python.tracing import span
+
+    with span("open_output", category="startup", output=output_path):
+        bpy.ops.wm.open_mainfile(filepath=output_path, load_ui=False)
+    return True
+
+
+def _prepare_scene(output_path: str, options: Mapping[str, object], dirty: bool) -> Optional[str]:
+    """Open the job's output for an update, or reset a session an earlier job used; returns what was done."""
+    if _open_output(output_path, options):
+        return "open"
+    if dirty:
+        _reset_scene()
+        return "reset"
+    return None
+
+
+class _LazyRealiserRegistry(Mapping[str, Realiser]):
+    """Imports a realiser module the first time its archetype is requested."""
+
+    def __init__(self) -> None:
+        self._loaded: Dict[str, Realiser] = {}
+
+    def __getitem__(self, archetype: str) -> Realiser:
+        realiser = self._loaded.get(archetype)
+        if realiser is None:
+            from interpreters.blender.runtime.python.tracing import span
+
+            module_name, attribute = REALISER_MODULES[archetype]
+            started = time.perf_counter()
+            with span("import_realiser", category="startup", archetype=archetype):
+                realiser = getattr(importlib.import_module(module_name), attribute)
+            imports = _STARTUP.setdefault("imports", {})
+            imports[archetype] = round(time.perf_counter() - started, 6)  # type: ignore[index]
+            self._loaded[archetype] = realiser
+        return realiser
+
+    def __iter__(self):
+        return iter(REALISER_MODULES)
+
+    def __len__(self) -> int:
+        return len(REALISER_MODULES)
+
+
+def _load_realiser_registry() -> Mapping[str, Realiser]:
+    return _LazyRealiserRegistry()
+
+
+def _write_startup_report() -> None:
+    report_path = os.environ.get(STARTUP_REPORT_ENV)
+    if not report_path:
+        return
+    with open(report_path, "w", encoding="utf-8") as handle:
+        json.dump(_STARTUP, handle, indent=2)
+
+
+def _load_adapter_input(input_path: str) -> Dict[str, object]:
+    from interpreters.blender.runtime.python.tracing import span
+
+    with span("load_input", input=input_path):
+        with open(input_path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+
+
+def _realise_input(
+    adapter_input: Mapping[str, object],
+    output_path: str,
+    registry: Mapping[str, Realiser],
+    options: Mapping[str, object],
+) -> Dict[str, object]:
+    from interpreters.blender.runtime.python import tracing
+    from interpreters.blender.runtime.python.blender_ergonomics import write_sidecar
+    from interpreters.blender.runtime.python.blender_fingerprint import stamp_fingerprint
+    from interpreters.blender.runtime.python.blender_output import save_output
+    from interpreters.blender.runtime.python.lod_chain import write_lod_chain
+
+    archetype = adapter_input.get("archetype")
+    realiser = registry.get(archetype)
+    if not realiser:
+        raise RuntimeError(f"Unsupported archetype: {archetype}")
+
+    started = time.perf_counter()
+    with tracing.span("realise", archetype=archetype, assetId=adapter_input.get("assetId")):
+        report = realiser(adapter_input, geometry=options["geometry"])
+    with tracing.span("fingerprint"):
+        fingerprint = stamp_fingerprint(str(adapter_input.get("assetId")))
+    realised = time.perf_counter()
+
+    with tracing.span("save", output=output_path, mode=options["outputMode"]):
+        save_output(
+            adapter_input.get("assetId"),
+            output_path,
+            str(options["outputMode"]),
+            bool(options["compress"]),
+        )
+    saved = time.perf_counter()
+
+    lods: Optional[Dict[str, object]] = None
+    if options.get("lods"):
+        with tracing.span("lods", detailTier=adapter_input.get("detailTier")):
+            lods = write_lod_chain(adapter_input, output_path)
+
+    outcome: Dict[str, object] = {
+        "timings": {
+            "realise": round(realised - started, 6),
+            "save": round(saved - realised, 6),
+        },
+        "fingerprint": fingerprint,
+        "ergonomics": report,
+        "sidecar": write_sidecar(report, output_path),
+        "lods": lods,
+        "regen": _regen_report(adapter_input),
+    }
+    _STARTUP.setdefault("firstJob", outcome["timings"])
+    trace_path = tracing.write_trace(tracing.trace_path_for(output_path))
+    if trace_path:
+        outcome["trace"] = trace_path
+    return outcome
+
+
+def _regen_report(adapter_input: Mapping[str, object]) -> Optional[Dict[str, object]]:
+    # What incremental regeneration touched, as stored on the asset collection.
+    from interpreters.blender.runtime.python.blender_plan_applier import REGEN_REPORT_PROP
+
+    collection = bpy.data.collections.get(str(adapter_input.get("assetId")))
+    if collection is None or collection.get(REGEN_REPORT_PROP) is None:
+        return None
+    return json.loads(collection[REGEN_REPORT_PROP])
 
-    from interpreters.blender.runtime.python.blender_bed_realiser import (
-        realise_bed,
+
+def _realise(
+    input_path: str,
+    output_path: str,
+    registry: Mapping[str, Realiser],
+    options: Mapping[str, object],
+) -> Dict[str, object]:
+    return _realise_input(_load_adapter_input(input_path), output_path, registry, options)
+
+
+def _job_adapter_input(job: Mapping[str, object]) -> Mapping[str, object]:
+    adapter_input = job.get("adapterInput")
+    if adapter_input is None:
+        input_path = job.get("input")
+        if not isinstance(input_path, str):
+            raise ValueError("Job needs an 'input' path or an inline 'adapterInput'.")
+        adapter_input = _load_adapter_input(input_path)
+    if not isinstance(adapter_input, Mapping):
+        raise ValueError("Job 'adapterInput' must be an object.")
+    return adapter_input
+
+
+def _run_manifest(
+    manifest_path: str,
+    report_path: Optional[str],
+    defaults: Mapping[str, object],
+) -> bool:
+    from tools.worker_protocol import load_manifest
+
+    jobs, manifest_report_path = load_manifest(manifest_path)
+    report_path = report_path or manifest_report_path
+    registry = _load_realiser_registry()
+
+    results: List[Dict[str, object]] = []
+    for index, job in enumerate(jobs):
+        options = _output_options(job, defaults)
+        started = time.perf_counter()
+        error: Optional[str] = None
+        outcome: Dict[str, object] = {}
+        try:
+            _prepare_scene(str(job["output"]), options, dirty=index > 0)
+            outcome = _realise_input(_job_adapter_input(job), str(job["output"]), registry, options)
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            traceback.print_exc()
+        seconds = time.perf_counter() - started
+
+        results.append(
+            {
+                "id": job["id"],
+                "input": job.get("input"),
+                "output": job["output"],
+                "ok": error is None,
+                "error": error,
+                "seconds": round(seconds, 4),
+                "fingerprint": outcome.get("fingerprint"),
+                "ergonomics": outcome.get("ergonomics"),
+                "sidecar": outcome.get("sidecar"),
+                "lods": outcome.get("lods"),
+                "regen": outcome.get("regen"),
+                "trace": outcome.get("trace"),
+            }
+        )
+        status = "ok" if error is None else f"failed ({error})"
+        print(f"[Manifest] job {index + 1}/{len(jobs)} {job['id']}: {status}")
+
+    ok = all(result["ok"] for result in results)
+    if report_path:
+        with open(report_path, "w", encoding="utf-8") as handle:
+            json.dump({"ok": ok, "jobs": results}, handle, indent=2)
+    return ok
+
+
+def _print_ergonomics(report: Optional[Mapping[str, object]]) -> None:
+    if not report:
+        return
+    for metric in report.get("metrics", []):
+        status = "ok" if metric["ok"] else "mismatch"
+        print(
+            f"[Ergonomics] {report.get('archetype')} {status} ({metric['metric']}): "
+            f"measured={metric['after']:.4f}, declared={metric['declared']:.4f}, Δ={metric['delta']:.4f}"
+        )
+
+
+def _print_fingerprint(name: object, fingerprint: Optional[str]) -> None:
+    if fingerprint:
+        print(f"[Fingerprint] {name} {fingerprint}")
+
+
+def _print_regen(report: Optional[Mapping[str, object]]) -> None:
+    if not report:
+        return
+    parts = ", ".join(
+        f"{key} {' '.join(report[key])}"  # type: ignore[arg-type]
+        for key in ("created", "updated", "removed", "unchanged")
+        if report[key]
     )
-    from interpreters.blender.runtime.python.blender_chair_realiser import (
-        realise_chair,
+    print(
+        f"[Regen] {parts} (objects: +{report['objectsCreated']} "
+        f"~{report['objectsUpdated']} -{report['objectsRemoved']})"
     )
-    from interpreters.blender.runtime.python.blender_table_realiser import (
-        realise_table,
+
+
+def _asset_object_count(adapter_input: Mapping[str, object]) -> int:
+    collection = bpy.data.collections.get(str(adapter_input.get("assetId")))
+    if collection is None:
+        return 0
+    return len(collection.all_objects)
+
+
+def _make_job_handler(
+    registry: Mapping[str, Realiser],
+    defaults: Mapping[str, object],
+) -> Callable[[Mapping[str, object]], Dict[str, object]]:
+    scene_dirty = False
+
+    def _handle(job: Mapping[str, object]) -> Dict[str, object]:
+        nonlocal scene_dirty
+        timings: Dict[str, float] = {}
+
+        output_path = job.get("output")
+        if not isinstance(output_path, str):
+            raise ValueError("Job needs an 'output' path.")
+
+        options = _output_options(job, defaults)
+        started = time.perf_counter()
+        prepared = _prepare_scene(output_path, options, scene_dirty)
+        if prepared is not None:
+            timings[prepared] = round(time.perf_counter() - started, 6)
+        scene_dirty = True
+
+        started = time.perf_counter()
+        adapter_input = _job_adapter_input(job)
+        timings["load"] = round(time.perf_counter() - started, 6)
+
+        outcome = _realise_input(adapter_input, output_path, registry, options)
+        timings.update(outcome["timings"])
+        return {
+            "output": output_path,
+            "objectCount": _asset_object_count(adapter_input),
+            "timings": timings,
+            "fingerprint": outcome["fingerprint"],
+            "ergonomics": outcome["ergonomics"],
+            "sidecar": outcome["sidecar"],
+            "lods": outcome["lods"],
+            "regen": outcome["regen"],
+            "trace": outcome.get("trace"),
+        }
+
+    return _handle
+
+
+def _run_worker(socket_path: Optional[str], defaults: Mapping[str, object]) -> None:
+    from tools.worker_protocol import serve_stream, serve_unix_socket
+
+    handler = _make_job_handler(_load_realiser_registry(), defaults)
+    if socket_path:
+        serve_unix_socket(handler, socket_path)
+        return
+
+    with _protocol_stdout() as protocol_out:
+        serve_stream(handler, sys.stdin, protocol_out)
+
+
+def _protocol_stdout() -> TextIO:
+    # Keep stdout for protocol lines only: Blender and the realisers log to
+    # file descriptor 1, so point it at stderr and write results to a copy.
+    sys.stdout.flush()
+    protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return protocol_out
+
+
+def _run_stream(input_path: str, output_dir: str, defaults: Mapping[str, object]) -> bool:
+    from tools.worker_protocol import encode_line, serve_records
+
+    os.makedirs(output_dir, exist_ok=True)
+    handler = _make_job_handler(_load_realiser_registry(), defaults)
+    with _protocol_stdout() as protocol_out:
+
+        def _emit(message: Mapping[str, object]) -> None:
+            protocol_out.write(encode_line(message))
+            protocol_out.flush()
+
+        if input_path == STDIN_PATH:
+            summary = serve_records(iter(sys.stdin.readline, ""), _emit, handler, output_dir)
+        else:
+            with open(input_path, "r", encoding="utf-8") as handle:
+                summary = serve_records(handle, _emit, handler, output_dir)
+    return summary["failed"] == 0
+
+
+def _run_scene(
+    scene_path: str,
+    output_path: str,
+    report_path: Optional[str],
+    defaults: Mapping[str, object],
+) -> Dict[str, object]:
+    from interpreters.blender.runtime.python import tracing
+    from interpreters.blender.runtime.python.blender_fingerprint import stamp_fingerprint
+    from interpreters.blender.runtime.python.blender_output import save_output
+    from interpreters.blender.runtime.python.blender_scene_realiser import realise_scene
+    from interpreters.blender.runtime.python.scene_plan import load_scene
+
+    with tracing.span("load_input", input=scene_path):
+        scene = load_scene(scene_path)
+    with tracing.span("realise_scene", sceneId=scene.sceneId, placements=len(scene.placements)):
+        report = realise_scene(scene, _load_realiser_registry(), str(defaults["geometry"]))
+    with tracing.span("fingerprint"):
+        report["fingerprint"] = stamp_fingerprint(scene.sceneId)
+    with tracing.span("save", output=output_path, mode=defaults["outputMode"]):
+        save_output(scene.sceneId, output_path, str(defaults["outputMode"]), bool(defaults["compress"]))
+
+    trace_path = tracing.write_trace(tracing.trace_path_for(output_path))
+    if trace_path:
+        report["trace"] = trace_path
+    if report_path:
+        with open(report_path, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    print(
+        f"[Scene] {scene.sceneId}: {report['instanceCount']} instances of "
+        f"{report['sourceCount']} sources ({report['sourceObjects']} source objects)"
+    )
+    _print_fingerprint(scene.sceneId, report["fingerprint"])  # type: ignore[arg-type]
+    for source in report["sources"]:  # type: ignore[union-attr]
+        _print_ergonomics(source.get("ergonomics"))
+    return report
+
+
+def _run_scene_chunks(
+    scene_path: str,
+    output_dir: str,
+    mode: str,
+    cell_size: Optional[float],
+    defaults: Mapping[str, object],
+) -> Dict[str, object]:
+    from interpreters.blender.runtime.python import tracing
+    from interpreters.blender.runtime.python.blender_scene_chunks import write_chunked_scene
+    from interpreters.blender.runtime.python.scene_plan import DEFAULT_CELL_SIZE, load_scene
+    from tools.realisation_cache import realiser_fingerprint
+
+    with tracing.span("load_input", input=scene_path):
+        scene = load_scene(scene_path)
+    # Realiser code changes invalidate every chunk that uses the archetype.
+    archetypes = sorted({str(source.get("archetype")) for source in scene.sources.values()})
+    salt = ":".join(realiser_fingerprint(archetype) for archetype in archetypes)
+
+    report = write_chunked_scene(
+        scene,
+        output_dir,
+        _load_realiser_registry(),
+        _reset_scene,
+        mode=mode,
+        cell_size=cell_size if cell_size is not None else DEFAULT_CELL_SIZE,
+        geometry=str(defaults["geometry"]),
+        compress=bool(defaults["compress"]),
+        salt=salt,
+    )
+    tracing.write_trace(tracing.trace_path_for(os.path.join(output_dir, str(report["master"]))))
+    print(
+        f"[Scene] {scene.sceneId}: {report['written']}/{len(report['chunks'])} chunks written"  # type: ignore[arg-type]
+        f"{', master updated' if report['masterWritten'] else ''}"
     )
+    return report
 
-    REALISER_REGISTRY = {
-        "chair": realise_chair,
-        "table": realise_table,
-        "bed": realise_bed,
+
+def main() -> None:
+    global _TEMPLATE_PATH
+
+    script_started = time.perf_counter()
+    launched_at = os.environ.get(LAUNCHED_AT_ENV)
+    if launched_at:
+        _STARTUP["launchToScript"] = round(time.time() - float(launched_at), 6)
+    args = _script_args(sys.argv)
+
+    _ensure_repo_on_path()
+    from interpreters.blender.runtime.python import tracing
+
+    if _flag_requested(sys.argv, TRACE_FLAG) or tracing.enabled_from_env():
+        tracing.enable()
+        tracing.record_launch()
+
+    _TEMPLATE_PATH = _loaded_template()
+    _STARTUP["template"] = _TEMPLATE_PATH
+    started = time.perf_counter()
+    if _TEMPLATE_PATH is None:
+        # The template has no default objects; factory startup has the cube.
+        with tracing.span("clear_default_meshes", category="startup"):
+            _STARTUP["freed"] = _remove_default_meshes()["freed"]
+    _STARTUP["cleanup"] = round(time.perf_counter() - started, 6)
+    _STARTUP["scriptSetup"] = round(time.perf_counter() - script_started, 6)
+
+    try:
+        _run(args)
+    finally:
+        _write_startup_report()
+
+
+def _run(args: list[str]) -> None:
+    defaults: Dict[str, object] = {
+        "outputMode": "library" if _flag_requested(sys.argv, LIBRARY_FLAG) else "mainfile",
+        "compress": _flag_requested(sys.argv, COMPRESS_FLAG),
+        "geometry": "merged" if _flag_requested(sys.argv, MERGED_FLAG) else "objects",
+        "lods": _flag_requested(sys.argv, LODS_FLAG),
+        "update": _flag_requested(sys.argv, UPDATE_FLAG),
     }
 
-    archetype = adapter_input.get("archetype")
-    realiser = REALISER_REGISTRY.get(archetype)
-    if not realiser:
-        raise RuntimeError(f"Unsupported archetype: {archetype}")
+    if args and args[0] == WORKER_FLAG:
+        _run_worker(_parse_worker_args(args), defaults)
+        return
+
+    if args and args[0] == STREAM_FLAG:
+        input_path, output_dir = _parse_stream_args(args)
+        if not _run_stream(input_path, output_dir, defaults):
+            sys.exit(1)
+        return
+
+    if args and args[0] == SCENE_CHUNKS_FLAG:
+        scene_path, output_dir, mode, cell_size = _parse_scene_chunks_args(args)
+        _run_scene_chunks(scene_path, output_dir, mode, cell_size, defaults)
+        return
+
+    if args and args[0] == SCENE_FLAG:
+        scene_path, output_path, report_path = _parse_scene_args(args)
+        _run_scene(scene_path, output_path, report_path, defaults)
+        return
 
-    realiser(adapter_input)
+    if args and args[0] == MANIFEST_FLAG:
+        manifest_path, report_path = _parse_manifest_args(args)
+        if not _run_manifest(manifest_path, report_path, defaults):
+            sys.exit(1)
+        return
 
-    bpy.ops.wm.save_mainfile(filepath=output_path)
+    input_path, output_path = _parse_args(args)
+    _open_output(output_path, defaults)
+    outcome = _realise(input_path, output_path, _load_realiser_registry(), defaults)
+    _print_fingerprint(os.path.basename(output_path), outcome.get("fingerprint"))  # type: ignore[arg-type]
+    _print_regen(outcome.get("regen"))
+    _print_ergonomics(outcome.get("ergonomics"))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,267 @@
+"""
+JSON-lines job protocol shared by the Blender worker and its stand-ins.
+
+Each request is one JSON object per line:
+
+    {"id": "chair-1", "input": "chair_input.json", "output": "chair.blend"}
+    {"id": "chair-2", "adapterInput": {...}, "output": "chair.blend"}
+    {"id": "p", "op": "ping"}
+    {"op": "shutdown"}
+
+Each request produces exactly one result line:
+
+    {"id": "chair-1", "ok": true, "error": null, "objectCount": 9,
+     "timings": {"load": 0.0001, "realise": 0.004, "save": 0.01, "total": 0.02}}
+
+`serve_records` runs the streaming input mode instead: each line is a bare
+adapter input (or a job as above) and produces one result line carrying its
+input line number.
+
+This module does not import `bpy`; the handler passed to `serve` does the work.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import socket
+import time
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, TextIO
+
+JobHandler = Callable[[Mapping[str, object]], Mapping[str, object]]
+Emit = Callable[[Mapping[str, object]], None]
+
+OP_REALISE = "realise"
+OP_PING = "ping"
+OP_SHUTDOWN = "shutdown"
+
+DEFAULT_STREAM_EXTENSION = ".blend"
+_UNSAFE_FILENAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def encode_line(message: Mapping[str, object]) -> str:
+    return json.dumps(message, sort_keys=True, separators=(",", ":")) + "\n"
+
+
+def decode_line(line: str) -> Optional[Dict[str, object]]:
+    """Return the message on `line`, or None for blank and non-protocol lines."""
+    line = line.strip()
+    if not line.startswith("{"):
+        return None
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        return None
+    return message
+
+
+def load_manifest(manifest_path: str) -> tuple[List[Dict[str, object]], Optional[str]]:
+    """
+    Load a job manifest: either a list of jobs or {"jobs": [...], "report": path}.
+    Each job needs an "output" path and either an "input" path or an inline
+    "adapterInput". Relative paths resolve against the manifest's directory.
+    """
+    with open(manifest_path, "r", encoding="utf-8") as handle:
+        manifest = json.load(handle)
+
+    if isinstance(manifest, list):
+        entries = manifest
+        report_path = None
+    elif isinstance(manifest, Mapping):
+        entries = manifest.get("jobs")
+        report_path = manifest.get("report")
+    else:
+        raise ValueError("Manifest must be a list of jobs or an object with 'jobs'.")
+    if not isinstance(entries, list):
+        raise ValueError("Manifest 'jobs' must be a list.")
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+
+    def _resolve(path: str) -> str:
+        return os.path.normpath(os.path.join(base_dir, path))
+
+    jobs: List[Dict[str, object]] = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, Mapping):
+            raise ValueError(f"Manifest job {index} must be an object.")
+        input_path = entry.get("input")
+        output_path = entry.get("output")
+        if not isinstance(output_path, str):
+            raise ValueError(f"Manifest job {index} needs an 'output' path.")
+        if not isinstance(input_path, str) and not isinstance(entry.get("adapterInput"), Mapping):
+            raise ValueError(f"Manifest job {index} needs an 'input' path or an 'adapterInput'.")
+        job = dict(entry)
+        job["id"] = str(entry.get("id", index))
+        job["output"] = _resolve(output_path)
+        if isinstance(input_path, str):
+            job["input"] = _resolve(input_path)
+        jobs.append(job)
+
+    if isinstance(report_path, str):
+        report_path = _resolve(report_path)
+    return jobs, report_path
+
+
+def _handle_line(line: str, handle: JobHandler) -> tuple[Optional[Dict[str, object]], bool]:
+    try:
+        job = decode_line(line)
+    except ValueError as exc:
+        return {"id": None, "ok": False, "error": f"Invalid job line: {exc}"}, False
+    if job is None:
+        return None, False
+
+    job_id = job.get("id")
+    op = job.get("op", OP_REALISE)
+    if op == OP_SHUTDOWN:
+        return {"id": job_id, "op": OP_SHUTDOWN, "ok": True, "error": None}, True
+    if op == OP_PING:
+        return {"id": job_id, "op": OP_PING, "ok": True, "error": None, "pid": os.getpid()}, False
+    if op != OP_REALISE:
+        return {"id": job_id, "ok": False, "error": f"Unsupported op: {op}"}, False
+
+    return _run_job(job, handle), False
+
+
+def _run_job(job: Mapping[str, object], handle: JobHandler) -> Dict[str, object]:
+    started = time.perf_counter()
+    try:
+        outcome = dict(handle(job))
+    except Exception as exc:
+        outcome = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+    else:
+        outcome.setdefault("ok", True)
+        outcome.setdefault("error", None)
+    timings = dict(outcome.get("timings") or {})
+    timings["total"] = round(time.perf_counter() - started, 6)
+    outcome["timings"] = timings
+    outcome["id"] = job.get("id")
+    return outcome
+
+
+def serve(lines: Iterable[str], emit: Emit, handle: JobHandler) -> bool:
+    """
+    Run jobs from `lines` until exhausted or a shutdown request arrives.
+    Returns True if the stream ended with a shutdown request.
+    """
+    for line in lines:
+        result, stop = _handle_line(line, handle)
+        if result is not None:
+            emit(result)
+        if stop:
+            return True
+    return False
+
+
+def record_job(
+    record: Mapping[str, object],
+    line_number: int,
+    output_dir: str,
+    extension: str = DEFAULT_STREAM_EXTENSION,
+) -> Dict[str, object]:
+    """
+    Turn one streamed record into a job. Records with "input" or "adapterInput"
+    are jobs already; anything else is an adapter input. Jobs without an
+    "output" write `<output_dir>/<assetId>-<line_number><extension>`, so
+    default outputs never collide.
+    """
+    if "input" in record or "adapterInput" in record:
+        job = dict(record)
+        adapter_input = record.get("adapterInput")
+    else:
+        adapter_input = record
+        job = {"adapterInput": record}
+    asset_id = adapter_input.get("assetId") if isinstance(adapter_input, Mapping) else None
+    job.setdefault("id", str(asset_id if asset_id is not None else line_number))
+    if not isinstance(job.get("output"), str):
+        stem = _UNSAFE_FILENAME.sub("_", str(job["id"]))
+        job["output"] = os.path.join(output_dir, f"{stem}-{line_number}{extension}")
+    return job
+
+
+def serve_records(
+    lines: Iterable[str],
+    emit: Emit,
+    handle: JobHandler,
+    output_dir: str,
+    extension: str = DEFAULT_STREAM_EXTENSION,
+) -> Dict[str, object]:
+    """
+    Realise one record per line as it is read and emit its result straight
+    away, then emit and return a summary. Default outputs carry the line
+    number, so only explicit outputs are remembered: a record whose output was
+    already given explicitly by an earlier line fails instead of overwriting it.
+    """
+    started = time.perf_counter()
+    total = 0
+    failed = 0
+    explicit: Dict[str, int] = {}
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        total += 1
+        try:
+            record = json.loads(line)
+            if not isinstance(record, Mapping):
+                raise ValueError("record must be a JSON object")
+        except ValueError as exc:
+            result: Dict[str, object] = {"id": None, "ok": False, "error": f"Invalid record: {exc}"}
+        else:
+            given = ("input" in record or "adapterInput" in record) and isinstance(record.get("output"), str)
+            job = record_job(record, line_number, output_dir, extension)
+            output = str(job["output"])
+            if output in explicit:
+                result = {
+                    "id": job.get("id"),
+                    "ok": False,
+                    "error": f"Output {output} is already used by line {explicit[output]}",
+                }
+            else:
+                if given:
+                    explicit[output] = line_number
+                result = _run_job(job, handle)
+            result.setdefault("output", output)
+        result["line"] = line_number
+        if not result["ok"]:
+            failed += 1
+        emit(result)
+
+    summary: Dict[str, object] = {
+        "event": "done",
+        "total": total,
+        "succeeded": total - failed,
+        "failed": failed,
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+    emit(summary)
+    return summary
+
+
+def serve_stream(handle: JobHandler, reader: TextIO, writer: TextIO) -> bool:
+    def _emit(message: Mapping[str, object]) -> None:
+        writer.write(encode_line(message))
+        writer.flush()
+
+    _emit({"event": "ready", "pid": os.getpid()})
+    return serve(iter(reader.readline, ""), _emit, handle)
+
+
+def serve_unix_socket(handle: JobHandler, path: str) -> None:
+    """Serve one connection at a time until a client sends a shutdown request."""
+    if os.path.exists(path):
+        os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(path)
+        server.listen(1)
+        while True:
+            connection, _ = server.accept()
+            with connection, connection.makefile("r", encoding="utf-8") as reader, connection.makefile(
+                "w", encoding="utf-8"
+            ) as writer:
+                if serve_stream(handle, reader, writer):
+                    return
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.unlink(path)